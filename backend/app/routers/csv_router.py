@@ -1,8 +1,10 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from services.csv_analyzer import CSVAnalyzer
+from services.inference_executor import inference_executor, InferenceQueueFullError
+from services.word_cloud import WordCloudMode
 from ..models.comment import Comment
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import tempfile
 import os
 import logging
@@ -16,6 +18,7 @@ csv_analyzer = CSVAnalyzer()
 @router.post("/upload", response_model=Dict[str, Any])
 async def upload_csv(
     file: UploadFile = File(...),
+    word_cloud_mode: Optional[WordCloudMode] = Query(None, description="exact | approximate (büyük dosyalar için)"),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     logger.info(f"Dosya yükleme isteği alındı: {file.filename}")
@@ -35,7 +38,7 @@ async def upload_csv(
         
         # CSV analizi yap
         logger.info("CSV analizi başlatılıyor...")
-        result = csv_analyzer.analyze_csv(temp_file_path)
+        result = await inference_executor.run(csv_analyzer.analyze_csv, temp_file_path, word_cloud_mode)
         logger.info("CSV analizi tamamlandı")
         
         # Geçici dosyayı sil
@@ -44,6 +47,9 @@ async def upload_csv(
         
         return {"data": result}
     
+    except InferenceQueueFullError as e:
+        logger.error(f"CSV analizi reddedildi: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         error_msg = f"CSV analiz hatası: {str(e)}"
         logger.error(error_msg)
@@ -0,0 +1,84 @@
+"""
+Tam (exact) ve yaklaşık (approximate: Space-Saving + Count-Min) kelime
+bulutu modlarını süre, en yüksek bellek kullanımı ve sonuç uyumu açısından
+karşılaştırır. Gerçek yorumlardaki uzun kuyruklu kelime dağarcığını
+taklit etmek için sentetik yorumlara Zipf dağılımlı nadir kelimeler eklenir.
+
+Uyum: tam moddaki ilk N terimin yaklaşık moddaki ilk N içinde bulunma oranı
+ve ortak terimlerde değerlerin ortanca göreli farkı.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_approx_word_cloud --sizes 1000,10000,100000
+"""
+import argparse
+import random
+import statistics
+import string
+import time
+import tracemalloc
+
+from benchmarks.synthetic_comments import generate_comments
+from services.sentiment_service import sentiment_service
+
+SENTIMENTS = ['positive', 'negative', 'neutral']
+
+
+def _pseudo_word(rank):
+    """Sıra numarasından harflerden oluşan, tekrarlanabilir bir kelime üretir"""
+    letters = []
+    rank += 26 * 26
+    while rank:
+        rank, digit = divmod(rank, 26)
+        letters.append(string.ascii_lowercase[digit])
+    return 'x' + ''.join(letters)
+
+
+def _analyzed_comments(size, tail_words, vocabulary):
+    rng = random.Random(size)
+    comments = []
+    for comment in generate_comments(size, seed=size):
+        tail = ' '.join(_pseudo_word(min(int(rng.paretovariate(0.8)), vocabulary)) for _ in range(tail_words))
+        comments.append({'text': f"{comment['text']} {tail}", 'sentiment': {'category': rng.choice(SENTIMENTS)}})
+    return comments
+
+
+def _measure(comments, mode, max_words):
+    """Kelime bulutunu verilen modda hesaplar: (sonuç, süre, en yüksek bellek)"""
+    sentiment_service.text_normalizer.tokens.cache_clear()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = sentiment_service.get_word_cloud(comments, max_words=max_words, mode=mode)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--max-words", type=int, default=100)
+    parser.add_argument("--tail-words", type=int, default=3, help="Yorum başına eklenen nadir kelime sayısı")
+    parser.add_argument("--vocabulary", type=int, default=500000, help="Nadir kelime dağarcığı büyüklüğü")
+    args = parser.parse_args()
+
+    for size in (int(value) for value in args.sizes.split(",")):
+        comments = _analyzed_comments(size, args.tail_words, args.vocabulary)
+        exact, exact_time, exact_peak = _measure(comments, "exact", args.max_words)
+        approx, approx_time, approx_peak = _measure(comments, "approximate", args.max_words)
+
+        exact_values = {item['text']: item['value'] for item in exact}
+        approx_values = {item['text']: item['value'] for item in approx}
+        shared = exact_values.keys() & approx_values.keys()
+        overlap = len(shared) / len(exact_values) if exact_values else 1.0
+        error = statistics.median(
+            abs(approx_values[term] - exact_values[term]) / exact_values[term] for term in shared
+        ) if shared else 0.0
+
+        print(f"{size:7d} comments  exact={exact_time * 1000:8.1f} ms {exact_peak / 1e6:7.1f} MB  "
+              f"approximate={approx_time * 1000:8.1f} ms {approx_peak / 1e6:7.1f} MB  "
+              f"top-{args.max_words} overlap={overlap:.2f}  median value error={error:.3f}")
+
+
+if __name__ == "__main__":
+    main()
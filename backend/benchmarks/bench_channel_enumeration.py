@@ -0,0 +1,82 @@
+"""
+Kanal videolarının search.list ile (her çağrıda get_channel_info + sayfa
+başına 100 kota birimi) ve uploads oynatma listesi ile (playlistItems.list,
+1 birim; kanal / liste ID'si önbellekte) listelenmesini yerel stub sunucuya
+(benchmarks.youtube_stub) karşı karşılaştırır. Kanal geneli uç noktaların
+tipik bir sırası çalıştırılır: get_channel_statistics ve get_recent_comments.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_channel_enumeration --videos 50 --latency-ms 30
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.youtube_stub import StubYouTubeServer, synthetic_recordings
+from services.comment_store import CommentStore
+from services.youtube_client import YouTubeApiClient
+from services.youtube_service import YouTubeService
+
+
+class SearchYouTubeService(YouTubeService):
+    """Videoları search.list ile listeleyen (eski) davranış"""
+
+    async def get_channel_videos(self, max_results=50):
+        videos = []
+        next_page_token = None
+        channel_info = await self.get_channel_info()
+        while len(videos) < max_results:
+            response = await self.api.get('search', part='snippet', channelId=channel_info['id'],
+                                           maxResults=min(50, max_results - len(videos)), order='date',
+                                           type='video', pageToken=next_page_token)
+            details = await self._list_videos([item['id']['videoId'] for item in response['items']], 'statistics')
+            for item in response['items']:
+                video_id = item['id']['videoId']
+                statistics = details.get(video_id, {}).get('statistics', {})
+                videos.append({
+                    'id': video_id,
+                    'title': item['snippet']['title'],
+                    'description': item['snippet']['description'],
+                    'thumbnail': item['snippet']['thumbnails']['default']['url'],
+                    'published_at': item['snippet']['publishedAt'],
+                    'view_count': statistics.get('viewCount', 0),
+                    'like_count': statistics.get('likeCount', 0),
+                    'comment_count': statistics.get('commentCount', 0)
+                })
+            next_page_token = response.get('nextPageToken')
+            if not next_page_token:
+                break
+        return videos
+
+
+async def _session(service):
+    statistics = await service.get_channel_statistics()
+    comments = await service.get_recent_comments()
+    videos = await service.get_channel_videos()
+    return statistics, len(comments), [video['id'] for video in videos]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=50)
+    parser.add_argument("--comments-per-video", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    args = parser.parse_args()
+
+    recordings = synthetic_recordings(args.videos, args.comments_per_video)
+    with StubYouTubeServer(recordings, latency=args.latency_ms / 1000) as server:
+        results = {}
+        for label, service_class in (("search", SearchYouTubeService), ("uploads", YouTubeService)):
+            api = YouTubeApiClient(base_url=server.base_url)
+            service = service_class(None, api=api, comment_store=CommentStore())
+            server.reset_requests()
+            start = time.perf_counter()
+            results[label] = asyncio.run(_session(service))
+            elapsed = time.perf_counter() - start
+            print(f"{label:8s} wall={elapsed * 1000:7.1f} ms  quota units={api.quota_units:5d}  "
+                  f"requests={dict(sorted(api.request_counts.items()))}")
+        print(f"identical statistics, comment counts and video order: {results['search'] == results['uploads']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Kanal geneli yorum çekmenin duvar saati süresini eşzamanlılık sınırına göre
+ölçer. Gecikme eklenmiş yerel stub sunucuya (benchmarks.youtube_stub) karşı
+50 videolu bir kanal için get_recent_comments çalıştırılır;
+concurrency=1 eski sıralı davranıştır. Akış (stream) modunda ilk videonun
+yorumlarının analize hazır olduğu süre de raporlanır. Her eşzamanlılık
+düzeyi sınırsız ve saniye başına istek sınırlı (--rate-limits) çalıştırılır.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_channel_fetch --videos 50 --latency-ms 100 --concurrency 1,4,8,16 --rate-limits 0,20
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.youtube_stub import StubYouTubeServer, synthetic_recordings
+from services.fetch_scheduler import FetchScheduler
+from services.comment_store import CommentStore
+from services.youtube_client import YouTubeApiClient
+from services.youtube_service import YouTubeService
+
+
+async def _run(service, max_comments):
+    """get_recent_comments sonucu ve süresi; akış modunda ilk ve tüm videoların hazır olduğu süreler"""
+    start = time.perf_counter()
+    comments = await service.get_recent_comments()
+    elapsed = time.perf_counter() - start
+
+    videos = await service.get_channel_videos()
+    start = time.perf_counter()
+    first = None
+    fetch = lambda video: service.get_video_comments(video['id'], max_comments)
+    async with service.fetch_scheduler.stream(fetch, videos) as fetched:
+        async for _ in fetched:
+            if first is None:
+                first = time.perf_counter() - start
+    return comments, elapsed, first, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=50)
+    parser.add_argument("--comments-per-video", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--concurrency", default="1,4,8,16")
+    parser.add_argument("--rate-limits", default="0,20", help="Saniye başına en fazla istek (0 = sınırsız)")
+    args = parser.parse_args()
+
+    recordings = synthetic_recordings(args.videos, args.comments_per_video)
+    with StubYouTubeServer(recordings, latency=args.latency_ms / 1000) as server:
+        baseline = None
+        for rate_limit in (float(value) for value in args.rate_limits.split(",")):
+            for concurrency in (int(value) for value in args.concurrency.split(",")):
+                api = YouTubeApiClient(base_url=server.base_url, rate_limit=rate_limit)
+                service = YouTubeService(None, api=api, comment_store=CommentStore())
+                service.fetch_scheduler = FetchScheduler(concurrency)
+
+                comments, elapsed, first, total = asyncio.run(_run(service, args.comments_per_video))
+                baseline = baseline or comments
+                print(f"rate limit={rate_limit:4.0f}/s concurrency={concurrency:3d}  get_recent_comments: "
+                      f"{len(comments):6d} comments wall={elapsed * 1000:8.1f} ms  same result={comments == baseline}"
+                      f"  |  stream: first video {first * 1000:7.1f} ms, all {total * 1000:8.1f} ms  "
+                      f"requests={sum(api.request_counts.values())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Kanal video listesi ve toplu video bilgisi için YouTube API istek sayısını
+yerel stub sunucuya (benchmarks.youtube_stub) karşı ölçer: her liste
+sonucu için ayrı videos.list isteği (eski N+1 davranışı) ile sayfa başına
+tek toplu videos.list isteği (en fazla 50 ID) karşılaştırılır. İki yöntemin
+sonuçlarının aynı olduğu da kontrol edilir.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_channel_videos --videos 120 --latency-ms 20
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.youtube_stub import StubYouTubeServer, synthetic_recordings
+from services.youtube_client import YouTubeApiClient
+from services.youtube_service import YouTubeService
+
+
+class PerVideoYouTubeService(YouTubeService):
+    """Her video için ayrı videos.list isteği gönderen (eski) davranış"""
+
+    async def _list_videos(self, video_ids, part):
+        videos = {}
+        for video_id in video_ids:
+            response = await self.api.get('videos', part=part, id=video_id)
+            for item in response.get('items', []):
+                videos[item['id']] = item
+        return videos
+
+
+def _measure(server, service, call):
+    """call(service) sonucunu, süresini ve kaynak bazında istek sayılarını döndürür"""
+    server.reset_requests()
+    start = time.perf_counter()
+    result = asyncio.run(call(service))
+    elapsed = time.perf_counter() - start
+    counts = {resource: server.request_count(resource) for resource in ("channels", "playlistItems", "videos")}
+    return result, elapsed, counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=120)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    recordings = synthetic_recordings(args.videos, comments_per_video=0)
+    video_ids = [item["params"]["id"] for item in recordings["videos"]]
+    pages = len(recordings["playlistItems"])
+    with StubYouTubeServer(recordings, latency=args.latency_ms / 1000) as server:
+        calls = {
+            "get_channel_videos": lambda service: service.get_channel_videos(args.videos),
+            "get_videos_info": lambda service: service.get_videos_info(video_ids),
+        }
+        for name, call in calls.items():
+            results = {}
+            for label, service_class in (("per-video", PerVideoYouTubeService), ("batched", YouTubeService)):
+                service = service_class(None, api=YouTubeApiClient(base_url=server.base_url))
+                results[label], elapsed, counts = _measure(server, service, call)
+                per_page = f"  videos.list per playlist page={counts['videos'] / pages:5.1f}" \
+                    if name == "get_channel_videos" else ""
+                print(f"{name:18s} {label:9s} {len(results[label]):4d} videos  wall={elapsed * 1000:7.1f} ms  "
+                      f"requests={counts}{per_page}")
+            print(f"{name:18s} identical results: {results['per-video'] == results['batched']}")
+
+
+if __name__ == "__main__":
+    main()
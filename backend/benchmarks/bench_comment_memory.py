@@ -0,0 +1,108 @@
+"""
+Analiz edilmiş yorumların bellek kullanımını ölçer: yorum başına iç içe
+sözlükler (API biçimi) ile kompakt CommentRecords karşılaştırılır. Duygu
+sonuçları modeller çalıştırılmadan, gerçek sonuç biçiminde sentetik olarak
+üretilir; yorum metinleri her iki gösterimde de paylaşıldığından ölçüme
+dahil edilmez.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_comment_memory --comments 10000
+"""
+import argparse
+import gc
+import json
+import random
+import re
+import time
+import tracemalloc
+
+from benchmarks.synthetic_comments import generate_comments
+from services.comment_records import CommentRecords
+from services.sentiment_service import sentiment_service
+
+LABELS = ['positive', 'negative', 'neutral']
+
+
+def _sentiments(comments, seed):
+    """Her yorum için _build_sentiment_result biçiminde sentetik duygu sonucu üretir"""
+    rng = random.Random(seed)
+    themes = sentiment_service.theme_categories
+    for comment in comments:
+        text = comment['text']
+        # Cümleler, sent_tokenize gibi metnin dilimleri olarak (yeni string nesneleri)
+        sentences = [text[match.start():match.end()] for match in re.finditer(r'\S(?:.*?[.!?](?=\s|$)|.+$)', text)]
+        sentence_analyses = [
+            {"text": sentence, "sentiment": rng.choice(LABELS), "score": rng.random()}
+            for sentence in (sentences or [text])
+        ]
+        theme = {name: round(rng.random() * 0.4, 4) for name in rng.sample(themes, rng.randint(1, 5))}
+        yield sentiment_service._build_sentiment_result(rng.choice(['tr', 'en']), sentence_analyses, theme)
+
+
+def _dict_form(comments, seed):
+    """Önceki gösterim: yorum başına sözlük (tema hem duygu sonucunda hem yorumda)"""
+    return [
+        {
+            'id': comment.get('id'),
+            'text': comment.get('text'),
+            'author': comment.get('author'),
+            'date': comment.get('published_at'),
+            'video_id': comment.get('video_id'),
+            'video_title': comment.get('video_title'),
+            'sentiment': sentiment,
+            'theme': sentiment['theme']
+        }
+        for comment, sentiment in zip(comments, _sentiments(comments, seed))
+    ]
+
+
+def _record_form(comments, seed):
+    records = CommentRecords()
+    for comment, sentiment in zip(comments, _sentiments(comments, seed)):
+        records.append(comment, sentiment, sentiment['theme'])
+    return records
+
+
+def _retained_bytes(build):
+    """Oluşturulan yapının ayakta kalan bellek miktarını (bayt) ve yapıyı döndürür"""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return retained, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--comments", type=int, default=10000)
+    args = parser.parse_args()
+
+    comments = generate_comments(args.comments)
+    for index, comment in enumerate(comments):
+        comment.setdefault('id', f"c{index}")
+        comment.setdefault('author', f"author{index % 500}")
+        comment.setdefault('published_at', "2024-01-01T00:00:00Z")
+        comment.setdefault('video_id', f"video{index % 5}")
+        comment.setdefault('video_title', f"Video {index % 5}")
+
+    dict_bytes, dicts = _retained_bytes(lambda: _dict_form(comments, args.comments))
+    record_bytes, records = _retained_bytes(lambda: _record_form(comments, args.comments))
+
+    start = time.perf_counter()
+    converted = records.to_dicts()
+    to_dicts = time.perf_counter() - start
+    assert converted == dicts
+
+    scale = 10000 / args.comments
+    print(f"{args.comments} comments  json={len(json.dumps(converted, ensure_ascii=False)) / 1e6:.1f} MB")
+    print(f"  dicts:   {dict_bytes * scale / 1e6:7.2f} MB per 10k comments")
+    print(f"  records: {record_bytes * scale / 1e6:7.2f} MB per 10k comments  "
+          f"({dict_bytes / record_bytes:.1f}x smaller)")
+    print(f"  to_dicts at the API boundary: {to_dicts * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Video yorumlarının her istekte tamamen yeniden çekilmesi ile yorum deposu
+(services.comment_store) üzerinden artımlı senkronizasyonu yerel stub
+sunucuya (benchmarks.youtube_stub) karşı karşılaştırır. İlk turda tüm
+yorumlar çekilir; ardından her videoya yeni yorumlar eklenip en yeni
+yorumların bir kısmı düzenlenir ve ikinci tur artımlı çalıştırılır. Üçüncü
+tur, yeniden başlatılmış (aynı veritabanı dosyasını açan) depo ile değişiklik
+yokken çalıştırılır; son turda API geçici hata (503) döndürür. Artımlı
+sonuçların (hata turunda depodaki yorumların) tam çekimle aynı olduğu
+kontrol edilir.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_comment_sync --videos 20 --comments-per-video 500 --new-comments 10 --latency-ms 30
+"""
+import argparse
+import asyncio
+import copy
+import os
+import tempfile
+import time
+
+from benchmarks.youtube_stub import StubYouTubeServer, synthetic_recordings
+from services.comment_store import CommentStore
+from services.youtube_client import YouTubeApiClient
+from services.youtube_service import YouTubeService
+
+
+def _add_comments(recordings, new_comments, edited_comments, page_size=100):
+    """Her videonun yorumlarının başına yeni yorumlar ekler, en yeni `edited_comments` yorumu düzenler"""
+    recordings = copy.deepcopy(recordings)
+    threads = {}
+    for recording in recordings["commentThreads"]:
+        threads.setdefault(recording["params"]["videoId"], []).extend(recording["response"]["items"])
+
+    recordings["commentThreads"] = []
+    for video_id, items in threads.items():
+        for item in items[:edited_comments]:
+            snippet = item["snippet"]["topLevelComment"]["snippet"]
+            snippet["textDisplay"] += " (düzenlendi)"
+            snippet["updatedAt"] = "2024-02-01T12:00:00Z"
+        added = [
+            {"id": f"{video_id}-n{index}", "snippet": {"topLevelComment": {"snippet": {
+                "authorDisplayName": f"new-user-{index}",
+                "textDisplay": f"Yeni yorum {index}",
+                "likeCount": 0,
+                "publishedAt": "2024-02-01T12:00:00Z",
+                "updatedAt": "2024-02-01T12:00:00Z"
+            }}}}
+            for index in range(new_comments)
+        ]
+        items = added + items
+        for start in range(0, max(len(items), 1), page_size):
+            response = {"items": items[start:start + page_size]}
+            if start + page_size < len(items):
+                response["nextPageToken"] = f"{video_id}-q{start + page_size}"
+            params = {"videoId": video_id}
+            if start:
+                params["pageToken"] = f"{video_id}-q{start}"
+            recordings["commentThreads"].append({"params": params, "response": response})
+    return recordings
+
+
+async def _fetch_all(service, video_ids, max_comments):
+    return await service.fetch_scheduler.map(lambda video_id: service.get_video_comments(video_id, max_comments),
+                                             video_ids)
+
+
+def _run(server, store, video_ids, max_comments):
+    """Tüm videoların yorumlarını çeker; sonuç, süre ve commentThreads istek sayısını döndürür"""
+    api = YouTubeApiClient(base_url=server.base_url, rate_limit=0)
+    service = YouTubeService(None, api=api, comment_store=store)
+    start = time.perf_counter()
+    results = asyncio.run(_fetch_all(service, video_ids, max_comments))
+    return results, time.perf_counter() - start, api.request_counts.get("commentThreads", 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=20)
+    parser.add_argument("--comments-per-video", type=int, default=500)
+    parser.add_argument("--new-comments", type=int, default=10)
+    parser.add_argument("--edited-comments", type=int, default=2)
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    args = parser.parse_args()
+
+    recordings = synthetic_recordings(args.videos, args.comments_per_video)
+    updated = _add_comments(recordings, args.new_comments, args.edited_comments)
+    video_ids = [item["params"]["id"] for item in recordings["videos"]]
+    max_comments = args.comments_per_video + args.new_comments
+
+    with tempfile.TemporaryDirectory() as directory, \
+            StubYouTubeServer(recordings, latency=args.latency_ms / 1000) as server:
+        db_path = os.path.join(directory, "comments.db")
+        store = CommentStore(db_path)
+
+        def report(label, store, expected=None):
+            results, elapsed, requests = _run(server, store, video_ids, max_comments)
+            comments = sum(len(result) for result in results)
+            same = "" if expected is None else f"  same as full refetch={results == expected}"
+            print(f"{label:34s} {comments:6d} comments  commentThreads requests={requests:4d}  "
+                  f"wall={elapsed * 1000:7.1f} ms{same}")
+            return results
+
+        report("initial sync (full)", store)
+
+        server.recordings = updated
+        expected = report("after changes: full refetch", CommentStore())
+        report("after changes: incremental", store, expected)
+        report("restarted store, no changes", CommentStore(db_path), expected)
+
+        server.recordings = {**updated, "commentThreads": [{"params": {}, "status": 503, "response": {
+            "error": {"code": 503, "message": "Backend Error", "errors": [{"reason": "backendError"}]}}}]}
+        report("API error (503), served from store", store, expected)
+        print(f"store stats: {store.stats()}")
+
+
+if __name__ == "__main__":
+    main()
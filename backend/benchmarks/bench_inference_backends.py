@@ -0,0 +1,105 @@
+"""
+PyTorch ve ONNX Runtime arka uçlarını karşılaştırır: etiket uyumu, skor farkı,
+gecikme ve bellek (RSS).
+
+Her arka uç ayrı bir süreçte yüklenir, böylece RSS ölçümleri birbirini
+etkilemez. Uyum oranı --min-agreement altında kalırsa çıkış kodu 1 olur
+(parite kontrolü olarak CI'da kullanılabilir).
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_inference_backends --model en --quantize
+"""
+import argparse
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+
+from benchmarks.synthetic_comments import ENGLISH_SENTENCES, TURKISH_SENTENCES
+
+MODELS = {
+    "tr": ("savasy/bert-base-turkish-sentiment-cased", "tr-sentiment", TURKISH_SENTENCES),
+    "en": ("distilbert-base-uncased-finetuned-sst-2-english", "en-sentiment", ENGLISH_SENTENCES),
+}
+
+
+def _rss_mb() -> float:
+    """Sürecin anlık RSS değerini MB cinsinden döndürür (Linux)"""
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _worker(backend, quantize, model_key, sentences, batch_size, repeats, queue):
+    from transformers import pipeline
+    from services.inference_backend import load_sequence_classifier
+
+    model_name, directory, _ = MODELS[model_key]
+    rss_before = _rss_mb()
+    tokenizer, model = load_sequence_classifier(
+        model_name, os.path.join("models", directory), model_key, backend, quantize
+    )
+    classifier = pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
+    outputs = classifier(sentences, batch_size=batch_size, truncation=True)
+
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        classifier(sentences, batch_size=batch_size, truncation=True)
+        latencies.append((time.perf_counter() - start) / len(sentences) * 1000)
+
+    queue.put({
+        "labels": [output["label"] for output in outputs],
+        "scores": [output["score"] for output in outputs],
+        "latency_ms": statistics.median(latencies),
+        "rss_mb": _rss_mb() - rss_before,
+    })
+
+
+def _run(backend, quantize, args, sentences):
+    queue = multiprocessing.get_context("spawn").Queue()
+    process = multiprocessing.get_context("spawn").Process(
+        target=_worker, args=(backend, quantize, args.model, sentences, args.batch_size, args.repeats, queue)
+    )
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", choices=sorted(MODELS), default="en")
+    parser.add_argument("--quantize", action="store_true")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--min-agreement", type=float, default=0.95)
+    parser.add_argument("--score-tolerance", type=float, default=0.05)
+    args = parser.parse_args()
+
+    base_sentences = MODELS[args.model][2]
+    sentences = [f"{a} {b.lower()}" for a in base_sentences for b in base_sentences]
+
+    reference = _run("torch", False, args, sentences)
+    candidate = _run("onnx", args.quantize, args, sentences)
+
+    agreement = sum(a == b for a, b in zip(reference["labels"], candidate["labels"])) / len(sentences)
+    score_diffs = [abs(a - b) for a, b in zip(reference["scores"], candidate["scores"])]
+    within_tolerance = sum(diff <= args.score_tolerance for diff in score_diffs) / len(sentences)
+
+    name = "onnx-int8" if args.quantize else "onnx"
+    print(f"model={args.model} sentences={len(sentences)}")
+    print(f"label agreement        {agreement:.2%}")
+    print(f"max score diff         {max(score_diffs):.4f} (within {args.score_tolerance}: {within_tolerance:.2%})")
+    for label, result in (("torch", reference), (name, candidate)):
+        print(f"{label:10s} latency={result['latency_ms']:.2f} ms/sentence rss=+{result['rss_mb']:.0f} MB")
+
+    if agreement < args.min_agreement:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
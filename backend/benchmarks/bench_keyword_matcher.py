@@ -0,0 +1,72 @@
+"""
+Tema anahtar kelime sayımında Aho–Corasick eşleştiriciyi anahtar kelime
+başına `str.count` döngüsüyle karşılaştırır (mevcut ve büyütülmüş taksonomi).
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_keyword_matcher --comments 10000 --scales 1,5,20
+"""
+import argparse
+import random
+import time
+
+from benchmarks.synthetic_comments import generate_comments
+from services.keyword_matcher import KeywordMatcher
+from services.sentiment_service import sentiment_service
+
+
+def _grown_taxonomy(scale):
+    """Her temaya mevcut anahtar kelimelerden türetilmiş yapay kelimeler ekler"""
+    rng = random.Random(scale)
+    taxonomy = {}
+    for theme, keywords in sentiment_service.theme_keywords.items():
+        grown = list(keywords)
+        for _ in range(len(keywords) * (scale - 1)):
+            keyword = rng.choice(keywords)
+            grown.append(keyword + rng.choice("aeiklmnrst") + rng.choice("aeiklmnrst"))
+        taxonomy[theme] = grown
+    return taxonomy
+
+
+def _count_loop(taxonomy, texts):
+    for text in texts:
+        for keywords in taxonomy.values():
+            for keyword in keywords:
+                text.count(keyword.lower())
+
+
+def _matcher(matcher, texts):
+    for text in texts:
+        matcher.group_hits(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--comments", type=int, default=10000)
+    parser.add_argument("--scales", default="1,5,20")
+    args = parser.parse_args()
+
+    texts = [comment['text'].lower() for comment in generate_comments(args.comments)]
+
+    for scale in (int(value) for value in args.scales.split(",")):
+        taxonomy = _grown_taxonomy(scale)
+        keyword_count = sum(len(keywords) for keywords in taxonomy.values())
+
+        start = time.perf_counter()
+        matcher = KeywordMatcher(taxonomy)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _count_loop(taxonomy, texts)
+        loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _matcher(matcher, texts)
+        matched = time.perf_counter() - start
+
+        print(f"{keyword_count:5d} keywords  str.count={args.comments / loop:9.0f} comments/sec  "
+              f"aho-corasick={args.comments / matched:9.0f} comments/sec  speedup={loop / matched:.1f}x  "
+              f"build={build * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
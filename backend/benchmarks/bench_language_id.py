@@ -0,0 +1,129 @@
+"""
+Dil tespiti yöntemlerini etiketli yerel bir örnek üzerinde doğruluk ve hız
+açısından karşılaştırır: yalnızca Türkçe harflere bakan karakter tabanlı
+tespit (charset) ve karakter n-gram modeli (ngram).
+
+Örnek: sentetik yorum cümleleri, app/data/sample_comments1.csv yorumları,
+bunların Türkçe karakterleri kaldırılmış halleri ve eğitim metinlerinde
+bulunmayan elle etiketlenmiş cümleler. Hız, generate_comments yorumlarının
+toplu (batch) sınıflandırılmasıyla ölçülür.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_language_id --comments 20000
+"""
+import argparse
+import csv
+import os
+import time
+
+from benchmarks.synthetic_comments import generate_comments, TURKISH_SENTENCES, ENGLISH_SENTENCES
+from services.language_id import load_language_identifier, TURKISH_CHARS
+
+SAMPLE_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "app", "data", "sample_comments1.csv")
+
+# Eğitim metinlerinde bulunmayan, Türkçe karakter kullanılmadan yazılmış yorumlar
+HELD_OUT_TURKISH = [
+    "bu videoyu izledikten sonra fikrim tamamen degisti",
+    "abi sesin cok kisik geliyor mikrofonu degistir bence",
+    "ilk defa bu kadar anlasilir bir anlatim gordum",
+    "kanal gercekten buyumeyi hak ediyor",
+    "yarin sinavim var tam zamaninda yetisti",
+    "neden bu kadar az izlenmis anlamadim",
+    "hocam bir sonraki videoda veritabani konusunu anlatir misin",
+    "reklamlar biraz fazla olmus ama yine de izledim",
+    "su kisimda ne demek istediginizi anlamadim",
+    "annem bile anladi o derece basit anlatmissin",
+    "gecen haftaki yayini kacirdim tekrari var mi",
+    "bu sarkiyi dinlerken hep aglarim",
+    "tesekkurler hocam emeginize saglik",
+    "oyunun grafikleri berbat olmus",
+    "keske daha once bulsaydim bu kanali",
+    "herkes izlesin bence cok onemli bir konu",
+    "aciklamadaki link calismiyor",
+    "bunu yapan adam dahi olmali",
+    "begendim ama biraz uzun olmus",
+    "selamlar istanbuldan takipteyim",
+]
+
+HELD_OUT_ENGLISH = [
+    "after watching this my opinion completely changed",
+    "bro your mic is way too quiet",
+    "first time i saw such a clear explanation",
+    "this channel deserves way more subscribers",
+    "my exam is tomorrow so this came just in time",
+    "why does this have so few views",
+    "can you cover databases in the next episode",
+    "too many ads but i still watched it",
+    "i did not get what you meant in that part",
+    "even my mom understood it",
+    "i missed last week's stream is there a replay",
+    "i always cry when i listen to this song",
+    "thank you so much for your hard work",
+    "the graphics in this game are terrible",
+    "wish i had found this channel sooner",
+    "everyone should watch this honestly",
+    "the link in the description is broken",
+    "whoever made this is a genius",
+    "liked it but it was a bit long",
+    "greetings from london",
+]
+
+_STRIP_TURKISH = str.maketrans('çğıöşüÇĞİÖŞÜ', 'cgiosuCGIOSU')
+
+
+def _charset(texts):
+    """Eski yöntem: Türkçeye özgü harf varsa Türkçe"""
+    return ['tr' if not TURKISH_CHARS.isdisjoint(text) else 'en' for text in texts]
+
+
+def _labeled_sample():
+    """(ad, metinler, etiket) grupları"""
+    with open(SAMPLE_CSV, encoding='utf-8') as f:
+        sample_comments = [row['comment'] for row in csv.DictReader(f)]
+    turkish = TURKISH_SENTENCES + sample_comments
+    return [
+        ("turkish", turkish, 'tr'),
+        ("turkish without diacritics", [text.translate(_STRIP_TURKISH) for text in turkish], 'tr'),
+        ("held-out turkish (no diacritics)", HELD_OUT_TURKISH, 'tr'),
+        ("english", ENGLISH_SENTENCES, 'en'),
+        ("held-out english", HELD_OUT_ENGLISH, 'en'),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--comments", type=int, default=20000, help="Hız ölçümü için yorum sayısı")
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    identifier = load_language_identifier()
+    print(f"n-gram model: {len(identifier.vocabulary)} n-grams, trained in "
+          f"{(time.perf_counter() - start) * 1000:.1f} ms ({identifier.cache_id})")
+
+    detectors = {"charset": _charset, "ngram": identifier.identify_batch}
+    totals = {name: [0, 0] for name in detectors}
+    print(f"{'sample':34s} {'size':>5s}  " + "  ".join(f"{name:>8s}" for name in detectors))
+    for group, texts, label in _labeled_sample():
+        accuracies = []
+        for name, detect in detectors.items():
+            correct = sum(language == label for language in detect(texts))
+            totals[name][0] += correct
+            totals[name][1] += len(texts)
+            accuracies.append(f"{correct / len(texts):8.3f}")
+        print(f"{group:34s} {len(texts):5d}  " + "  ".join(accuracies))
+    print(f"{'overall':34s} {totals['ngram'][1]:5d}  " +
+          "  ".join(f"{correct / size:8.3f}" for correct, size in totals.values()))
+
+    texts = [comment['text'] for comment in generate_comments(args.comments)]
+    for name, detect in detectors.items():
+        start = time.perf_counter()
+        for offset in range(0, len(texts), args.batch_size):
+            detect(texts[offset:offset + args.batch_size])
+        elapsed = time.perf_counter() - start
+        print(f"{name:8s} {len(texts) / elapsed:10.0f} comments/s  (batch size {args.batch_size})")
+
+
+if __name__ == "__main__":
+    main()
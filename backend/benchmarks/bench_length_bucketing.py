@@ -0,0 +1,69 @@
+"""
+Uzunluk bazlı dinamik batch'leme ile sabit boyutlu batch'lemeyi karşılaştırır.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_length_bucketing --comments 1000
+"""
+import argparse
+import time
+
+from benchmarks.synthetic_comments import generate_comments
+from services.batch_scheduler import (
+    padding_stats,
+    plan_fixed_batches,
+    plan_token_budget_batches,
+    run_batches,
+    token_lengths,
+)
+from services.sentiment_service import sentiment_service
+
+
+def _collect_sentences(comments):
+    groups = {}
+    for comment in comments:
+        lang = sentiment_service.detect_language(comment['text'])
+        groups.setdefault(lang, []).extend(sentiment_service._split_sentences(comment['text']))
+    return groups
+
+
+def _run(pipeline, sentences, batches):
+    start = time.perf_counter()
+    run_batches(sentences, batches, lambda batch: pipeline(batch, batch_size=len(batch), truncation=True))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--comments", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=sentiment_service.batch_size)
+    parser.add_argument("--max-tokens", type=int, default=sentiment_service.max_batch_tokens)
+    args = parser.parse_args()
+
+    comments = generate_comments(args.comments)
+    groups = _collect_sentences(comments)
+
+    totals = {"fixed": 0.0, "bucketed": 0.0}
+    for lang, sentences in groups.items():
+        pipeline = sentiment_service._get_sentiment_pipeline(lang)
+        lengths = token_lengths(pipeline.tokenizer, sentences)
+
+        fixed = plan_fixed_batches(len(sentences), args.batch_size)
+        bucketed = plan_token_budget_batches(lengths, args.max_tokens, args.batch_size)
+
+        # Isınma turu
+        pipeline(sentences[:args.batch_size], batch_size=args.batch_size, truncation=True)
+
+        for name, batches in (("fixed", fixed), ("bucketed", bucketed)):
+            stats = padding_stats(lengths, batches)
+            elapsed = _run(pipeline, sentences, batches)
+            totals[name] += elapsed
+            print(f"[{lang}] {name:9s} batches={stats['batches']:5d} "
+                  f"padding_waste={stats['padding_waste']:.1%} "
+                  f"padded_tokens={stats['padded_tokens']} elapsed={elapsed:.2f}s")
+
+    for name, elapsed in totals.items():
+        print(f"{name:9s} {args.comments / elapsed:8.1f} comments/sec")
+
+
+if __name__ == "__main__":
+    main()
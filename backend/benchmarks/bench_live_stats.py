@@ -0,0 +1,81 @@
+"""
+Arka plan video analizindeki parça başına (canlı) istatistiklerin maliyetini
+ölçer: her parçadan sonra tüm yorumlar üzerinden get_sentiment_stats ile
+yeniden hesaplama, yalnızca yeni parçanın birleştirilebilir birikime
+(SentimentAccumulator) eklenmesiyle karşılaştırılır. Duygu sonuçları
+modeller çalıştırılmadan sentetik olarak üretilir.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_live_stats --comments 5000 --chunk-size 20
+"""
+import argparse
+import random
+import time
+
+from benchmarks.synthetic_comments import generate_comments
+from services.comment_records import CommentRecords
+from services.sentiment_service import sentiment_service
+
+SENTIMENTS = ['positive', 'negative', 'neutral']
+
+
+def _analyze(comment, rng):
+    """Yorum için sentetik duygu sonucu ve tema skorları"""
+    scores = [rng.random() for _ in range(3)]
+    total = sum(scores)
+    theme = {name: round(rng.random() * 0.3, 4)
+             for name in rng.sample(sentiment_service.theme_categories, rng.randint(1, 5))}
+    sentiment = {
+        'category': rng.choice(SENTIMENTS),
+        'polarity': round(rng.uniform(-1, 1), 4),
+        'confidence': round(rng.random(), 4),
+        'language': 'tr' if rng.random() < 0.5 else 'en',
+        'sentence_analyses': [],
+        'theme': theme,
+        'detailed_scores': {
+            'positive_score': scores[0] / total,
+            'negative_score': scores[1] / total,
+            'neutral_score': scores[2] / total
+        }
+    }
+    return sentiment, theme
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--comments", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(args.comments)
+    comments = generate_comments(args.comments)
+    analyzed = [_analyze(comment, rng) for comment in comments]
+
+    records = CommentRecords()
+    live_stats = sentiment_service.create_accumulator()
+    rescan = streaming = 0.0
+    for start in range(0, len(comments), args.chunk_size):
+        for comment, (sentiment, theme) in zip(comments[start:start + args.chunk_size],
+                                               analyzed[start:start + args.chunk_size]):
+            records.append(comment, sentiment, theme)
+
+        began = time.perf_counter()
+        rescanned = sentiment_service.get_sentiment_stats(records)
+        rescan += time.perf_counter() - began
+
+        began = time.perf_counter()
+        sentiment_service.accumulate(records, live_stats, start=start)
+        streamed = live_stats.sentiment_stats()
+        streaming += time.perf_counter() - began
+
+    chunks = -(-len(comments) // args.chunk_size)
+    print(f"{args.comments} comments in {chunks} chunks of {args.chunk_size}")
+    print(f"  rescan all comments per chunk: {rescan * 1000:8.1f} ms total  {rescan / chunks * 1000:6.2f} ms/chunk")
+    print(f"  accumulate new chunk:          {streaming * 1000:8.1f} ms total  {streaming / chunks * 1000:6.2f} ms/chunk"
+          f"  (includes word sketch)")
+    print(f"  final stats identical: {rescanned == streamed}")
+    print(f"  top sketch words: {[item['text'] for item in live_stats.word_cloud(10)]}")
+
+
+if __name__ == "__main__":
+    main()
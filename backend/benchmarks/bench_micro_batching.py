@@ -0,0 +1,64 @@
+"""
+Eşzamanlı isteklerde mikro-batch katmanının toplam verimini, her isteğin
+modeli ayrı çalıştırdığı duruma göre karşılaştırır.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_micro_batching --clients 1,8,32 --comments-per-client 4
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.synthetic_comments import generate_comments
+from services.inference_executor import inference_executor
+from services.sentiment_service import sentiment_service
+
+
+async def _per_request(batches):
+    await asyncio.gather(*(
+        inference_executor.run(sentiment_service.analyze_sentiment_batch, texts) for texts in batches
+    ))
+
+
+async def _micro_batched(batches):
+    await asyncio.gather(*(sentiment_service.micro_batcher.submit_many(texts) for texts in batches))
+
+
+async def _measure(fn, batches):
+    # Önbellek isabetleri ölçümü bozmasın
+    sentiment_service.cache.clear()
+    start = time.perf_counter()
+    await fn(batches)
+    return time.perf_counter() - start
+
+
+async def run(args):
+    # Isınma turu
+    sentiment_service.analyze_sentiment_batch([c['text'] for c in generate_comments(8)])
+
+    for clients in (int(value) for value in args.clients.split(",")):
+        batches = [
+            [c['text'] for c in generate_comments(args.comments_per_client, seed=client)]
+            for client in range(clients)
+        ]
+        total = clients * args.comments_per_client
+
+        per_request = await _measure(_per_request, batches)
+        batched = await _measure(_micro_batched, batches)
+        print(f"{clients:4d} clients  per-request={total / per_request:8.1f} comments/sec  "
+              f"micro-batched={total / batched:8.1f} comments/sec  speedup={per_request / batched:.1f}x")
+
+    print(f"micro-batcher: {sentiment_service.micro_batcher.stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", default="1,8,32")
+    parser.add_argument("--comments-per-client", type=int, default=4)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
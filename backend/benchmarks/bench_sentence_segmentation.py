@@ -0,0 +1,68 @@
+"""
+Yorumları cümlelere ayırmanın 10 bin yorum başına maliyetini ölçer: her
+yorum için NLTK sent_tokenize (eski yöntem), hızlı yollu SentenceSegmenter
+ile tek tek ayırma ve segment_batch ile toplu ayırma. Hızlı yolun sonuçları
+Punkt ile karşılaştırılır ve Punkt'a düşen yorum oranı raporlanır.
+
+NLTK punkt verisi (tokenizers/punkt) kurulu olmalıdır.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_sentence_segmentation --comments 10000 --fast-path-chars 0
+"""
+import argparse
+import time
+
+from nltk.tokenize import sent_tokenize
+
+from benchmarks.synthetic_comments import generate_comments
+from services.language_id import TURKISH_CHARS
+from services.sentence_segmenter import SentenceSegmenter, PUNKT_LANGUAGES
+
+
+def _timed(function, repeat):
+    """function'ı repeat kez çalıştırır: (son sonuç, en iyi süre)"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--comments", type=int, default=10000)
+    parser.add_argument("--fast-path-chars", type=int, default=0,
+                        help="Bu uzunluğun altındaki yorumlar tek cümle sayılır (0 = yalnızca noktalama kontrolü)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    texts = [comment['text'] for comment in generate_comments(args.comments)]
+    languages = ['tr' if not TURKISH_CHARS.isdisjoint(text) else 'en' for text in texts]
+    scale = 10000 / len(texts)
+
+    baseline, baseline_time = _timed(lambda: [sent_tokenize(text) or [text] for text in texts], args.repeat)
+    punkt, punkt_time = _timed(
+        lambda: [sent_tokenize(text, language=PUNKT_LANGUAGES[lang]) or [text]
+                 for text, lang in zip(texts, languages)], args.repeat)
+
+    segmenter = SentenceSegmenter(args.fast_path_chars)
+    single, single_time = _timed(lambda: [segmenter.segment(text, lang) for text, lang in zip(texts, languages)],
+                                 args.repeat)
+    segmenter = SentenceSegmenter(args.fast_path_chars)
+    batch, batch_time = _timed(lambda: segmenter.segment_batch(texts, languages), args.repeat)
+
+    fast = segmenter.fast_path_count / args.repeat
+    print(f"{len(texts)} comments, fast path: {fast / len(texts):.1%} of comments skip Punkt")
+    print(f"  sent_tokenize (english) per comment:  {baseline_time * scale * 1000:8.1f} ms / 10k comments")
+    print(f"  sent_tokenize (per language):         {punkt_time * scale * 1000:8.1f} ms / 10k comments")
+    print(f"  SentenceSegmenter.segment:            {single_time * scale * 1000:8.1f} ms / 10k comments")
+    print(f"  SentenceSegmenter.segment_batch:      {batch_time * scale * 1000:8.1f} ms / 10k comments")
+    print(f"  identical to per-language Punkt: single={single == punkt} batch={batch == punkt}")
+    print(f"  comments split differently than english-only Punkt: "
+          f"{sum(old != new for old, new in zip(baseline, batch))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Sütunlu (AnalysisFrame) istatistik hesaplamasının süresini yorum sayısına göre
+ölçer: çerçevenin oluşturulması ile duygu istatistikleri ve tema analizinin
+paylaşılan çerçeve üzerindeki süreleri ayrı ayrı raporlanır.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_sentiment_stats --sizes 1000,10000,100000
+"""
+import argparse
+import random
+import time
+
+from services.analysis_frame import AnalysisFrame
+from services.sentiment_service import sentiment_service
+
+SENTIMENTS = ['positive', 'negative', 'neutral']
+
+
+def _analyzed_comments(size):
+    """Tema ve detaylı skorları olan sentetik analiz sonuçları"""
+    rng = random.Random(size)
+    themes = sentiment_service.theme_categories
+    comments = []
+    for index in range(size):
+        scores = [rng.random() for _ in range(3)]
+        total = sum(scores)
+        theme = {name: round(rng.random() * 0.3, 4) for name in rng.sample(themes, rng.randint(1, 5))}
+        comments.append({
+            'text': f"yorum {index}",
+            'sentiment': {
+                'category': rng.choice(SENTIMENTS),
+                'polarity': round(rng.uniform(-1, 1), 4),
+                'confidence': round(rng.random(), 4),
+                'language': 'tr' if rng.random() < 0.5 else 'en',
+                'detailed_scores': {
+                    'positive_score': scores[0] / total,
+                    'negative_score': scores[1] / total,
+                    'neutral_score': scores[2] / total
+                },
+                'theme': theme
+            },
+            'theme': theme
+        })
+    return comments
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    args = parser.parse_args()
+
+    for size in (int(value) for value in args.sizes.split(",")):
+        comments = _analyzed_comments(size)
+
+        start = time.perf_counter()
+        frame = AnalysisFrame(comments)
+        frame.comment_themes
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sentiment_service.get_sentiment_stats(comments, frame)
+        stats = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sentiment_service.get_theme_analysis(comments, frame)
+        themes = time.perf_counter() - start
+
+        print(f"{size:7d} comments  frame={build * 1000:8.1f} ms  stats={stats * 1000:7.1f} ms  "
+              f"themes={themes * 1000:7.1f} ms  total={(build + stats + themes) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Toplu zero-shot tema analizinin verimini tekli analizle karşılaştırır.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_theme_batching --sizes 100,1000,10000
+"""
+import argparse
+import time
+
+from benchmarks.synthetic_comments import generate_comments
+from services.sentiment_service import sentiment_service
+
+
+def _measure(fn, texts):
+    start = time.perf_counter()
+    fn(texts)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100,1000,10000")
+    parser.add_argument("--single-limit", type=int, default=1000,
+                        help="Bu boyuttan büyük girdilerde tekli analiz ölçülmez")
+    args = parser.parse_args()
+
+    # Isınma turu
+    sentiment_service.analyze_themes_batch([c['text'] for c in generate_comments(8)])
+
+    for size in (int(value) for value in args.sizes.split(",")):
+        texts = [comment['text'] for comment in generate_comments(size)]
+
+        batched = _measure(sentiment_service.analyze_themes_batch, texts)
+        line = f"{size:6d} comments  batched={size / batched:8.1f} comments/sec"
+
+        if size <= args.single_limit:
+            single = _measure(lambda items: [sentiment_service.analyze_theme(t) for t in items], texts)
+            line += f"  single={size / single:8.1f} comments/sec  speedup={single / batched:.1f}x"
+
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
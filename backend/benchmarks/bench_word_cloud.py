@@ -0,0 +1,70 @@
+"""
+Kelime bulutu hesaplamasının süresini yorum sayısına göre ölçer; belge
+frekansı indeksini eski kelime x yorum alt dizi taramasıyla karşılaştırır.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_word_cloud --sizes 1000,10000,100000
+"""
+import argparse
+import random
+import time
+
+from benchmarks.synthetic_comments import generate_comments
+from services.sentiment_service import sentiment_service
+from services.word_cloud import document_frequencies
+
+SENTIMENTS = ['positive', 'negative', 'neutral']
+
+
+def _analyzed_comments(size):
+    rng = random.Random(size)
+    return [
+        {'text': comment['text'], 'sentiment': {'category': rng.choice(SENTIMENTS)}}
+        for comment in generate_comments(size, seed=size)
+    ]
+
+
+def _scan_frequencies(texts_by_category, tokens):
+    """Eski yöntem: her kelime geçişi (tekrarlar dahil) için her metinde alt dizi araması"""
+    for token in tokens:
+        for texts in texts_by_category.values():
+            sum(1 for text in texts if token in text.lower())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--scan-limit", type=int, default=1000,
+                        help="Bu boyuttan büyük girdilerde eski tarama ölçülmez")
+    args = parser.parse_args()
+
+    for size in (int(value) for value in args.sizes.split(",")):
+        comments = _analyzed_comments(size)
+
+        start = time.perf_counter()
+        sentiment_service.get_word_cloud(comments)
+        word_cloud = time.perf_counter() - start
+        line = f"{size:7d} comments  word_cloud={word_cloud * 1000:9.1f} ms"
+
+        texts_by_category = {sentiment: [] for sentiment in SENTIMENTS}
+        for comment in comments:
+            texts_by_category[comment['sentiment']['category']].append(comment['text'].lower())
+        tokens = [word for word in sentiment_service.clean_text(' '.join(c['text'] for c in comments)).split()
+                  if len(word) >= 3 and word.isalpha()]
+
+        start = time.perf_counter()
+        document_frequencies(texts_by_category, set(tokens))
+        indexed = time.perf_counter() - start
+        line += f"  df_index={indexed * 1000:9.1f} ms"
+
+        if size <= args.scan_limit:
+            start = time.perf_counter()
+            _scan_frequencies(texts_by_category, tokens)
+            scanned = time.perf_counter() - start
+            line += f"  df_scan={scanned * 1000:9.1f} ms  speedup={scanned / indexed:.1f}x"
+
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
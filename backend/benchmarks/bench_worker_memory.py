@@ -0,0 +1,127 @@
+"""
+Gunicorn ile 1, 4 ve 8 worker çalıştırıp worker başına bellek kullanımını ölçer.
+
+Her worker sayısı için uygulama ön yüklemeli (MODEL_PRELOAD=true, modeller
+copy-on-write paylaşılır) ve ön yüklemesiz (her worker modelleri kendisi
+yükler) olarak başlatılır. RSS paylaşılan sayfaları her süreçte tam sayar;
+gerçek maliyeti PSS (paylaşılan sayfalar süreçler arasında bölünmüş) ve
+USS (yalnızca sürece özel sayfalar) gösterir. Yalnızca Linux'ta çalışır.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_worker_memory --workers 1,4,8
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+
+
+def _children(pid):
+    """Bir sürecin doğrudan alt süreçlerini döndürür"""
+    children = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[1]) == pid:
+            children.append(int(entry))
+    return children
+
+
+def _memory(pid):
+    """Sürecin RSS, PSS ve USS değerlerini MB cinsinden döndürür"""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(":") and parts[1].isdigit():
+                values[parts[0][:-1]] = int(parts[1]) / 1024
+    return {
+        "rss": values.get("Rss", 0.0),
+        "pss": values.get("Pss", 0.0),
+        "uss": values.get("Private_Clean", 0.0) + values.get("Private_Dirty", 0.0)
+    }
+
+
+def _ready(port):
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/health/ready", timeout=2) as response:
+            return response.status == 200
+    except Exception:
+        return False
+
+
+def _wait_until_loaded(master, workers, port, timeout):
+    """Tüm worker'lar ayağa kalkıp bellek kullanımı sabitlenene kadar bekler"""
+    deadline = time.time() + timeout
+    previous = None
+    stable = 0
+    while time.time() < deadline:
+        time.sleep(2)
+        pids = _children(master)
+        if len(pids) < workers or not _ready(port):
+            continue
+        total = sum(_memory(pid)["rss"] for pid in pids)
+        stable = stable + 1 if previous is not None and abs(total - previous) < 5 else 0
+        previous = total
+        if stable >= 3:
+            return pids
+    raise TimeoutError("Worker'lar zamanında hazır olmadı")
+
+
+def _measure(workers, preload, port, timeout):
+    env = dict(
+        os.environ,
+        WEB_CONCURRENCY=str(workers),
+        MODEL_PRELOAD="true" if preload else "false",
+        MODEL_WARMUP="true",
+        GUNICORN_BIND=f"127.0.0.1:{port}"
+    )
+    master = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "main:app"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        pids = _wait_until_loaded(master.pid, workers, port, timeout)
+        per_worker = [_memory(pid) for pid in pids]
+        master_memory = _memory(master.pid)
+    finally:
+        master.terminate()
+        master.wait(timeout=30)
+
+    def average(key):
+        return sum(item[key] for item in per_worker) / len(per_worker)
+
+    return {
+        "rss": average("rss"),
+        "pss": average("pss"),
+        "uss": average("uss"),
+        "total_pss": master_memory["pss"] + sum(item["pss"] for item in per_worker)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", default="1,4,8")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=int, default=600,
+                        help="Modellerin yüklenmesi için beklenecek en uzun süre (saniye)")
+    args = parser.parse_args()
+
+    for workers in (int(value) for value in args.workers.split(",")):
+        for preload in (False, True):
+            result = _measure(workers, preload, args.port, args.timeout)
+            mode = "preload" if preload else "per-worker"
+            print(f"{workers:2d} workers  {mode:10s}  "
+                  f"rss/worker={result['rss']:8.1f} MB  pss/worker={result['pss']:8.1f} MB  "
+                  f"uss/worker={result['uss']:8.1f} MB  total pss={result['total_pss']:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+YouTube yorum sayfalarının olay döngüsünü bloklayıp bloklamadığını ölçer.
+Gecikme eklenmiş yerel stub sunucuya (benchmarks.youtube_stub) karşı
+birkaç videonun yorumları eşzamanlı istenir; bu sırada döngüde çalışan bir
+kalp atışı görevi en uzun gecikmesini (döngünün bloklandığı süre) kaydeder.
+
+- blocking: her sayfa senkron HTTP çağrısıyla alınır (eski
+  googleapiclient .execute() davranışı)
+- async: YouTubeApiClient (httpx.AsyncClient) ile sayfalar beklenir
+
+Kullanım (backend dizininden):
+    python -m benchmarks.bench_youtube_client --videos 5 --comments-per-video 300 --latency-ms 50
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from benchmarks.youtube_stub import StubYouTubeServer, synthetic_recordings
+from services.comment_store import CommentStore
+from services.youtube_client import YouTubeApiClient
+from services.youtube_service import YouTubeService
+
+
+class BlockingApiClient(YouTubeApiClient):
+    """Sayfaları senkron (olay döngüsünü bloklayan) isteklerle alan istemci"""
+
+    async def get(self, resource, **params):
+        query = {name: value for name, value in params.items() if value is not None}
+        with httpx.Client(base_url=self.base_url, timeout=self.timeout) as client:
+            response = client.get(f"/{resource}", params=query)
+        response.raise_for_status()
+        return response.json()
+
+
+async def _heartbeat(stop: asyncio.Event, interval: float = 0.005) -> float:
+    """Döngünün planlanan uyanmadan en fazla ne kadar geciktiğini döndürür"""
+    worst = 0.0
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - expected)
+    return worst
+
+
+async def _run(service, video_ids, max_comments):
+    # İlk istek (bağlantı havuzu / TLS bağlamı kurulumu) ölçüme dahil edilmez
+    await service.api.get("channels", part="id", mine=True)
+    stop = asyncio.Event()
+    heartbeat = asyncio.create_task(_heartbeat(stop))
+    start = time.perf_counter()
+    results = await asyncio.gather(*(service.get_video_comments(video_id, max_comments) for video_id in video_ids))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    return sum(len(comments) for comments in results), elapsed, await heartbeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=5)
+    parser.add_argument("--comments-per-video", type=int, default=300)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    recordings = synthetic_recordings(args.videos, args.comments_per_video)
+    video_ids = [item["params"]["id"] for item in recordings["videos"]]
+    with StubYouTubeServer(recordings, latency=args.latency_ms / 1000) as server:
+        for name, client_class in (("blocking", BlockingApiClient), ("async", YouTubeApiClient)):
+            service = YouTubeService(None, api=client_class(base_url=server.base_url),
+                                     comment_store=CommentStore())
+            server.reset_requests()
+            comments, elapsed, stall = asyncio.run(_run(service, video_ids, args.comments_per_video))
+            print(f"{name:8s} {comments:6d} comments  {server.request_count():4d} requests  "
+                  f"wall={elapsed * 1000:8.1f} ms  max event loop stall={stall * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
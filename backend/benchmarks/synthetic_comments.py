@@ -0,0 +1,58 @@
+"""Benchmark'lar için tekrarlanabilir sentetik YouTube yorumları üretir."""
+import random
+from typing import Any, Dict, List
+
+TURKISH_SENTENCES = [
+    "Harika bir video olmuş, çok faydalı bilgiler var",
+    "Çok güzel anlatmışsınız, devamını bekliyorum",
+    "Biraz daha detaylı anlatabilir misiniz",
+    "Ses kalitesi biraz kötüydü ama içerik mükemmel",
+    "Montaj ve görüntü çok profesyonel olmuş",
+    "Bu konuyu uzun zamandır arıyordum teşekkürler",
+    "Anlatım tarzınız çok samimi ve doğal",
+    "Videoda bir hata var sanırım",
+    "Abone oldum, yeni videoları bekliyorum",
+    "Komik ve eğlenceli bir içerik olmuş",
+]
+
+ENGLISH_SENTENCES = [
+    "Great video, really helpful information",
+    "The audio quality was a bit bad but the content is awesome",
+    "Could you make a tutorial about this topic",
+    "I love the editing and the visual style",
+    "This was funny and entertaining to watch",
+    "Thanks for the detailed explanation",
+    "There is an error at the end of the video",
+    "Subscribed, waiting for the next one",
+    "Very professional and polished presentation",
+    "Honestly the best channel on this subject",
+]
+
+
+def generate_comments(count: int, seed: int = 42, turkish_ratio: float = 0.5) -> List[Dict[str, Any]]:
+    """
+    Uzunlukları log-normal dağılan sentetik yorumlar üretir
+
+    Çoğu yorum tek kısa cümleden oluşur, küçük bir kısmı birkaç yüz
+    kelimeye kadar uzar (gerçek YouTube yorumlarına benzer bir dağılım).
+    """
+    rng = random.Random(seed)
+    comments = []
+    for i in range(count):
+        pool = TURKISH_SENTENCES if rng.random() < turkish_ratio else ENGLISH_SENTENCES
+        sentence_count = max(1, min(40, int(rng.lognormvariate(0, 0.9))))
+        sentences = []
+        for _ in range(sentence_count):
+            sentence = rng.choice(pool)
+            if rng.random() < 0.3:
+                sentence = f"{sentence} {rng.choice(pool).lower()}"
+            sentences.append(sentence + rng.choice([".", "!", "?", ""]))
+        comments.append({
+            'id': f"comment-{i}",
+            'text': " ".join(sentences),
+            'author': f"user-{i % 500}",
+            'published_at': f"2024-01-{i % 28 + 1:02d}T12:00:00Z",
+            'video_id': f"video-{i % 50}",
+            'video_title': f"Video {i % 50}"
+        })
+    return comments
@@ -0,0 +1,264 @@
+"""
+YouTube Data API v3 için yerel stub sunucu: kaydedilmiş JSON yanıtlarını
+tekrar oynatır (replay). Benchmark'larda ve elle test için
+YOUTUBE_API_BASE_URL bu sunucuya yönlendirilir.
+
+Kayıt dosyası biçimi (kaynak -> kayıtlar):
+    {"commentThreads": [{"params": {"videoId": "abc"}, "response": {...}},
+                        {"params": {"videoId": "abc", "pageToken": "p2"}, "response": {...}}],
+     "videos": [{"params": {"id": "abc"}, "status": 404, "response": {"error": {...}}}]}
+
+Bir istek, parametrelerinin tümü (pageToken dahil; kayıtta yoksa istekte de
+olmamalı) eşleşen ilk kayıtla yanıtlanır; eşleşme yoksa 404 döner. Virgülle
+ayrılmış çoklu `id` istekleri (ör. videos.list) için birebir kayıt yoksa tek
+ID'li kayıtların öğeleri sırayla birleştirilir (bulunamayan ID'ler API'deki
+gibi atlanır).
+
+Kullanım (backend dizininden):
+    python -m benchmarks.youtube_stub --recordings kayitlar.json --port 8765
+    YOUTUBE_API_BASE_URL=http://127.0.0.1:8765/youtube/v3 uvicorn main:app
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from benchmarks.synthetic_comments import generate_comments
+
+API_PREFIX = "/youtube/v3/"
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    # Varsayılan dinleme kuyruğu (5) eşzamanlı bağlantılarda SYN tekrarına (~1 sn gecikme) yol açar
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class StubYouTubeServer:
+    """
+    Kayıtlı yanıtları tekrar oynatan HTTP sunucu (arka plan iş parçacığında)
+
+    Her isteğe `latency` saniye gecikme eklenir (istekler ayrı iş
+    parçacıklarında beklediğinden eşzamanlı istekler birbirini beklemez).
+    Gelen istekler `requests` listesinde (kaynak, parametreler) olarak tutulur.
+    """
+
+    def __init__(self, recordings: Dict[str, List[Dict[str, Any]]], latency: float = 0.0,
+                 host: str = "127.0.0.1", port: int = 0):
+        self.recordings = recordings
+        self.latency = latency
+        self.requests: List[tuple] = []
+        self._lock = threading.Lock()
+        self._server = _StubHTTPServer((host, port), self._handler_class())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """YOUTUBE_API_BASE_URL olarak kullanılacak adres"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX.rstrip('/')}"
+
+    def request_count(self, resource: Optional[str] = None) -> int:
+        """Alınan istek sayısı (resource verilirse yalnızca o kaynak için)"""
+        with self._lock:
+            return sum(1 for name, _ in self.requests if resource is None or name == resource)
+
+    def reset_requests(self):
+        """İstek kayıtlarını temizler"""
+        with self._lock:
+            self.requests.clear()
+
+    def respond(self, resource: str, params: Dict[str, str]) -> tuple:
+        """İsteğe karşılık gelen (HTTP durumu, JSON gövde)"""
+        for recording in self.recordings.get(resource, []):
+            expected = recording.get("params", {})
+            if expected.get("pageToken") != params.get("pageToken"):
+                continue
+            if all(params.get(name) == str(value) for name, value in expected.items()):
+                return recording.get("status", 200), recording["response"]
+
+        ids = params.get("id", "")
+        if "," in ids:
+            items = []
+            for single_id in ids.split(","):
+                status, body = self.respond(resource, {**params, "id": single_id})
+                if status == 200:
+                    items.extend(body.get("items", []))
+            return 200, {"items": items}
+        return 404, {"error": {"code": 404, "message": f"Kayıtlı yanıt yok: {resource} {params}",
+                               "errors": [{"reason": "notFound"}]}}
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlsplit(self.path)
+                resource = url.path[len(API_PREFIX):] if url.path.startswith(API_PREFIX) else url.path.strip("/")
+                params = dict(parse_qsl(url.query))
+                with stub._lock:
+                    stub.requests.append((resource, params))
+                if stub.latency:
+                    time.sleep(stub.latency)
+
+                status, body = stub.respond(resource, params)
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "StubYouTubeServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubYouTubeServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def _video_id(index: int) -> str:
+    return f"video{index:05d}"
+
+
+def synthetic_recordings(videos: int = 10, comments_per_video: int = 200, page_size: int = 100,
+                         channel_id: str = "UCstubchannel") -> Dict[str, List[Dict[str, Any]]]:
+    """
+    API yanıt biçiminde sentetik bir kanal kaydı üretir
+
+    Kanal bilgisi (channels), tarih sıralı video araması (search) ve
+    yüklemeler oynatma listesi (playlistItems; 50'lik sayfalar), video
+    bilgileri (videos) ve sayfalanmış yorumlar (commentThreads) içerir.
+    """
+    thumbnails = {"default": {"url": "https://i.ytimg.com/vi/stub/default.jpg"}}
+    uploads_id = "UU" + channel_id[2:]
+    video_items = []
+    for index in range(videos):
+        video_items.append({
+            "id": _video_id(index),
+            "snippet": {
+                "title": f"Video {index}",
+                "description": f"Açıklama {index}",
+                "channelTitle": "Stub Kanal",
+                "publishedAt": f"2024-{12 - index % 12:02d}-{28 - index % 28:02d}T12:00:00Z",
+                "thumbnails": thumbnails
+            },
+            "statistics": {
+                "viewCount": str(1000 * (index + 1)),
+                "likeCount": str(50 * (index + 1)),
+                "commentCount": str(comments_per_video)
+            }
+        })
+
+    recordings: Dict[str, List[Dict[str, Any]]] = {
+        "channels": [{"params": {"mine": "true"}, "response": {"items": [{
+            "id": channel_id,
+            "snippet": {"title": "Stub Kanal", "description": "Yerel stub kanal", "publishedAt": "2020-01-01T00:00:00Z",
+                        "thumbnails": thumbnails},
+            "statistics": {"subscriberCount": "1000", "videoCount": str(videos), "viewCount": "100000"},
+            "contentDetails": {"relatedPlaylists": {"uploads": uploads_id}}
+        }]}}],
+        "search": [],
+        "playlistItems": [],
+        "videos": [],
+        "commentThreads": []
+    }
+
+    for start in range(0, max(videos, 1), 50):
+        page = video_items[start:start + 50]
+        response: Dict[str, Any] = {"items": [
+            {"id": {"kind": "youtube#video", "videoId": item["id"]}, "snippet": item["snippet"]} for item in page
+        ]}
+        if start + 50 < videos:
+            response["nextPageToken"] = f"search{start + 50}"
+        params = {"channelId": channel_id}
+        if start:
+            params["pageToken"] = f"search{start}"
+        recordings["search"].append({"params": params, "response": response})
+
+        response = {"items": [
+            {
+                "id": f"{uploads_id}-{item['id']}",
+                "snippet": {**item["snippet"], "resourceId": {"kind": "youtube#video", "videoId": item["id"]}},
+                "contentDetails": {"videoId": item["id"], "videoPublishedAt": item["snippet"]["publishedAt"]},
+                "status": {"privacyStatus": "public"}
+            }
+            for item in page
+        ]}
+        if start + 50 < videos:
+            response["nextPageToken"] = f"uploads{start + 50}"
+        params = {"playlistId": uploads_id}
+        if start:
+            params["pageToken"] = f"uploads{start}"
+        recordings["playlistItems"].append({"params": params, "response": response})
+
+    for index, item in enumerate(video_items):
+        recordings["videos"].append({"params": {"id": item["id"]}, "response": {"items": [item]}})
+
+        comments = generate_comments(comments_per_video, seed=index)
+        for start in range(0, max(comments_per_video, 1), page_size):
+            response = {"items": [
+                {
+                    "id": f"{item['id']}-c{start + offset}",
+                    "snippet": {"topLevelComment": {"snippet": {
+                        "authorDisplayName": comment["author"],
+                        "textDisplay": comment["text"],
+                        "likeCount": 0,
+                        "publishedAt": comment["published_at"],
+                        "updatedAt": comment["published_at"]
+                    }}}
+                }
+                for offset, comment in enumerate(comments[start:start + page_size])
+            ]}
+            if start + page_size < comments_per_video:
+                response["nextPageToken"] = f"{item['id']}-p{start + page_size}"
+            params = {"videoId": item["id"]}
+            if start:
+                params["pageToken"] = f"{item['id']}-p{start}"
+            recordings["commentThreads"].append({"params": params, "response": response})
+    return recordings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--recordings", help="Kayıt dosyası (verilmezse sentetik kanal kaydı kullanılır)")
+    parser.add_argument("--videos", type=int, default=10)
+    parser.add_argument("--comments-per-video", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    if args.recordings:
+        with open(args.recordings, encoding="utf-8") as f:
+            recordings = json.load(f)
+    else:
+        recordings = synthetic_recordings(args.videos, args.comments_per_video)
+
+    server = StubYouTubeServer(recordings, latency=args.latency_ms / 1000, port=args.port)
+    print(f"YouTube stub sunucu: {server.base_url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
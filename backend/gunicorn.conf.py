@@ -0,0 +1,75 @@
+"""
+Gunicorn ayarları - çok süreçli dağıtımda modellerin tek kopyasını paylaşır
+
+Kullanım (backend dizininden):
+    gunicorn -c gunicorn.conf.py main:app
+
+MODEL_PRELOAD=true (varsayılan) iken uygulama ana süreçte yüklenir, modeller
+worker'lar fork edilmeden önce belleğe alınır ve gc.freeze() ile çöp
+toplayıcının dışında bırakılır. Worker'lar model ağırlıklarını copy-on-write
+olarak paylaşır; N worker modelleri N kez değil bir kez yükler.
+
+SQLite bağlantıları (INFERENCE_CACHE_DB, COMMENT_STORE_DB) süreç başına ilk
+kullanımda açılır; ana süreçte açılmış bir bağlantı worker'larda kullanılmaz.
+
+Tema taksonomisini yeniden yükleme API'si yalnızca isteği alan worker'da
+çalışır; diğer worker'lar dosya değişikliğini THEME_TAXONOMY_RELOAD_INTERVAL
+ile kontrol eder (0 ise yalnızca tek worker'la kullanılmalıdır).
+"""
+import gc
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", "4"))
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+
+preload_app = os.getenv("MODEL_PRELOAD", "true").lower() in ("1", "true", "yes")
+
+# Fork öncesi tokenizer iş parçacığı havuzu başlatılmasın
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+_torch_threads = None
+
+
+def when_ready(server):
+    """Worker'lar fork edilmeden önce modelleri ana süreçte yükler"""
+    global _torch_threads
+
+    if workers > 1 and float(os.getenv("THEME_TAXONOMY_RELOAD_INTERVAL", "30")) <= 0:
+        server.log.warning("THEME_TAXONOMY_RELOAD_INTERVAL=0 iken taksonomi yeniden yükleme API'si "
+                           "yalnızca isteği alan worker'ı günceller")
+
+    if not preload_app:
+        return
+
+    from services.sentiment_service import MODEL_SPECS, sentiment_service
+
+    if sentiment_service.backend != "torch":
+        # ONNX Runtime oturumları iş parçacığı havuzlarını oluşturulurken başlatır ve fork sonrası
+        # güvenli değildir; bu durumda her worker modelleri kendisi yükler
+        server.log.warning("Model ön yüklemesi yalnızca torch arka ucunda desteklenir, atlanıyor")
+        return
+
+    import torch
+
+    # Ana süreçte OpenMP iş parçacığı havuzu başlatılmasın (fork sonrası kilitlenmeyi önler)
+    _torch_threads = torch.get_num_threads()
+    torch.set_num_threads(1)
+
+    server.log.info("Modeller worker'lar için önceden yükleniyor...")
+    # Ön yükleme MODEL_WARMUP'tan bağımsız olarak tüm modelleri paylaşılmak üzere yükler
+    sentiment_service.warm_up(list(MODEL_SPECS))
+
+    # Yüklenen nesneleri kalıcı nesil olarak işaretle; worker'lardaki GC taramaları
+    # bu sayfalara yazıp kopyalanmalarına yol açmasın
+    gc.collect()
+    gc.freeze()
+    server.log.info(f"Modeller yüklendi, {workers} worker paylaşımlı olarak başlatılıyor")
+
+
+def post_fork(server, worker):
+    """Worker'da torch iş parçacığı sayısını geri yükler"""
+    if _torch_threads:
+        import torch
+        torch.set_num_threads(int(os.getenv("INFERENCE_TORCH_THREADS", "0")) or _torch_threads)
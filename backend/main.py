@@ -1,17 +1,22 @@
 from fastapi import FastAPI, HTTPException, Depends, Header, WebSocket, WebSocketDisconnect, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
 from services.youtube_service import YouTubeService
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import os
 from dotenv import load_dotenv
 import firebase_admin
 from firebase_admin import auth, credentials
-from google.auth.transport.requests import Request
 import json
 from pathlib import Path
 from services.sentiment_service import sentiment_service
+from services.comment_records import CommentRecords
+from services.word_cloud import WordCloudMode
+from services.inference_cache import inference_cache
+from services.comment_store import comment_store
+from services.inference_executor import inference_executor, InferenceQueueFullError
 from pydantic import BaseModel
 from app.routers import csv_router, gemini
 import asyncio
@@ -74,6 +79,7 @@ class AsyncVideoAnalysisRequest(BaseModel):
     video_id: str
     max_comments: int = 100
     use_async: bool = True
+    word_cloud_mode: Optional[WordCloudMode] = None  # exact | approximate (varsayılan WORD_CLOUD_MODE)
 
 # Kimlik doğrulama fonksiyonu
 async def get_current_user(authorization: str = Header(None)) -> User:
@@ -139,6 +145,15 @@ def load_credentials():
         scopes=cred_dict['scopes']
     )
 
+async def replace_youtube_service(credentials):
+    """YouTube servisini yeni kimlik bilgileriyle oluşturur; önceki servisin HTTP bağlantıları kapatılır"""
+    global youtube_service, youtube_credentials
+    previous = youtube_service
+    youtube_credentials = credentials
+    youtube_service = YouTubeService(credentials, on_token_refresh=save_credentials)
+    if previous is not None:
+        await previous.api.aclose()
+
 # OAuth2 akışı
 flow = Flow.from_client_secrets_file(
     'client_secrets.json',
@@ -198,9 +213,7 @@ async def google_auth_callback(code: str):
         # Kimlik bilgilerini kaydediyoruz
         save_credentials(credentials)
         
-        global youtube_service, youtube_credentials
-        youtube_credentials = credentials
-        youtube_service = YouTubeService(credentials)
+        await replace_youtube_service(credentials)
         print("YouTube servisi başarıyla başlatıldı")
         
         return {"message": "YouTube kimlik doğrulaması başarılı"}
@@ -220,18 +233,12 @@ async def get_channel_info():
         if not youtube_service or not youtube_credentials:
             credentials = load_credentials()
             if credentials:
-                youtube_credentials = credentials
-                youtube_service = YouTubeService(credentials)
+                await replace_youtube_service(credentials)
             else:
                 print("YouTube servisi veya kimlik bilgileri bulunamadı")
                 raise HTTPException(status_code=401, detail="YouTube kimlik doğrulaması gerekli")
             
-        # Token'ın geçerliliğini kontrol et
-        if youtube_credentials.expired:
-            print("Token süresi dolmuş, yeniliyor...")
-            youtube_credentials.refresh(Request())
-            save_credentials(youtube_credentials)  # Yenilenen token'ı kaydet
-            youtube_service = YouTubeService(youtube_credentials)
+        # Süresi dolan token, API istemcisi tarafından ilk istekte iş parçacığında yenilenir ve kaydedilir
             
         channel_info = await youtube_service.get_channel_info()
         return channel_info
@@ -280,21 +287,18 @@ async def get_sentiment_analysis():
         # YouTube yorumlarını al
         comments = await youtube_service.get_recent_comments()
         
-        # Yorumları analiz et
-        analyzed_comments = sentiment_service.analyze_comments(comments)
-        
-        # İstatistikleri hesapla
-        sentiment_stats = sentiment_service.get_sentiment_stats(analyzed_comments)
-        
-        # Kelime bulutu oluştur
-        word_cloud = sentiment_service.get_word_cloud(analyzed_comments)
+        # Yorumları analiz et (event loop dışında)
+        records, sentiment_stats, word_cloud, _ = \
+            await sentiment_service.analyze_and_summarize_async(comments)
         
         return {
-            "comments": analyzed_comments,
+            "comments": records.to_dicts(),
             "sentiment_stats": sentiment_stats,
             "word_cloud": word_cloud
         }
         
+    except InferenceQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -302,10 +306,12 @@ async def get_sentiment_analysis():
 class VideoAnalysisRequest(BaseModel):
     video_id: str
     max_comments: int = 100
+    word_cloud_mode: Optional[WordCloudMode] = None  # exact | approximate (varsayılan WORD_CLOUD_MODE)
 
 class ChannelAnalysisRequest(BaseModel):
     max_videos: int = 10
     max_comments_per_video: int = 50
+    word_cloud_mode: Optional[WordCloudMode] = None
 
 @app.post("/api/youtube/analyze-video")
 async def analyze_video_comments(
@@ -320,26 +326,24 @@ async def analyze_video_comments(
         if not youtube_service or not youtube_credentials:
             credentials = load_credentials()
             if credentials:
-                youtube_credentials = credentials
-                youtube_service = YouTubeService(credentials)
+                await replace_youtube_service(credentials)
             else:
                 raise HTTPException(status_code=401, detail="YouTube kimlik doğrulaması gerekli")
         
-        # Token'ın geçerliliğini kontrol et
-        if youtube_credentials.expired:
-            youtube_credentials.refresh(Request())
-            save_credentials(youtube_credentials)
-            youtube_service = YouTubeService(youtube_credentials)
+        # Süresi dolan token, API istemcisi tarafından ilk istekte iş parçacığında yenilenir ve kaydedilir
         
         # Video analizini yap
         result = await youtube_service.analyze_video_comments(
             request.video_id,
             current_user.uid,
-            request.max_comments
+            request.max_comments,
+            request.word_cloud_mode
         )
         
         return result
         
+    except InferenceQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         print(f"Video analizi hatası: {str(e)}")
         import traceback
@@ -359,26 +363,24 @@ async def analyze_channel_comments(
         if not youtube_service or not youtube_credentials:
             credentials = load_credentials()
             if credentials:
-                youtube_credentials = credentials
-                youtube_service = YouTubeService(credentials)
+                await replace_youtube_service(credentials)
             else:
                 raise HTTPException(status_code=401, detail="YouTube kimlik doğrulaması gerekli")
         
-        # Token'ın geçerliliğini kontrol et
-        if youtube_credentials.expired:
-            youtube_credentials.refresh(Request())
-            save_credentials(youtube_credentials)
-            youtube_service = YouTubeService(youtube_credentials)
+        # Süresi dolan token, API istemcisi tarafından ilk istekte iş parçacığında yenilenir ve kaydedilir
         
         # Kanal analizini yap
         result = await youtube_service.analyze_channel_comments(
             current_user.uid,
             request.max_videos,
-            request.max_comments_per_video
+            request.max_comments_per_video,
+            request.word_cloud_mode
         )
         
         return result
         
+    except InferenceQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         print(f"Kanal analizi hatası: {str(e)}")
         import traceback
@@ -445,16 +447,11 @@ async def get_user_profile_info(
         if not youtube_service or not youtube_credentials:
             credentials = load_credentials()
             if credentials:
-                youtube_credentials = credentials
-                youtube_service = YouTubeService(credentials)
+                await replace_youtube_service(credentials)
             else:
                 raise HTTPException(status_code=401, detail="YouTube kimlik doğrulaması gerekli")
         
-        # Token'ın geçerliliğini kontrol et
-        if youtube_credentials.expired:
-            youtube_credentials.refresh(Request())
-            save_credentials(youtube_credentials)
-            youtube_service = YouTubeService(youtube_credentials)
+        # Süresi dolan token, API istemcisi tarafından ilk istekte iş parçacığında yenilenir ve kaydedilir
         
         # YouTube kanal bilgilerini getir
         channel_info = await youtube_service.get_channel_info()
@@ -487,16 +484,11 @@ async def get_channel_statistics(
         if not youtube_service or not youtube_credentials:
             credentials = load_credentials()
             if credentials:
-                youtube_credentials = credentials
-                youtube_service = YouTubeService(credentials)
+                await replace_youtube_service(credentials)
             else:
                 raise HTTPException(status_code=401, detail="YouTube kimlik doğrulaması gerekli")
         
-        # Token'ın geçerliliğini kontrol et
-        if youtube_credentials.expired:
-            youtube_credentials.refresh(Request())
-            save_credentials(youtube_credentials)
-            youtube_service = YouTubeService(youtube_credentials)
+        # Süresi dolan token, API istemcisi tarafından ilk istekte iş parçacığında yenilenir ve kaydedilir
         
         # Kanal istatistiklerini getir
         channel_stats = await youtube_service.get_channel_statistics()
@@ -528,10 +520,87 @@ async def get_user_analysis_summary(
         print(f"Analiz özeti getirme hatası: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Analiz özeti getirilemedi: {str(e)}")
 
+@app.get("/api/cache/stats")
+async def get_cache_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """Analiz sonuçları önbelleğinin isabet/ıska istatistiklerini getirir"""
+    return inference_cache.stats()
+
+@app.get("/api/comments/store/stats")
+async def get_comment_store_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """Yorum deposunun boyutunu ve tam/artımlı senkronizasyon sayaçlarını getirir"""
+    return comment_store.stats()
+
+@app.get("/api/inference/stats")
+async def get_inference_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """Çıkarım kuyruğu, mikro-batch ve dil bazında verimlilik istatistiklerini getirir"""
+    return {
+        "executor": inference_executor.stats(),
+        "micro_batcher": sentiment_service.micro_batcher.stats(),
+        "languages": sentiment_service.language_stats()
+    }
+
+@app.get("/api/themes/taxonomy")
+async def get_theme_taxonomy(
+    current_user: User = Depends(get_current_user)
+):
+    """Geçerli tema taksonomisini getirir"""
+    return sentiment_service.taxonomy.to_dict()
+
+@app.post("/api/themes/taxonomy/reload")
+async def reload_theme_taxonomy(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Tema taksonomisini dosyadan yeniden yükler (süreç ve modeller yeniden başlatılmaz)
+    
+    Yalnızca isteği alan worker hemen yeniden yükler; diğer worker'lar dosya değişikliğini
+    THEME_TAXONOMY_RELOAD_INTERVAL saniye içinde kendileri alır.
+    """
+    try:
+        return sentiment_service.reload_taxonomy()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @app.get("/")
 async def root():
     return {"message": "CommsItumo API'ye Hoş Geldiniz!"}
 
+@app.on_event("startup")
+async def start_model_warmup():
+    """Modelleri arka planda ısındırır; API bu sırada istekleri kabul etmeye devam eder"""
+    if sentiment_service.warmup_models:
+        asyncio.get_running_loop().run_in_executor(None, sentiment_service.warm_up)
+
+@app.on_event("shutdown")
+async def close_youtube_service():
+    """YouTube API istemcisinin bağlantılarını kapatır"""
+    if youtube_service is not None:
+        await youtube_service.api.aclose()
+
+@app.get("/health")
+async def health_check():
+    """Uygulamanın ayakta olup olmadığını döndürür"""
+    return {"status": "ok"}
+
+@app.get("/health/ready")
+async def readiness_check():
+    """
+    Isındırılan modeller yüklendiğinde 200, aksi halde 503 döndürür
+
+    MODEL_WARMUP=false ise beklenecek model yoktur ve servis hemen hazırdır;
+    modellerin bellekte olup olmadığı models_hot alanında raporlanır.
+    """
+    status = sentiment_service.model_status()
+    if not status["ready"]:
+        return JSONResponse(status_code=503, content=status)
+    return status
+
 # Router'ları ekle
 app.include_router(csv_router.router, prefix="/api/csv", tags=["csv"])
 app.include_router(gemini.router, prefix="/api/gemini", tags=["gemini"])
@@ -567,7 +636,8 @@ async def background_video_analysis(
     video_id: str, 
     user_id: str, 
     max_comments: int,
-    task_id: str
+    task_id: str,
+    word_cloud_mode: Optional[WordCloudMode] = None
 ):
     """Background'da video analizi yapar ve progress bilgisi gönderir"""
     try:
@@ -647,15 +717,21 @@ async def background_video_analysis(
         if not youtube_service.sentiment_enabled or not youtube_service.sentiment_service:
             raise Exception("Sentiment servis aktif değil")
         
-        # Batch processing ile analiz
+        # Batch processing ile analiz; sonuçlar kompakt kayıtlarda, istatistikler
+        # her parçada güncellenen birleştirilebilir birikimde toplanır
         chunk_size = 20
-        analyzed_comments = []
+        analyzed_comments = CommentRecords()
+        live_stats = youtube_service.sentiment_service.create_accumulator()
         total_chunks = len(comments) // chunk_size + (1 if len(comments) % chunk_size else 0)
         
         for i in range(0, len(comments), chunk_size):
             chunk = comments[i:i + chunk_size]
-            chunk_analyzed = youtube_service.sentiment_service.analyze_comments(chunk)
-            analyzed_comments.extend(chunk_analyzed)
+            chunk_start = len(analyzed_comments)
+            await youtube_service.sentiment_service.analyze_comment_records_async(chunk, analyzed_comments)
+            # Birikim güncellemesi (tokenlama dahil) event loop'u bloklamamak için çıkarım iş parçacığında
+            await inference_executor.run(
+                youtube_service.sentiment_service.accumulate, analyzed_comments, live_stats, chunk_start
+            )
             
             # Progress update
             current_chunk = i // chunk_size + 1
@@ -667,7 +743,8 @@ async def background_video_analysis(
                 "message": f"Analiz ediliyor... ({current_chunk}/{total_chunks} batch) - {len(analyzed_comments)} yorum tamamlandı",
                 "step": "Sentiment Analizi",
                 "processed_comments": len(analyzed_comments),
-                "total_comments": len(comments)
+                "total_comments": len(comments),
+                "live_stats": live_stats.sentiment_stats()
             })
             
             # Kısa bekleme
@@ -682,8 +759,11 @@ async def background_video_analysis(
             "step": "İstatistikler"
         })
         
-        sentiment_stats = youtube_service.sentiment_service.get_sentiment_stats(analyzed_comments)
-        word_cloud = youtube_service.sentiment_service.get_word_cloud(analyzed_comments)
+        # İstatistikler parçalar boyunca biriktirildi; yorumlar yeniden taranmaz
+        sentiment_stats = live_stats.sentiment_stats()
+        word_cloud = await inference_executor.run(
+            youtube_service.sentiment_service.get_word_cloud, analyzed_comments, mode=word_cloud_mode
+        )
         
         # Firestore'a kaydet
         await manager.send_progress(user_id, {
@@ -694,12 +774,14 @@ async def background_video_analysis(
             "step": "Kaydetme"
         })
         
+        # Yorumların JSON biçimi yalnızca dışarı gönderilirken (Firestore, WebSocket) bir kez üretilir
+        comment_dicts = analyzed_comments.to_dicts()
         analysis_result = {
             'video_id': video_id,
             'video_title': video_info.get('title', 'Bilinmeyen Video'),
             'sentiment_stats': sentiment_stats,
             'word_cloud': word_cloud,
-            'comments': analyzed_comments
+            'comments': comment_dicts
         }
         
         analysis_id = None
@@ -725,6 +807,7 @@ async def background_video_analysis(
             }
         }
         
+        # Görev deposunda kompakt kayıtlar tutulur; durum sorgusunda JSON biçimine çevrilir
         background_tasks_storage[task_id] = {"status": "completed", "result": result}
         
         # Tamamlandı mesajı
@@ -734,7 +817,7 @@ async def background_video_analysis(
             "progress": 100,
             "message": f"Analiz tamamlandı! {len(analyzed_comments)} yorum analiz edildi.",
             "step": "Tamamlandı",
-            "result": result,
+            "result": {**result, 'comments': comment_dicts},
             "final_stats": {
                 "positive": sentiment_stats['categories']['positive'],
                 "negative": sentiment_stats['categories']['negative'],
@@ -768,15 +851,11 @@ async def analyze_video_async(
         if not youtube_service or not youtube_credentials:
             credentials = load_credentials()
             if credentials:
-                youtube_credentials = credentials
-                youtube_service = YouTubeService(credentials)
+                await replace_youtube_service(credentials)
             else:
                 raise HTTPException(status_code=401, detail="YouTube kimlik doğrulaması gerekli")
         
-        if youtube_credentials.expired:
-            youtube_credentials.refresh(Request())
-            save_credentials(youtube_credentials)
-            youtube_service = YouTubeService(youtube_credentials)
+        # Süresi dolan token, API istemcisi tarafından ilk istekte iş parçacığında yenilenir ve kaydedilir
         
         # Task ID oluştur
         task_id = str(uuid.uuid4())
@@ -787,7 +866,8 @@ async def analyze_video_async(
             request.video_id,
             current_user.uid,
             request.max_comments,
-            task_id
+            task_id,
+            request.word_cloud_mode
         )
         
         return {
@@ -803,7 +883,12 @@ async def analyze_video_async(
 async def get_analysis_status(task_id: str):
     """Background task durumunu kontrol eder"""
     if task_id in background_tasks_storage:
-        return background_tasks_storage[task_id]
+        task = background_tasks_storage[task_id]
+        comments = task.get("result", {}).get("comments")
+        if isinstance(comments, CommentRecords):
+            # Kompakt kayıtlar API sınırında yorum listesine çevrilir
+            task = {**task, "result": {**task["result"], "comments": comments.to_dicts()}}
+        return task
     else:
         return {"status": "not_found", "message": "Task bulunamadı"}
 
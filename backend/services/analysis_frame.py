@@ -0,0 +1,257 @@
+import operator
+from itertools import chain
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+CATEGORIES = ("positive", "negative", "neutral")
+CATEGORY_CODES = {category: code for code, category in enumerate(CATEGORIES)}
+
+# Tema analizinde "temada geçiyor" sayılmak için eşik
+THEME_THRESHOLD = 0.05
+
+
+def sequential_sum(values: np.ndarray) -> float:
+    """
+    Değerleri soldan sağa toplar
+
+    np.sum ikili (pairwise) toplama kullandığından Python döngüsüyle son
+    basamakta farklı sonuç verebilir; cumsum sıralı topladığından son elemanı
+    döngüdeki toplamla birebir aynıdır.
+    """
+    if values.size == 0:
+        return 0
+    return float(np.cumsum(values)[-1])
+
+
+def _float_column(values: Sequence[float]) -> np.ndarray:
+    """Python sayı listesini float64 diziye çevirir"""
+    return np.fromiter(values, dtype=np.float64, count=len(values))
+
+
+def _field(records: Sequence[Dict[str, Any]], key: str, default: Any) -> List[Any]:
+    """
+    Sözlük listesinden tek bir alanı çıkarır
+
+    Alan tüm kayıtlarda varsa C düzeyinde itemgetter ile okunur; eksik kayıt
+    varsa (ör. hatalı analiz sonucu) varsayılan değerle tekrar okunur.
+    """
+    try:
+        return list(map(operator.itemgetter(key), records))
+    except KeyError:
+        return [record.get(key, default) for record in records]
+
+
+def _comment_theme_dict(comment: Dict[str, Any]) -> Dict[str, float]:
+    """Hem doğrudan theme alanını hem de sentiment altındaki theme alanını kontrol eder"""
+    themes = comment.get('theme', {})
+    if not themes and 'sentiment' in comment:
+        themes = comment['sentiment'].get('theme', {})
+    return themes
+
+
+class ThemeScores:
+    """
+    Yorum x tema skorlarının seyrek (sparse) gösterimi
+
+    Tema sözlüklerindeki her hücre, yorumlar ve sözlük sırası korunarak düz
+    dizilere alınır: columns[k] hücrenin tema indeksi, values[k] skoru.
+    Sıranın korunması, sözlük tabanlı hesaplamadaki ilk görülme sırasını ve
+    soldan sağa toplamları birebir elde etmeyi sağlar.
+    """
+
+    def __init__(self, themes: Sequence[str], columns: np.ndarray, values: np.ndarray):
+        self.themes: List[str] = list(themes)
+        self.columns = columns
+        self.values = values
+
+    @classmethod
+    def from_dicts(cls, theme_dicts: Sequence[Dict[str, float]]) -> 'ThemeScores':
+        """Yorum başına tema sözlüklerinden oluşturur"""
+        keys = list(chain.from_iterable(theme_dicts))
+        values = list(chain.from_iterable(map(dict.values, theme_dicts)))
+
+        # Sütun indeksleri temaların ilk görülme sırasıdır
+        themes = list(dict.fromkeys(keys))
+        index = {theme: column for column, theme in enumerate(themes)}
+        columns = np.fromiter(map(index.__getitem__, keys), dtype=np.intp, count=len(keys))
+        return cls(themes, columns, _float_column(values))
+
+    def counts(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Her temada maskedeki (maske yoksa tüm) hücre sayısı"""
+        columns = self.columns if mask is None else self.columns[mask]
+        return np.bincount(columns, minlength=len(self.themes))
+
+    def first_seen_order(self, mask: Optional[np.ndarray] = None) -> List[int]:
+        """Maskedeki hücrelerin sözlükleri sırayla gezerken ilk görüldüğü sıraya göre tema indeksleri"""
+        columns = self.columns if mask is None else self.columns[mask]
+        present, first = np.unique(columns, return_index=True)
+        return [int(column) for column in present[np.argsort(first)]]
+
+    def column_values(self, mask: Optional[np.ndarray] = None) -> Dict[int, List[float]]:
+        """Tema indeksi -> maskedeki skorlar (yorum sırasıyla)"""
+        columns = self.columns if mask is None else self.columns[mask]
+        values = self.values if mask is None else self.values[mask]
+        order = np.argsort(columns, kind='stable')
+        present, starts = np.unique(columns[order], return_index=True)
+        groups = np.split(values[order], starts[1:])
+        return {int(column): group.tolist() for column, group in zip(present, groups)}
+
+
+class AnalysisFrame:
+    """
+    Analiz edilmiş yorumların sütunlu (columnar) gösterimi
+
+    İç içe sözlüklerden polarite, güven, kategori/dil kodları,
+    detaylı skorlar ve seyrek tema skorları NumPy dizilerine alınır; istatistikler
+    ve histogramlar bu diziler üzerinde vektörel olarak hesaplanır.
+    """
+
+    def __init__(self, comments: List[Dict[str, Any]]):
+        self.total = len(comments)
+        self._comments = comments
+        self._texts: Optional[List[Any]] = None
+
+        # Her alan ayrı ayrı ve mümkünse C düzeyinde çıkarılır (tek döngüde append'ten hızlı)
+        sentiments = _field(comments, 'sentiment', {})
+        categories = _field(sentiments, 'category', 'neutral')
+        self.unknown_category: Optional[str] = None
+        if not CATEGORY_CODES.keys() >= set(categories):
+            self.unknown_category = next(category for category in categories if category not in CATEGORY_CODES)
+        self.category_codes = np.fromiter((CATEGORY_CODES.get(category, -1) for category in categories),
+                                          dtype=np.int8, count=len(categories))
+
+        self.polarity = _float_column(_field(sentiments, 'polarity', 0))
+        self.confidence = _float_column(_field(sentiments, 'confidence', 0))
+
+        # Detaylı skorlar n x 3 matris: pozitif, negatif, nötr
+        detailed = _field(sentiments, 'detailed_scores', {})
+        self.detailed = np.column_stack([
+            _float_column(_field(detailed, key, 0))
+            for key in ('positive_score', 'negative_score', 'neutral_score')
+        ]) if detailed else np.zeros((0, 3))
+
+        languages = _field(sentiments, 'language', 'en')
+        self.languages: List[str] = list(dict.fromkeys(languages))
+        language_index = {language: code for code, language in enumerate(self.languages)}
+        self.language_codes = np.fromiter(map(language_index.__getitem__, languages),
+                                          dtype=np.int32, count=len(languages))
+
+        # İstatistikler duygu sonucundaki temayı, tema analizi yorumun temasını kullanır
+        sentiment_themes = _field(sentiments, 'theme', {})
+        own_themes = _field(comments, 'theme', {})
+        self._sentiment_theme_dicts = sentiment_themes
+        self._comment_theme_dicts = own_themes
+        self._shared_themes = all(map(operator.is_, own_themes, sentiment_themes))
+        if not self._shared_themes:
+            self._comment_theme_dicts = [themes or _comment_theme_dict(comment)
+                                         for themes, comment in zip(own_themes, comments)]
+        self._sentiment_themes: Optional[ThemeScores] = None
+        self._comment_themes: Optional[ThemeScores] = None
+
+    @classmethod
+    def from_records(cls, records, start: int = 0, stop: Optional[int] = None) -> 'AnalysisFrame':
+        """
+        Kompakt yorum kayıtlarından (CommentRecords) sözlüklere dönüştürmeden oluşturur
+
+        Kayıtlar zaten sütunlu olduğundan diziler doğrudan kopyalanır; start/stop
+        verilirse yalnızca o aralıktaki yorumlar alınır (ör. son eklenen parça).
+        """
+        start, stop, _ = slice(start, stop).indices(len(records))
+        stop = max(start, stop)
+        frame = cls([])
+        frame.total = stop - start
+        frame._texts = records.texts[start:stop] if start or stop < len(records) else records.texts
+
+        codes = np.array(records.category_codes[start:stop], dtype=np.int8)
+        unknown = codes >= len(CATEGORIES)
+        if unknown.any():
+            frame.unknown_category = records.categories.values[codes[unknown][0]]
+        frame.category_codes = np.where(unknown, -1, codes).astype(np.int8)
+
+        frame.polarity = np.array(records.polarity[start:stop], dtype=np.float64)
+        frame.confidence = np.array(records.confidence[start:stop], dtype=np.float64)
+        frame.detailed = np.array(records.detailed_scores[start * 3:stop * 3], dtype=np.float64).reshape(-1, 3)
+        frame.languages = list(records.languages.values)
+        frame.language_codes = np.array(records.language_codes[start:stop], dtype=np.int32)
+
+        # Yorum teması tüm kayıtlarda vardır; hatalı analizlerin duygu sonucunda tema yoktur
+        offsets = np.array(records.theme_offsets[start:stop + 1], dtype=np.intp)
+        first, last = int(offsets[0]), int(offsets[-1])
+        columns = np.array(records.theme_codes[first:last], dtype=np.intp)
+        values = np.array(records.theme_scores[first:last], dtype=np.float64)
+        frame._comment_themes = ThemeScores(records.themes.values, columns, values)
+        frame._sentiment_themes = frame._comment_themes
+        errors = [index - start for index in records.errors if start <= index < stop]
+        if errors:
+            analyzed = np.ones(frame.total, dtype=bool)
+            analyzed[errors] = False
+            cells = np.repeat(analyzed, np.diff(offsets))
+            frame._sentiment_themes = ThemeScores(records.themes.values, columns[cells], values[cells])
+        return frame
+
+    @property
+    def texts(self) -> List[Any]:
+        """Yorum metinleri (ilk kullanımda çıkarılır)"""
+        if self._texts is None:
+            self._texts = _field(self._comments, 'text', '')
+        return self._texts
+
+    @property
+    def sentiment_themes(self) -> ThemeScores:
+        """Duygu sonuçlarındaki tema skorları (ilk kullanımda oluşturulur)"""
+        if self._sentiment_themes is None:
+            self._sentiment_themes = ThemeScores.from_dicts(self._sentiment_theme_dicts)
+        return self._sentiment_themes
+
+    @property
+    def comment_themes(self) -> ThemeScores:
+        """Yorum temalarının skorları; duygu temalarıyla aynı nesnelerse paylaşılır"""
+        if self._comment_themes is None:
+            self._comment_themes = (self.sentiment_themes if self._shared_themes
+                                    else ThemeScores.from_dicts(self._comment_theme_dicts))
+        return self._comment_themes
+
+    def category_counts(self) -> Dict[str, int]:
+        """Kategori bazında yorum sayıları"""
+        if self.unknown_category is not None:
+            raise KeyError(self.unknown_category)
+        counts = np.bincount(self.category_codes, minlength=len(CATEGORIES))
+        return {category: int(counts[code]) for code, category in enumerate(CATEGORIES)}
+
+    def language_counts(self) -> Dict[str, int]:
+        """Dil dağılımı; "tr" ve "en" her zaman ilk sırada, diğerleri ilk görülme sırasıyla"""
+        counts = np.bincount(self.language_codes, minlength=len(self.languages))
+        result = {"tr": 0, "en": 0}
+        for code, language in enumerate(self.languages):
+            result[language] = int(counts[code])
+        return result
+
+    def confidence_histogram(self) -> Dict[str, int]:
+        """Güven dağılımı (>0.8, 0.5-0.8, <0.5)"""
+        high = self.confidence > 0.8
+        medium = ~high & (self.confidence > 0.5)
+        return {
+            "high": int(high.sum()),
+            "medium": int(medium.sum()),
+            "low": int(self.total - high.sum() - medium.sum())
+        }
+
+    def polarity_histogram(self) -> Dict[str, int]:
+        """Polarite dağılımı (beş kova)"""
+        # Eşikler büyükten küçüğe: her yorum geçtiği ilk eşiğin kovasına düşer
+        buckets = np.select(
+            [self.polarity > 0.5, self.polarity > 0.1, self.polarity > -0.1, self.polarity > -0.5],
+            [0, 1, 2, 3],
+            default=4
+        )
+        counts = np.bincount(buckets, minlength=5)
+        names = ["strongly_positive", "moderately_positive", "neutral", "moderately_negative", "strongly_negative"]
+        return {name: int(counts[index]) for index, name in enumerate(names)}
+
+    def theme_counts(self) -> Dict[str, int]:
+        """Duygu sonuçlarında eşiği aşan yorum sayısı; temalar ilk eşiği aştıkları sırayla"""
+        scores = self.sentiment_themes
+        mask = scores.values > THEME_THRESHOLD
+        counts = scores.counts(mask)
+        return {scores.themes[column]: int(counts[column]) for column in scores.first_seen_order(mask)}
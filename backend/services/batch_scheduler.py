@@ -0,0 +1,83 @@
+from typing import Any, Callable, Dict, List, Sequence
+
+
+def token_lengths(tokenizer: Any, texts: Sequence[str]) -> List[int]:
+    """Metinlerin tokenizer'a göre token uzunluklarını (özel tokenlar dahil) döndürür"""
+    if not texts:
+        return []
+    encoded = tokenizer(list(texts), add_special_tokens=True, truncation=True)
+    return [len(ids) for ids in encoded["input_ids"]]
+
+
+def plan_token_budget_batches(lengths: Sequence[int], max_tokens: int, max_batch_size: int) -> List[List[int]]:
+    """
+    Uzunluk bazlı (length-bucketed) dinamik batch planı oluşturur
+
+    Girdiler uzunluğa göre büyükten küçüğe sıralanır ve her batch'in padding
+    dahil maliyeti (batch boyutu x en uzun girdi) token bütçesini aşmayacak
+    şekilde açgözlü olarak doldurulur. Bütçeden uzun tek bir girdi kendi
+    batch'ini oluşturur.
+
+    Args:
+        lengths: Her girdinin token uzunluğu
+        max_tokens: Batch başına padding dahil token bütçesi
+        max_batch_size: Batch başına maksimum girdi sayısı
+
+    Returns:
+        List[List[int]]: Her batch için orijinal girdi indeksleri
+    """
+    max_batch_size = max(1, max_batch_size)
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+
+    batches = []
+    current: List[int] = []
+    current_max = 0
+    for index in order:
+        length = lengths[index]
+        padded_length = max(current_max, length)
+        if current and (len(current) >= max_batch_size or (len(current) + 1) * padded_length > max_tokens):
+            batches.append(current)
+            current = []
+            padded_length = length
+        current.append(index)
+        current_max = padded_length
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def plan_fixed_batches(count: int, batch_size: int) -> List[List[int]]:
+    """Girdileri sırasını bozmadan sabit boyutlu batch'lere böler"""
+    batch_size = max(1, batch_size)
+    return [list(range(i, min(i + batch_size, count))) for i in range(0, count, batch_size)]
+
+
+def padding_stats(lengths: Sequence[int], batches: Sequence[Sequence[int]]) -> Dict[str, Any]:
+    """Bir batch planı için gerçek/padding token sayılarını ve padding israfını hesaplar"""
+    real_tokens = 0
+    padded_tokens = 0
+    for batch in batches:
+        if not batch:
+            continue
+        batch_lengths = [lengths[i] for i in batch]
+        real_tokens += sum(batch_lengths)
+        padded_tokens += len(batch_lengths) * max(batch_lengths)
+
+    return {
+        "batches": len(batches),
+        "real_tokens": real_tokens,
+        "padded_tokens": padded_tokens,
+        "padding_waste": round(1 - real_tokens / padded_tokens, 4) if padded_tokens else 0.0
+    }
+
+
+def run_batches(items: Sequence[Any], batches: Sequence[Sequence[int]],
+                run_batch: Callable[[List[Any]], List[Any]]) -> List[Any]:
+    """Batch planını çalıştırır ve sonuçları girdilerin orijinal sırasına geri dağıtır"""
+    results: List[Any] = [None] * len(items)
+    for batch in batches:
+        outputs = run_batch([items[i] for i in batch])
+        for index, output in zip(batch, outputs):
+            results[index] = output
+    return results
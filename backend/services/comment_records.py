@@ -0,0 +1,196 @@
+from array import array
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Union
+
+from services.analysis_frame import CATEGORIES
+
+SENTENCE_SENTIMENTS = ("positive", "negative", "neutral")
+
+
+class CodeTable:
+    """Tekrarlanan değerleri (kategori, dil, tema, video) küçük tamsayı kodlarına eşler"""
+
+    def __init__(self, initial: Sequence[Hashable] = ()):
+        self.values: List[Any] = list(initial)
+        self._codes: Dict[Hashable, int] = {value: code for code, value in enumerate(self.values)}
+
+    def code(self, value: Hashable) -> int:
+        """Değerin kodunu döndürür; ilk kez görülen değer tabloya eklenir"""
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class CommentRecords:
+    """
+    Analiz edilmiş yorumların kompakt, sütunlu (struct-of-arrays) gösterimi
+
+    Yorum başına iç içe sözlükler yerine alanlar tip kodlu dizilerde (array)
+    tutulur; kategori, dil, tema ve video bilgileri kod tablolarıyla
+    tekilleştirilir, cümle metinleri yorum metnindeki başlangıç/bitiş
+    konumları olarak saklanır ve tema skorları tek kopya halinde tutulur.
+    API'nin beklediği sözlük biçimi yalnızca yanıt oluşturulurken to_dicts
+    ile üretilir.
+    """
+
+    def __init__(self):
+        # Yorum alanları
+        self.ids: List[Any] = []
+        self.texts: List[Any] = []
+        self.authors: List[Any] = []
+        self.dates: List[Any] = []
+        self.video_codes = array('i')
+
+        # Yorum bazlı duygu sonuçları
+        self.polarity = array('d')
+        self.confidence = array('d')
+        self.category_codes = array('b')
+        self.language_codes = array('b')
+        self.detailed_scores = array('d')  # yorum başına pozitif, negatif, nötr
+        self.detailed_counts = array('i')  # yorum başına pozitif, negatif, nötr cümle sayısı
+
+        # Cümle analizleri (düz diziler; i. yorumun cümleleri sentence_offsets[i]:sentence_offsets[i + 1])
+        self.sentence_offsets = array('i', [0])
+        self.sentence_spans = array('i')  # başlangıç, bitiş; metinde bulunamayan cümlede -1, -1
+        self.sentence_codes = array('b')
+        self.sentence_scores = array('d')
+        self.sentence_literals: Dict[int, str] = {}
+
+        # Tema skorları (düz diziler; sözlükteki sıra korunur)
+        self.theme_offsets = array('i', [0])
+        self.theme_codes = array('h')
+        self.theme_scores = array('d')
+
+        # Hata veren analizler: yorum indeksi -> hata mesajı (bunlarda cümle ve duygu teması yoktur)
+        self.errors: Dict[int, str] = {}
+
+        self.categories = CodeTable(CATEGORIES)
+        self.sentence_sentiments = CodeTable(SENTENCE_SENTIMENTS)
+        self.languages = CodeTable()
+        self.themes = CodeTable()
+        self.videos = CodeTable()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, comment: Dict[str, Any], sentiment: Dict[str, Any], theme: Dict[str, float]):
+        """
+        Yorumu, duygu sonucunu ve tema skorlarını kayıtlara ekler
+
+        Tüm değerler önce okunur ve dizilere ancak sonra yazılır; böylece
+        hatalı bir sonuç kayıtları yarım bırakmaz (yorum atlanabilir).
+        """
+        text = comment.get('text')
+        detailed = sentiment.get('detailed_scores', {})
+        scores = array('d', (detailed.get('positive_score', 0), detailed.get('negative_score', 0),
+                             detailed.get('neutral_score', 0)))
+        counts = array('i', (detailed.get('positive_count', 0), detailed.get('negative_count', 0),
+                             detailed.get('neutral_count', 0)))
+        polarity = float(sentiment.get('polarity', 0))
+        confidence = float(sentiment.get('confidence', 0))
+
+        # Cümle metinleri yorum metninde sırayla aranır; bulunanlar yalnızca konum olarak saklanır
+        sentences = []
+        cursor = 0
+        for analysis in sentiment.get('sentence_analyses', []):
+            sentence = analysis['text']
+            start = text.find(sentence, cursor) if isinstance(text, str) and isinstance(sentence, str) else -1
+            if start >= 0:
+                cursor = start + len(sentence)
+            sentences.append((start, cursor, sentence, analysis['sentiment'], float(analysis['score'])))
+        theme_scores = array('d', theme.values())
+
+        index = len(self.ids)
+        self.ids.append(comment.get('id'))
+        self.texts.append(text)
+        self.authors.append(comment.get('author'))
+        self.dates.append(comment.get('published_at'))
+        self.video_codes.append(self.videos.code((comment.get('video_id'), comment.get('video_title'))))
+
+        self.polarity.append(polarity)
+        self.confidence.append(confidence)
+        self.category_codes.append(self.categories.code(sentiment.get('category', 'neutral')))
+        self.language_codes.append(self.languages.code(sentiment.get('language', 'en')))
+        self.detailed_scores.extend(scores)
+        self.detailed_counts.extend(counts)
+        if 'error' in sentiment:
+            self.errors[index] = sentiment['error']
+
+        for start, end, sentence, label, score in sentences:
+            if start < 0:
+                self.sentence_literals[len(self.sentence_codes)] = sentence
+                start = end = -1
+            self.sentence_spans.extend((start, end))
+            self.sentence_codes.append(self.sentence_sentiments.code(label))
+            self.sentence_scores.append(score)
+        self.sentence_offsets.append(len(self.sentence_codes))
+
+        self.theme_codes.extend(self.themes.code(name) for name in theme)
+        self.theme_scores.extend(theme_scores)
+        self.theme_offsets.append(len(self.theme_codes))
+
+    def to_dict(self, index: int) -> Dict[str, Any]:
+        """Kaydı analiz edilmiş yorumun API (JSON) biçimine çevirir"""
+        text = self.texts[index]
+        themes = self.themes.values
+        start, end = self.theme_offsets[index], self.theme_offsets[index + 1]
+        theme = {themes[code]: score for code, score in zip(self.theme_codes[start:end], self.theme_scores[start:end])}
+
+        detailed_scores = {
+            "positive_score": self.detailed_scores[index * 3],
+            "negative_score": self.detailed_scores[index * 3 + 1],
+            "neutral_score": self.detailed_scores[index * 3 + 2],
+            "positive_count": self.detailed_counts[index * 3],
+            "negative_count": self.detailed_counts[index * 3 + 1],
+            "neutral_count": self.detailed_counts[index * 3 + 2]
+        }
+        sentiment = {
+            "polarity": self.polarity[index],
+            "category": self.categories.values[self.category_codes[index]],
+            "confidence": self.confidence[index],
+            "language": self.languages.values[self.language_codes[index]]
+        }
+        if index in self.errors:
+            sentiment["error"] = self.errors[index]
+        else:
+            sentiment["sentence_analyses"] = self._sentence_analyses(index, text)
+            sentiment["theme"] = theme
+        sentiment["detailed_scores"] = detailed_scores
+
+        video_id, video_title = self.videos.values[self.video_codes[index]]
+        return {
+            'id': self.ids[index],
+            'text': text,
+            'author': self.authors[index],
+            'date': self.dates[index],
+            'video_id': video_id,
+            'video_title': video_title,
+            'sentiment': sentiment,
+            'theme': theme
+        }
+
+    def _sentence_analyses(self, index: int, text: Any) -> List[Dict[str, Any]]:
+        """Yorumun cümle analizlerini sözlük listesine çevirir"""
+        sentiments = self.sentence_sentiments.values
+        analyses = []
+        for position in range(self.sentence_offsets[index], self.sentence_offsets[index + 1]):
+            start = self.sentence_spans[position * 2]
+            sentence = self.sentence_literals[position] if start < 0 else text[start:self.sentence_spans[position * 2 + 1]]
+            analyses.append({
+                "text": sentence,
+                "sentiment": sentiments[self.sentence_codes[position]],
+                "score": self.sentence_scores[position]
+            })
+        return analyses
+
+    def to_dicts(self, start: int = 0, stop: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Kayıtları (veya bir aralığını) API biçimindeki yorum listesine çevirir"""
+        return [self.to_dict(index) for index in range(*slice(start, stop).indices(len(self)))]
+
+
+# Analiz sonuçlarını kabul eden fonksiyonlar hem sözlük listesiyle hem de kompakt kayıtlarla çalışır
+AnalyzedComments = Union[List[Dict[str, Any]], CommentRecords]
@@ -0,0 +1,256 @@
+import os
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from services.inference_cache import inference_cache
+from services.sqlite_connection import ProcessLocalConnection
+
+
+class CommentStore:
+    """
+    YouTube yorumlarının kalıcı deposu ve video bazında senkronizasyon durumu
+
+    Yorumlar ID'leriyle (updated_at ile birlikte) SQLite'ta saklanır; her
+    video için son tam senkronizasyon zamanı, saklanan yorum sayısı ve son
+    sayfaya ulaşılıp ulaşılmadığı tutulur. Sonraki isteklerde yalnızca yeni
+    veya düzenlenmiş yorum dizileri çekilir: commentThreads sonuçları zaman
+    sırasıyla (en yeni önce) geldiğinden, değişmemiş bir yorumla karşılaşılınca
+    sayfalama durdurulur. Eski yorumlardaki düzenleme ve silmeler ile beğeni
+    sayıları `full_sync_interval` saniyede bir yapılan tam senkronizasyonla
+    güncellenir (<= 0 ise her istek tam senkronizasyondur).
+
+    db_path verilmezse (ya da veritabanı açılamazsa) depo devre dışıdır:
+    hiçbir şey saklanmaz ve her istek tam senkronizasyondur.
+
+    Depo yorumları saklar, analiz sonuçlarını saklamaz: artımlı
+    senkronizasyonda da videonun tüm yorumları analize verilir ve değişmemiş
+    yorumların modelden yeniden geçmemesi çıkarım önbelleğine dayanır. Bu
+    yüzden varsayılan depo (comment_store_from_env) yalnızca kalıcı
+    (SQLite) çıkarım önbelleğiyle (INFERENCE_CACHE_DB) etkinleşir.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, full_sync_interval: float = 86400.0):
+        self.logger = logging.getLogger(__name__)
+        self.full_sync_interval = full_sync_interval
+        self._lock = threading.Lock()
+
+        self.full_syncs = 0
+        self.incremental_syncs = 0
+        self.comments_fetched = 0
+        self.comments_reused = 0
+
+        self.db_path = db_path
+        # Bağlantı süreç başına açılır (fork ile devralınan bağlantı kullanılmaz)
+        self._connection: Optional[ProcessLocalConnection] = None
+        if db_path:
+            try:
+                self._connection = ProcessLocalConnection(db_path, self._create_tables)
+                self._connection.get()
+            except Exception as e:
+                self.logger.warning(f"Yorum deposu veritabanı açılamadı, yorum deposu devre dışı: {e}")
+                self._connection = None
+
+    @staticmethod
+    def _create_tables(db: sqlite3.Connection):
+        # seq video içindeki API sırasını (en yeni önce) korur: büyük seq daha yeni yorumdur
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS comments ("
+            "id TEXT PRIMARY KEY, video_id TEXT NOT NULL, seq INTEGER NOT NULL, "
+            "updated_at TEXT, data TEXT NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS comments_video_seq ON comments (video_id, seq)")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS video_sync ("
+            "video_id TEXT PRIMARY KEY, comment_count INTEGER NOT NULL, complete INTEGER NOT NULL, "
+            "full_synced_at REAL NOT NULL, synced_at REAL NOT NULL)"
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Yorumlar saklanıyor mu (COMMENT_STORE_DB ayarlı ve açılabildi)"""
+        return self._connection is not None
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        """Bu sürecin bağlantısı (kilit altında kullanılır)"""
+        return self._connection.get()
+
+    def can_sync_incrementally(self, video_id: str, max_results: int) -> bool:
+        """
+        Videonun yorumlarının yalnızca yeni/düzenlenmiş olanlar çekilerek güncellenip güncellenemeyeceği
+
+        Önceki tam senkronizasyon `full_sync_interval` içinde yapılmış olmalı ve
+        depo istenen sayıda yorumu (ya da videonun tüm yorumlarını) içermelidir.
+        """
+        if not self.enabled or self.full_sync_interval <= 0:
+            return False
+        with self._lock:
+            row = self._db.execute(
+                "SELECT comment_count, complete, full_synced_at FROM video_sync WHERE video_id = ?", (video_id,)
+            ).fetchone()
+        if row is None:
+            return False
+        comment_count, complete, full_synced_at = row
+        if time.time() - full_synced_at >= self.full_sync_interval:
+            return False
+        return bool(complete) or comment_count >= max_results
+
+    def unchanged_ids(self, comments: Iterable[Dict[str, Any]]) -> set:
+        """Depoda aynı updated_at değeriyle bulunan (değişmemiş) yorumların ID'leri"""
+        pairs = {comment['id']: comment.get('updated_at') for comment in comments}
+        if not self.enabled or not pairs:
+            return set()
+        placeholders = ",".join("?" * len(pairs))
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT id, updated_at FROM comments WHERE id IN ({placeholders})", list(pairs)
+            ).fetchall()
+        return {comment_id for comment_id, updated_at in rows if pairs[comment_id] == updated_at}
+
+    def replace(self, video_id: str, comments: List[Dict[str, Any]], complete: bool):
+        """Tam senkronizasyon: videonun saklanan yorumlarını API sırasındaki `comments` ile değiştirir"""
+        if not self.enabled:
+            return
+        now = time.time()
+        rows = [
+            (comment['id'], video_id, len(comments) - position, comment.get('updated_at'),
+             json.dumps(comment, ensure_ascii=False), now)
+            for position, comment in enumerate(comments)
+        ]
+        with self._lock:
+            self._db.execute("DELETE FROM comments WHERE video_id = ?", (video_id,))
+            self._db.executemany(
+                "INSERT OR REPLACE INTO comments (id, video_id, seq, updated_at, data, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO video_sync (video_id, comment_count, complete, full_synced_at, synced_at) "
+                "VALUES (?, ?, ?, ?, ?)", (video_id, len(comments), int(complete), now, now)
+            )
+            self._db.commit()
+            self.full_syncs += 1
+            self.comments_fetched += len(comments)
+
+    def merge(self, video_id: str, comments: List[Dict[str, Any]]):
+        """
+        Artımlı senkronizasyon: yeni/düzenlenmiş yorumları (API sırasında) depoya ekler
+
+        Yeni yorumlar saklananların önüne eklenir; düzenlenmiş yorumlar
+        yerlerini korur.
+        """
+        if not self.enabled:
+            return
+        now = time.time()
+        with self._lock:
+            existing = self._existing_seqs(video_id, [comment['id'] for comment in comments])
+            top = self._db.execute(
+                "SELECT COALESCE(MAX(seq), 0) FROM comments WHERE video_id = ?", (video_id,)
+            ).fetchone()[0]
+            new_count = sum(1 for comment in comments if comment['id'] not in existing)
+
+            rows = []
+            position = 0
+            for comment in comments:
+                seq = existing.get(comment['id'])
+                if seq is None:
+                    seq = top + new_count - position
+                    position += 1
+                rows.append((comment['id'], video_id, seq, comment.get('updated_at'),
+                             json.dumps(comment, ensure_ascii=False), now))
+            self._db.executemany(
+                "INSERT OR REPLACE INTO comments (id, video_id, seq, updated_at, data, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+            self._db.execute(
+                "UPDATE video_sync SET comment_count = comment_count + ?, synced_at = ? WHERE video_id = ?",
+                (new_count, now, video_id)
+            )
+            self._db.commit()
+            self.incremental_syncs += 1
+            self.comments_fetched += len(comments)
+
+    def _existing_seqs(self, video_id: str, comment_ids: List[str]) -> Dict[str, int]:
+        """Videoda zaten saklanan yorumların seq değerleri (kilit altında çağrılır)"""
+        if not comment_ids:
+            return {}
+        placeholders = ",".join("?" * len(comment_ids))
+        rows = self._db.execute(
+            f"SELECT id, seq FROM comments WHERE video_id = ? AND id IN ({placeholders})",
+            [video_id, *comment_ids]
+        ).fetchall()
+        return dict(rows)
+
+    def comments(self, video_id: str, limit: int) -> List[Dict[str, Any]]:
+        """Videonun saklanan yorumlarını API sırasıyla (en yeni önce) döndürür"""
+        if not self.enabled:
+            return []
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT data FROM comments WHERE video_id = ? ORDER BY seq DESC LIMIT ?", (video_id, limit)
+            ).fetchall()
+        return [json.loads(data) for data, in rows]
+
+    def record_reused(self, count: int):
+        """API'den yeniden çekilmeden depodan döndürülen yorum sayısını ekler"""
+        with self._lock:
+            self.comments_reused += count
+
+    def clear(self, video_id: Optional[str] = None):
+        """Bir videonun (verilmezse tüm videoların) yorumlarını ve senkronizasyon durumunu siler"""
+        if not self.enabled:
+            return
+        with self._lock:
+            if video_id is None:
+                self._db.execute("DELETE FROM comments")
+                self._db.execute("DELETE FROM video_sync")
+            else:
+                self._db.execute("DELETE FROM comments WHERE video_id = ?", (video_id,))
+                self._db.execute("DELETE FROM video_sync WHERE video_id = ?", (video_id,))
+            self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Senkronizasyon sayaçlarını ve depo boyutunu döndürür"""
+        with self._lock:
+            videos, comments = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(comment_count), 0) FROM video_sync"
+            ).fetchone() if self.enabled else (0, 0)
+            return {
+                "enabled": self.enabled,
+                "videos": videos,
+                "comments": comments,
+                "full_syncs": self.full_syncs,
+                "incremental_syncs": self.incremental_syncs,
+                "comments_fetched": self.comments_fetched,
+                "comments_reused": self.comments_reused,
+                "full_sync_interval": self.full_sync_interval
+            }
+
+
+def comment_store_from_env(results_persisted: bool) -> CommentStore:
+    """
+    COMMENT_STORE_DB ve COMMENT_FULL_SYNC_HOURS ayarlarıyla yorum deposu
+
+    Args:
+        results_persisted: Analiz sonuçları kalıcı önbellekte mi; değilse (ör.
+            INFERENCE_CACHE_DB ayarlı değil) depo devre dışı bırakılır, aksi halde
+            yeniden başlatma sonrası veya başka bir worker'da saklanan tüm yorumlar
+            modelden yeniden geçerdi
+    """
+    db_path = os.getenv("COMMENT_STORE_DB") or None
+    if db_path and not results_persisted:
+        logging.getLogger(__name__).warning(
+            "COMMENT_STORE_DB kalıcı çıkarım önbelleği (INFERENCE_CACHE_DB) gerektirir; yorum deposu devre dışı"
+        )
+        db_path = None
+    return CommentStore(
+        db_path=db_path,
+        full_sync_interval=float(os.getenv("COMMENT_FULL_SYNC_HOURS", "24")) * 3600
+    )
+
+
+# Global singleton instance
+comment_store = comment_store_from_env(inference_cache.persistent)
@@ -5,23 +5,31 @@ from nltk.corpus import stopwords
 from collections import Counter
 import re
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from services.sentiment_service import sentiment_service
+from services.word_cloud import WordCloudMode
 
 # Loglama
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-# NLTK verilerini indirme.
-try:
-    nltk.download('punkt')
-    nltk.download('stopwords')
-    nltk.download('punkt_tab')
-    nltk.download('averaged_perceptron_tagger')
-    nltk.download('wordnet')
-    logger.info("NLTK veri setleri başarıyla indirildi")
-except Exception as e:
-    logger.error(f"NLTK indirme hatası: {str(e)}")
+_nltk_data_ready = False
+
+def _ensure_nltk_data():
+    """NLTK verilerini ilk CSV analizinde indirir (import sırasında ağ erişimi yapılmaz)."""
+    global _nltk_data_ready
+    if _nltk_data_ready:
+        return
+    try:
+        nltk.download('punkt')
+        nltk.download('stopwords')
+        nltk.download('punkt_tab')
+        nltk.download('averaged_perceptron_tagger')
+        nltk.download('wordnet')
+        _nltk_data_ready = True
+        logger.info("NLTK veri setleri başarıyla indirildi")
+    except Exception as e:
+        logger.error(f"NLTK indirme hatası: {str(e)}")
 
 class CSVAnalyzer:
     def __init__(self):
@@ -32,8 +40,9 @@ class CSVAnalyzer:
             logger.error(f"CSVAnalyzer başlatma hatası: {str(e)}")
             raise
 
-    def analyze_csv(self, file_path: str) -> Dict[str, Any]:
+    def analyze_csv(self, file_path: str, word_cloud_mode: Optional[WordCloudMode] = None) -> Dict[str, Any]:
         try:
+            _ensure_nltk_data()
             logger.info(f"CSV dosyası okunuyor: {file_path}")
             # CSV dosyasını oku
             df = pd.read_csv(file_path)
@@ -65,17 +74,14 @@ class CSVAnalyzer:
                 }
                 comments.append(comment)
 
-            # Duygu analizi yap
-            analyzed_comments = self.sentiment_service.analyze_comments(comments)
-            
-            # İstatistikleri hesapla
-            sentiment_stats = self.sentiment_service.get_sentiment_stats(analyzed_comments)
-            
-            # Kelime bulutu oluştur
-            word_cloud = self.sentiment_service.get_word_cloud(analyzed_comments)
+            # Duygu analizi yap (sonuçlar kompakt kayıtlar olarak döner)
+            records = self.sentiment_service.analyze_comment_records(comments)
             
-            # Tema analizi
-            theme_analysis = self.sentiment_service.get_theme_analysis(analyzed_comments)
+            # İstatistikler, kelime bulutu ve tema analizi (sütunlu gösterim bir kez oluşturulur)
+            sentiment_stats, word_cloud, theme_analysis = self.sentiment_service.summarize_analysis(
+                records, word_cloud_mode=word_cloud_mode
+            )
+            analyzed_comments = records.to_dicts()
             
             # sentiment_stats'e tema verilerini de ekle
             sentiment_stats['themes'] = {}
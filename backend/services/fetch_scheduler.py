@@ -0,0 +1,115 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple
+
+
+class AsyncRateLimiter:
+    """
+    Saniye başına istek sınırı (token bucket)
+
+    En fazla `burst` istek beklemeden geçer; sonrasında istekler saniyede
+    `rate` olacak şekilde bekletilir. rate <= 0 ise sınır uygulanmaz.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        # Kilit, olay döngüsüne bağlanmaması için ilk kullanımda oluşturulur
+        self._lock: Optional[asyncio.Lock] = None
+        self.waited = 0.0
+
+    async def acquire(self):
+        """Bir istek hakkı alınana kadar bekler"""
+        if self.rate <= 0:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                delay = (1 - self._tokens) / self.rate
+                self.waited += delay
+                await asyncio.sleep(delay)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+            self._tokens -= 1
+
+
+class FetchStream:
+    """
+    Öğeler için başlatılan eşzamanlı işlerin sonuçlarını tamamlanma sırasıyla verir
+
+    `async with` bloğundan çıkıldığında (ör. hata ile) bitmemiş işler iptal
+    edilir. Her sonuç (girdi sırası, öğe, sonuç veya hata) üçlüsüdür; bir
+    işin hatası diğerlerini durdurmaz.
+    """
+
+    def __init__(self, fn: Callable[[Any], Awaitable[Any]], items: Sequence[Any], concurrency: int):
+        self.fn = fn
+        self.items = list(items)
+        self.concurrency = max(1, concurrency)
+        self._tasks: List[asyncio.Future] = []
+        self._completed = None
+
+    async def _run(self, semaphore: asyncio.Semaphore, index: int, item: Any) -> Tuple[int, Any, Any]:
+        async with semaphore:
+            try:
+                return index, item, await self.fn(item)
+            except Exception as e:
+                return index, item, e
+
+    async def __aenter__(self) -> "FetchStream":
+        semaphore = asyncio.Semaphore(self.concurrency)
+        self._tasks = [asyncio.ensure_future(self._run(semaphore, index, item)) for index, item in enumerate(self.items)]
+        self._completed = iter(asyncio.as_completed(self._tasks))
+        return self
+
+    async def __aexit__(self, *exc):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def __aiter__(self) -> "FetchStream":
+        return self
+
+    async def __anext__(self) -> Tuple[int, Any, Any]:
+        try:
+            next_done = next(self._completed)
+        except StopIteration:
+            raise StopAsyncIteration
+        return await next_done
+
+
+class FetchScheduler:
+    """
+    Birçok öğe (ör. video) için I/O işlerini sınırlı eşzamanlılıkla çalıştırır
+
+    Aynı anda en fazla `concurrency` iş çalışır; istek hızı sınırı API
+    istemcisinde (AsyncRateLimiter) uygulanır.
+    """
+
+    def __init__(self, concurrency: int = 8):
+        self.concurrency = concurrency
+
+    def stream(self, fn: Callable[[Any], Awaitable[Any]], items: Sequence[Any]) -> FetchStream:
+        """
+        İşleri başlatır; sonuçlar tamamlandıkça işlenebilir
+
+        Kullanım:
+            async with scheduler.stream(fetch, videos) as results:
+                async for index, video, result in results:
+                    ...
+        """
+        return FetchStream(fn, items, self.concurrency)
+
+    async def map(self, fn: Callable[[Any], Awaitable[Any]], items: Sequence[Any]) -> List[Any]:
+        """İşleri eşzamanlı çalıştırır; sonuçları (veya hataları) girdi sırasıyla döndürür"""
+        results: List[Any] = [None] * len(items)
+        async with self.stream(fn, items) as completed:
+            async for index, _, result in completed:
+                results[index] = result
+        return results
@@ -0,0 +1,137 @@
+import os
+import logging
+import platform
+from typing import Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Çıkarım (inference) arka ucu: "torch" (varsayılan) veya "onnx"
+INFERENCE_BACKEND = os.getenv("INFERENCE_BACKEND", "torch").lower()
+# ONNX arka ucunda dinamik int8 quantization uygulanıp uygulanmayacağı
+ONNX_QUANTIZE = os.getenv("ONNX_QUANTIZE", "false").lower() in ("1", "true", "yes")
+
+ONNX_QUANTIZED_FILE = "model_quantized.onnx"
+
+
+def _onnx_available() -> bool:
+    try:
+        import optimum.onnxruntime  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def resolve_backend(backend: str = None, quantize: bool = None) -> Tuple[str, bool]:
+    """
+    Kullanılacak arka ucu belirler
+
+    ONNX istenmiş ancak optimum[onnxruntime] kurulu değilse PyTorch'a düşer.
+    """
+    backend = (backend or INFERENCE_BACKEND).lower()
+    quantize = ONNX_QUANTIZE if quantize is None else quantize
+
+    if backend == "onnx" and not _onnx_available():
+        logger.warning("optimum[onnxruntime] kurulu değil, PyTorch arka ucu kullanılıyor")
+        backend = "torch"
+    if backend != "onnx":
+        return "torch", False
+    return "onnx", quantize
+
+
+def backend_id(backend: str, quantize: bool) -> str:
+    """Arka ucu tanımlayan kısa kimlik (önbellek anahtarlarında kullanılır)"""
+    if backend == "onnx":
+        return "onnx-int8" if quantize else "onnx"
+    return "torch"
+
+
+def _load_torch(model_name: str, model_path: str, description: str) -> Tuple[Any, Any]:
+    """PyTorch modelini yerel dizinden yükler, yoksa indirip kaydeder"""
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+    if not os.path.exists(model_path):
+        print(f"{description} modeli indiriliyor...")
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        tokenizer.save_pretrained(model_path)
+        model.save_pretrained(model_path)
+    else:
+        print(f"{description} modeli yükleniyor...")
+        tokenizer = AutoTokenizer.from_pretrained(model_path)
+        model = AutoModelForSequenceClassification.from_pretrained(model_path)
+    return tokenizer, model
+
+
+def _quantization_config():
+    """İşlemci mimarisine uygun dinamik int8 quantization ayarını döndürür"""
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return AutoQuantizationConfig.arm64(is_static=False, per_channel=False)
+    return AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+
+
+def _load_onnx(model_name: str, model_path: str, description: str, quantize: bool) -> Tuple[Any, Any]:
+    """
+    ONNX Runtime modelini yükler
+
+    Model daha önce dışa aktarılmamışsa models/ altındaki PyTorch kopyasından
+    (yoksa Hugging Face'ten) ONNX'e aktarılır ve "<model>-onnx" dizinine,
+    quantization istenmişse "<model>-onnx-int8" dizinine kaydedilir.
+    """
+    from transformers import AutoTokenizer
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+
+    onnx_path = f"{model_path}-onnx"
+    if not os.path.exists(onnx_path):
+        print(f"{description} modeli ONNX formatına aktarılıyor...")
+        source = model_path if os.path.exists(model_path) else model_name
+        tokenizer = AutoTokenizer.from_pretrained(source)
+        model = ORTModelForSequenceClassification.from_pretrained(source, export=True)
+        tokenizer.save_pretrained(onnx_path)
+        model.save_pretrained(onnx_path)
+
+    if not quantize:
+        print(f"{description} modeli (ONNX) yükleniyor...")
+        return (AutoTokenizer.from_pretrained(onnx_path),
+                ORTModelForSequenceClassification.from_pretrained(onnx_path))
+
+    quantized_path = f"{model_path}-onnx-int8"
+    if not os.path.exists(os.path.join(quantized_path, ONNX_QUANTIZED_FILE)):
+        print(f"{description} modeli int8 quantize ediliyor...")
+        quantizer = ORTQuantizer.from_pretrained(onnx_path)
+        quantizer.quantize(save_dir=quantized_path, quantization_config=_quantization_config())
+        AutoTokenizer.from_pretrained(onnx_path).save_pretrained(quantized_path)
+
+    print(f"{description} modeli (ONNX int8) yükleniyor...")
+    return (AutoTokenizer.from_pretrained(quantized_path),
+            ORTModelForSequenceClassification.from_pretrained(quantized_path, file_name=ONNX_QUANTIZED_FILE))
+
+
+def load_sequence_classifier(model_name: str, model_path: str, description: str,
+                             backend: str = None, quantize: bool = None) -> Tuple[Any, Any]:
+    """
+    Sınıflandırma modelini ve tokenizer'ını seçili arka uçla yükler
+
+    Args:
+        model_name: Hugging Face model kimliği
+        model_path: models/ altındaki yerel kopyanın yolu
+        description: Log mesajlarında kullanılacak açıklama
+        backend: "torch" veya "onnx" (varsayılan: INFERENCE_BACKEND)
+        quantize: ONNX için int8 quantization (varsayılan: ONNX_QUANTIZE)
+
+    Returns:
+        Tuple: (tokenizer, model) - transformers pipeline'ına doğrudan verilebilir
+
+    Raises:
+        RuntimeError: ONNX arka ucu seçiliyken model ONNX ile yüklenemezse. Sonuçlar
+            önbellekte arka uç kimliğiyle saklandığından sessizce PyTorch'a düşülmez.
+    """
+    backend, quantize = resolve_backend(backend, quantize)
+    if backend == "onnx":
+        try:
+            return _load_onnx(model_name, model_path, description, quantize)
+        except Exception as e:
+            raise RuntimeError(f"{description} modeli ONNX ile yüklenemedi "
+                               f"(PyTorch için INFERENCE_BACKEND=torch): {e}") from e
+    return _load_torch(model_name, model_path, description)
@@ -0,0 +1,177 @@
+import os
+import json
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from services.sqlite_connection import ProcessLocalConnection
+
+# Anahtar biçimi; değiştiğinde önceki biçimle yazılmış disk kayıtları artık eşleşmez
+# (2: metin normalize edilmeden, modele verildiği haliyle anahtarlanır)
+KEY_FORMAT = "2"
+
+
+class InferenceCache:
+    """
+    Model çıktıları için içerik adresli (content-addressed) sonuç önbelleği
+
+    Anahtar; modele verilen metnin kendisi (normalize edilmeden), isim
+    alanı (namespace), model kimlikleri ve analiz sürümünün SHA-256
+    özetidir. Yalnızca boşluk veya Unicode biçimi farklı metinler model
+    çıktısını değiştirebileceğinden ayrı anahtarlanır. Bellekte sınırlı bir
+    LRU katmanı, isteğe bağlı olarak da yeniden başlatmalarda korunan bir
+    SQLite disk katmanı bulunur. Değerler JSON olarak saklanır; her okuma
+    bağımsız bir kopya döndürür.
+    """
+
+    def __init__(self, max_entries: int = 10000, db_path: Optional[str] = None):
+        self.logger = logging.getLogger(__name__)
+        self.max_entries = max(0, max_entries)
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.db_path = db_path
+        # Disk katmanı bağlantısı süreç başına ilk kullanımda açılır (fork ile devralınan bağlantı kullanılmaz)
+        self._connection = ProcessLocalConnection(db_path, self._create_table) if db_path else None
+
+    @staticmethod
+    def _create_table(db: sqlite3.Connection):
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS inference_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+
+    def _database(self) -> Optional[sqlite3.Connection]:
+        """Disk katmanı bağlantısı; açılamazsa disk katmanı kapatılır ve None döner (kilit altında çağrılır)"""
+        if self._connection is None:
+            return None
+        try:
+            return self._connection.get()
+        except Exception as e:
+            self.logger.warning(f"Önbellek veritabanı açılamadı, yalnızca bellek kullanılacak: {e}")
+            self._connection = None
+            return None
+
+    @property
+    def persistent(self) -> bool:
+        """Sonuçlar SQLite disk katmanında saklanıyor mu (yeniden başlatmalarda ve worker'lar arasında korunur)"""
+        return self._connection is not None
+
+    def make_key(self, namespace: str, text: Any, *parts: str) -> Optional[str]:
+        """
+        Önbellek anahtarı üretir
+
+        Args:
+            namespace: Sonuç türü (ör. "sentiment", "theme")
+            text: Modele verilen metin; metin değilse None döner (önbelleğe alınmaz)
+            parts: Model kimlikleri, sürüm gibi anahtara dahil edilecek değerler
+        """
+        if not isinstance(text, str):
+            return None
+        payload = "\x1f".join([KEY_FORMAT, namespace, *parts, text])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[Any]:
+        """Anahtara ait sonucu döndürür, yoksa None"""
+        if key is None:
+            return None
+
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return json.loads(value)
+
+            db = self._database()
+            if db is not None:
+                row = db.execute(
+                    "SELECT value FROM inference_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self.disk_hits += 1
+                    self._remember(key, row[0])
+                    return json.loads(row[0])
+
+            self.misses += 1
+            return None
+
+    def get_many(self, keys: Iterable[Optional[str]]) -> List[Optional[Any]]:
+        """Birden fazla anahtar için sonuçları sırasıyla döndürür"""
+        return [self.get(key) for key in keys]
+
+    def set(self, key: Optional[str], value: Any):
+        """Sonucu önbelleğe yazar"""
+        self.set_many([(key, value)])
+
+    def set_many(self, items: Iterable[tuple]):
+        """(anahtar, sonuç) çiftlerini önbelleğe yazar; disk katmanına tek işlemde kaydedilir"""
+        rows = []
+        with self._lock:
+            for key, value in items:
+                if key is None:
+                    continue
+                serialized = json.dumps(value, ensure_ascii=False)
+                self._remember(key, serialized)
+                rows.append((key, serialized, time.time()))
+
+            db = self._database() if rows else None
+            if db is not None:
+                try:
+                    db.executemany(
+                        "INSERT OR REPLACE INTO inference_cache (key, value, created_at) VALUES (?, ?, ?)",
+                        rows
+                    )
+                    db.commit()
+                except Exception as e:
+                    self.logger.warning(f"Önbellek diske yazılamadı: {e}")
+
+    def _remember(self, key: str, serialized: str):
+        """Değeri LRU katmanına ekler, kapasite aşılırsa en eski kaydı çıkarır (kilit altında çağrılır)"""
+        if self.max_entries == 0:
+            return
+        self._entries[key] = serialized
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self, include_disk: bool = False):
+        """Bellek katmanını (isteğe bağlı olarak disk katmanını da) temizler"""
+        with self._lock:
+            self._entries.clear()
+            db = self._database() if include_disk else None
+            if db is not None:
+                db.execute("DELETE FROM inference_cache")
+                db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Ayar için isabet/ıska sayaçlarını döndürür"""
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "disk_enabled": self.persistent
+            }
+
+
+# Global singleton instance
+inference_cache = InferenceCache(
+    max_entries=int(os.getenv("INFERENCE_CACHE_SIZE", "10000")),
+    db_path=os.getenv("INFERENCE_CACHE_DB") or None
+)
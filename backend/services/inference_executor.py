@@ -0,0 +1,154 @@
+import os
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+
+class InferenceQueueFullError(Exception):
+    """Çıkarım kuyruğu dolu olduğunda ve bekleme süresi aşıldığında fırlatılır"""
+
+
+class InferenceExecutor:
+    """
+    Model çağrılarını event loop dışında çalıştıran çıkarım yürütücüsü
+
+    Senkron (CPU yoğun) analiz fonksiyonları ayrılmış iş parçacıklarında
+    çalıştırılır ve async endpoint'ler sonucu await eder; böylece WebSocket
+    ping'leri, health check'ler ve diğer istekler bloklanmaz. Modeller süreç
+    içindeki singleton'da yüklü olduğundan süreç havuzu yerine iş parçacığı
+    kullanılır (her süreç modelleri yeniden yüklerdi).
+
+    Çalışan + kuyruktaki iş sayısı workers + max_queue_size ile sınırlıdır.
+    Kuyruk doluysa çağıran queue_timeout saniye bekler, yer açılmazsa
+    InferenceQueueFullError alır (backpressure). Birden fazla çağrıya
+    bölünen tek bir iş (ör. mikro-batch'ler) slot() ile tek yer ayırıp
+    çağrılarını run_admitted ile yapar.
+
+    torch_threads torch'un intra-op iş parçacığı sayısıdır ve süreç
+    geneline uygulanır (torch.set_num_threads iş parçacığı başına değildir);
+    tüm çıkarım iş parçacıkları aynı havuzu paylaşır. Yürütücü
+    oluşturulurken bir kez ayarlanır.
+    """
+
+    def __init__(self, workers: int = 1, torch_threads: Optional[int] = None,
+                 max_queue_size: int = 32, queue_timeout: float = 30.0):
+        self.logger = logging.getLogger(__name__)
+        self.workers = max(1, workers)
+        self.torch_threads = torch_threads
+        self.max_queue_size = max(0, max_queue_size)
+        self.queue_timeout = queue_timeout
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._running_lock = threading.Lock()
+
+        self.pending = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def _set_torch_threads(self):
+        """torch intra-op iş parçacığı sayısını (süreç geneli) ayarlar"""
+        if not self.torch_threads:
+            return
+        try:
+            import torch
+            torch.set_num_threads(self.torch_threads)
+        except Exception as e:
+            self.logger.warning(f"torch iş parçacığı sayısı ayarlanamadı: {e}")
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._set_torch_threads()
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="inference")
+        return self._executor
+
+    def _call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        with self._running_lock:
+            self.running += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._running_lock:
+                self.running -= 1
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        Kuyrukta bir yer ayırır ve blok boyunca tutar
+
+        Raises:
+            InferenceQueueFullError: Kuyruk dolu ve bekleme süresi aşıldıysa
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers + self.max_queue_size)
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise InferenceQueueFullError("Analiz kuyruğu dolu, lütfen daha sonra tekrar deneyin")
+
+        self.pending += 1
+        try:
+            yield
+        finally:
+            self.pending -= 1
+            self._slots.release()
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Fonksiyonu çıkarım iş parçacığında çalıştırır ve sonucunu döndürür
+
+        Raises:
+            InferenceQueueFullError: Kuyruk dolu ve bekleme süresi aşıldıysa
+        """
+        async with self.slot():
+            return await self.run_admitted(fn, *args, **kwargs)
+
+    async def run_admitted(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Kuyruk yeri slot() ile önceden ayrılmış bir iş için fonksiyonu çıkarım iş parçacığında çalıştırır"""
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._get_executor(), partial(self._call, fn, *args, **kwargs))
+            self.completed += 1
+            return result
+        except Exception:
+            self.failed += 1
+            raise
+
+    def stats(self) -> Dict[str, Any]:
+        """Kuyruk ve iş parçacığı istatistiklerini döndürür"""
+        return {
+            "workers": self.workers,
+            "torch_threads": self.torch_threads,
+            "max_queue_size": self.max_queue_size,
+            "running": self.running,
+            "queued": max(0, self.pending - self.running),
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected
+        }
+
+    def shutdown(self):
+        """İş parçacıklarını kapatır"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+# Global singleton instance
+inference_executor = InferenceExecutor(
+    workers=int(os.getenv("INFERENCE_WORKERS", "1")),
+    torch_threads=int(os.getenv("INFERENCE_TORCH_THREADS", "0")) or None,
+    max_queue_size=int(os.getenv("INFERENCE_MAX_QUEUE", "32")),
+    queue_timeout=float(os.getenv("INFERENCE_QUEUE_TIMEOUT", "30"))
+)
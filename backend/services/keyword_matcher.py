@@ -0,0 +1,121 @@
+from collections import deque
+from typing import Dict, List, Tuple
+
+
+class KeywordMatcher:
+    """
+    Aho–Corasick tabanlı çoklu anahtar kelime eşleştirici
+
+    Tüm anahtar kelimeler başlangıçta tek bir otomata derlenir; metin tek
+    geçişte taranır ve her anahtar kelimenin kaç kez geçtiği bulunur. Sayım
+    `str.count` ile aynıdır: her anahtar kelime için çakışmayan geçişler
+    soldan sağa sayılır. Aynı anahtar kelime birden fazla grupta (veya bir
+    grupta birden fazla kez) yer alabilir; her kayıt ayrı ayrı raporlanır.
+    """
+
+    def __init__(self, keywords_by_group: Dict[str, List[str]]):
+        self.groups = list(keywords_by_group)
+
+        # Küçük harfe çevrilmiş benzersiz desenler ve grup bazında (desen, anahtar kelime) kayıtları
+        self.patterns: List[str] = []
+        pattern_ids: Dict[str, int] = {}
+        self.entries: Dict[str, List[Tuple[int, str]]] = {}
+        for group, keywords in keywords_by_group.items():
+            entries = []
+            for keyword in keywords:
+                pattern = keyword.lower()
+                if not pattern:
+                    # Boş anahtar kelime anlamlı bir eşleşme üretmez
+                    continue
+                if pattern not in pattern_ids:
+                    pattern_ids[pattern] = len(self.patterns)
+                    self.patterns.append(pattern)
+                entries.append((pattern_ids[pattern], keyword))
+            self.entries[group] = entries
+
+        # Desen -> [(grup, gruptaki sıra, anahtar kelime)]; yalnızca eşleşen desenlerin kayıtlarına bakılır
+        self.pattern_entries: List[List[Tuple[str, int, str]]] = [[] for _ in self.patterns]
+        for group, entries in self.entries.items():
+            for position, (pattern_id, keyword) in enumerate(entries):
+                self.pattern_entries[pattern_id].append((group, position, keyword))
+
+        self.pattern_lengths = [len(pattern) for pattern in self.patterns]
+        self._build()
+
+    def _build(self):
+        """Trie'yi kurar, hata bağlantılarıyla tamamlanmış geçiş tablosuna (DFA) dönüştürür"""
+        transitions: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for pattern_id, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                next_state = transitions[state].get(char)
+                if next_state is None:
+                    next_state = len(transitions)
+                    transitions[state][char] = next_state
+                    transitions.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(pattern_id)
+
+        # Genişlik öncelikli sırayla hata bağlantıları ve eksik geçişler
+        fail = [0] * len(transitions)
+        queue = deque(transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            for char, next_state in list(transitions[state].items()):
+                fallback = fail[state]
+                while fallback and char not in transitions[fallback]:
+                    fallback = fail[fallback]
+                target = transitions[fallback].get(char, 0)
+                fail[next_state] = target if target != next_state else 0
+                queue.append(next_state)
+            # Durumda olmayan geçişleri hata durumundan devral (kök hariç)
+            for char, target in transitions[fail[state]].items():
+                transitions[state].setdefault(char, target)
+
+        self._transitions = transitions
+        self._outputs = [tuple(output) for output in outputs]
+
+    def count(self, text: str) -> Dict[int, int]:
+        """Metni tek geçişte tarar; desen kimliği -> çakışmayan geçiş sayısı döndürür"""
+        transitions = self._transitions
+        outputs = self._outputs
+        lengths = self.pattern_lengths
+        counts: Dict[int, int] = {}
+        next_start: Dict[int, int] = {}
+
+        state = 0
+        for index, char in enumerate(text):
+            state = transitions[state].get(char, 0)
+            if not outputs[state]:
+                continue
+            for pattern_id in outputs[state]:
+                start = index - lengths[pattern_id] + 1
+                if start >= next_start.get(pattern_id, 0):
+                    counts[pattern_id] = counts.get(pattern_id, 0) + 1
+                    next_start[pattern_id] = index + 1
+        return counts
+
+    def group_hits(self, text: str) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        Grup bazında eşleşen anahtar kelimeleri döndürür
+
+        Returns:
+            Dict: Grup -> [(anahtar kelime, geçiş sayısı)], yalnızca eşleşen
+            kayıtlar, gruptaki orijinal sırayla
+        """
+        counts = self.count(text)
+        if not counts:
+            return {}
+
+        positioned: Dict[str, List[Tuple[int, str, int]]] = {}
+        for pattern_id, pattern_count in counts.items():
+            for group, position, keyword in self.pattern_entries[pattern_id]:
+                positioned.setdefault(group, []).append((position, keyword, pattern_count))
+
+        return {
+            group: [(keyword, pattern_count) for _, keyword, pattern_count in sorted(entries)]
+            for group, entries in positioned.items()
+        }
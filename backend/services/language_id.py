@@ -0,0 +1,180 @@
+import os
+import json
+import math
+import hashlib
+import re
+from collections import Counter
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+# Varsayılan eğitim metinleri (LANGUAGE_ID_CORPUS_PATH ile değiştirilebilir)
+DEFAULT_LANGUAGE_CORPUS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                            "app", "data", "language_id_corpus.json")
+
+# Yalnızca Türkçede bulunan harfler (varsa model çalıştırılmadan Türkçe kabul edilir)
+TURKISH_CHARS = frozenset('çğıöşüÇĞİÖŞÜ')
+
+# Diakritikler kaldırılarak eğitilir ve sınıflandırılır; böylece Türkçe karakter
+# kullanılmadan yazılmış yorumlar da Türkçe n-gram'larıyla eşleşir
+_FOLD = str.maketrans('çğıöşüâîûÇĞİÖŞÜÂÎÛ', 'cgiosuaiuCGIOSUAIU')
+_NON_LETTERS = re.compile(r'[\W\d_]+')
+
+NGRAM_ORDERS = (1, 2, 3)
+
+
+def fold_text(text: str) -> str:
+    """Metni küçük harfe çevirir, diakritikleri kaldırır ve harf dışı karakterleri boşlukla değiştirir"""
+    return _NON_LETTERS.sub(' ', text.translate(_FOLD).lower()).strip()
+
+
+def word_ngrams(word: str, orders: Sequence[int] = NGRAM_ORDERS) -> List[str]:
+    """Başı ve sonu boşlukla işaretlenmiş kelimenin karakter n-gram'ları"""
+    padded = f" {word} "
+    return [padded[start:start + order] for order in orders for start in range(len(padded) - order + 1)]
+
+
+def char_ngrams(text: str, orders: Sequence[int] = NGRAM_ORDERS) -> List[str]:
+    """Metindeki tüm kelimelerin karakter n-gram'ları"""
+    return [gram for word in fold_text(text).split() for gram in word_ngrams(word, orders)]
+
+
+class LanguageIdentifier:
+    """
+    Karakter n-gram'larıyla çok terimli (multinomial) naive Bayes dil tanıyıcı
+
+    Model, dil başına n-gram log olasılıklarından oluşan bir tablodur
+    (sözlük boyutu x dil sayısı); yerel eğitim metinlerinden yüklenirken
+    milisaniyeler içinde hesaplanır ve ağ erişimi gerektirmez. Toplu
+    sınıflandırmada tüm yorumların n-gram indeksleri tek dizide toplanır ve
+    skorlar tablo satırlarının yorum bazında toplamı olarak vektörel
+    hesaplanır. Modelde olmayan n-gram'lar atlanır; kelimelerin n-gram
+    indeksleri yorumlar arasında tekrar kullanılmak üzere saklanır.
+    """
+
+    def __init__(self, languages: List[str], vocabulary: Dict[str, int], log_probs: np.ndarray,
+                 version: str = "", digest: str = "", default: str = 'en', min_margin: float = 1.0,
+                 word_cache_size: int = 50000):
+        self.languages = languages
+        self.vocabulary = vocabulary
+        self.log_probs = log_probs
+        self.version = version
+        self.digest = digest
+        self.default = default
+        # İki dilin skor farkı bunun altındaysa (çok kısa / tanınmayan metin) varsayılan dil seçilir
+        self.min_margin = min_margin
+        self.word_cache_size = word_cache_size
+        self._word_indices: Dict[str, List[int]] = {}
+
+    @classmethod
+    def train(cls, samples: Dict[str, List[str]], alpha: float = 0.5, **kwargs) -> 'LanguageIdentifier':
+        """
+        Dil -> örnek metinler sözlüğünden eğitir
+
+        Args:
+            samples: Dil kodu -> eğitim metinleri
+            alpha: Laplace (additive) yumuşatma katsayısı
+        """
+        languages = list(samples)
+        counts = {language: Counter(gram for text in texts for gram in char_ngrams(text))
+                  for language, texts in samples.items()}
+        vocabulary = {gram: index for index, gram in
+                      enumerate(sorted(set().union(*(counter.keys() for counter in counts.values()))))}
+
+        log_probs = np.zeros((len(vocabulary), len(languages)))
+        for column, language in enumerate(languages):
+            counter = counts[language]
+            denominator = math.log(sum(counter.values()) + alpha * len(vocabulary))
+            for gram, index in vocabulary.items():
+                log_probs[index, column] = math.log(counter.get(gram, 0) + alpha) - denominator
+        return cls(languages, vocabulary, log_probs, **kwargs)
+
+    @property
+    def cache_id(self) -> str:
+        """Önbellek anahtarlarında kullanılan kimlik (sürüm + eğitim verisi özeti)"""
+        return f"ngram:{self.version}:{self.digest[:12]}"
+
+    def _indices(self, word: str) -> List[int]:
+        """Kelimenin modelde bulunan n-gram'larının tablo indeksleri"""
+        indices = self._word_indices.get(word)
+        if indices is None:
+            lookup = self.vocabulary.get
+            indices = [index for index in map(lookup, word_ngrams(word)) if index is not None]
+            if len(self._word_indices) >= self.word_cache_size:
+                self._word_indices.clear()
+            self._word_indices[word] = indices
+        return indices
+
+    def scores(self, texts: Sequence[str]) -> np.ndarray:
+        """Metin x dil log olabilirlik matrisi"""
+        offsets = [0]
+        indices: List[int] = []
+        for text in texts:
+            for word in fold_text(text).split():
+                indices.extend(self._indices(word))
+            offsets.append(len(indices))
+
+        scores = np.zeros((len(texts), len(self.languages)))
+        if not indices:
+            return scores
+        # Satırların yorum bazında toplamı (cumsum farkı; n-gram'ı olmayan yorumlarda sıfır)
+        cumulative = np.vstack([np.zeros((1, len(self.languages))),
+                                np.cumsum(self.log_probs[np.array(indices)], axis=0)])
+        bounds = np.array(offsets)
+        return cumulative[bounds[1:]] - cumulative[bounds[:-1]]
+
+    def identify_batch(self, texts: Sequence[Any]) -> List[str]:
+        """
+        Metinlerin dillerini toplu olarak belirler
+
+        Türkçeye özgü harf içeren metinler doğrudan Türkçe kabul edilir; metin
+        olmayan, harf içermeyen veya skor farkı min_margin'in altında kalan
+        metinlerde varsayılan dil döndürülür.
+        """
+        results = [self.default] * len(texts)
+        pending = []
+        for index, text in enumerate(texts):
+            if not isinstance(text, str):
+                continue
+            if 'tr' in self.languages and not TURKISH_CHARS.isdisjoint(text):
+                results[index] = 'tr'
+            else:
+                pending.append(index)
+
+        if pending:
+            scores = self.scores([texts[index] for index in pending])
+            ordered = np.sort(scores, axis=1)
+            best = scores.argmax(axis=1)
+            margins = ordered[:, -1] - ordered[:, -2] if len(self.languages) > 1 else ordered[:, -1]
+            for index, column, margin in zip(pending, best.tolist(), margins.tolist()):
+                if margin >= self.min_margin:
+                    results[index] = self.languages[column]
+        return results
+
+    def identify(self, text: Any) -> str:
+        """Tek metnin dilini belirler"""
+        return self.identify_batch([text])[0]
+
+
+def load_language_identifier(path: str = DEFAULT_LANGUAGE_CORPUS_PATH, **kwargs) -> LanguageIdentifier:
+    """
+    Eğitim metinleri dosyasından dil tanıyıcıyı oluşturur
+
+    Dosya biçimi: {"version": "1", "languages": {"tr": ["..."], "en": ["..."]}}
+
+    Raises:
+        ValueError: Dosya geçersizse veya en az bir dil için örnek yoksa
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = json.loads(raw.decode('utf-8'))
+
+    samples = data.get('languages') if isinstance(data, dict) else None
+    if not isinstance(samples, dict) or not samples:
+        raise ValueError("Dil tanıma eğitim dosyasında 'languages' bulunamadı")
+    for language, texts in samples.items():
+        if not isinstance(texts, list) or not texts or not all(isinstance(text, str) for text in texts):
+            raise ValueError(f"Geçersiz dil örnekleri: {language}")
+
+    return LanguageIdentifier.train(samples, version=str(data.get('version', '0')),
+                                    digest=hashlib.sha256(raw).hexdigest(), **kwargs)
@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from services.inference_executor import inference_executor as default_executor
+
+
+class MicroBatcher:
+    """
+    İstekler arası mikro-batch katmanı
+
+    Farklı isteklerden eşzamanlı gelen metinler kısa bir zaman penceresi
+    (window_ms) boyunca biriktirilir ve tek bir toplu model çağrısında
+    işlenir. Pencere dolduğunda ya da bekleyen metin sayısı max_batch_size'a
+    ulaştığında batch gönderilir; sonuçlar her çağırana kendi future'ı
+    üzerinden, gönderdiği sırayla döndürülür.
+
+    Toplu fonksiyon (run_batch) çıkarım yürütücüsünde çalışır. Her
+    submit_many çağrısı, kaç batch'e bölünürse bölünsün yürütücü kuyruğunda
+    tek yer tutar; aynı anda en fazla yürütücünün iş parçacığı sayısı kadar
+    batch çalışır, diğerleri sırada bekler. Yürütücü meşgulken gelen
+    istekler bir sonraki batch'te birleşir. Hata alan (ya da iptal edilen)
+    bir çağıranın henüz başlamamış batch'lerdeki girdileri işlenmez.
+    """
+
+    def __init__(self, run_batch: Callable[[List[Any]], List[Any]], window_ms: float = 10.0,
+                 max_batch_size: int = 128, executor=None):
+        self.logger = logging.getLogger(__name__)
+        self.run_batch = run_batch
+        self.window_ms = max(0.0, window_ms)
+        self.max_batch_size = max(1, max_batch_size)
+        self.executor = executor or default_executor
+
+        self._pending: List[Tuple[Any, asyncio.Future, float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+        # Aynı anda çalışan batch sayısı sınırı (olay döngüsüne bağlanmaması için ilk kullanımda oluşturulur)
+        self._running: Optional[asyncio.Semaphore] = None
+
+        self.requests = 0
+        self.items = 0
+        self.batches = 0
+        self.failed_batches = 0
+        self.skipped_batches = 0
+        self.size_flushes = 0
+        self.window_flushes = 0
+        self.max_observed_batch = 0
+        self.total_wait = 0.0
+
+    async def submit(self, item: Any) -> Any:
+        """Tek bir girdiyi kuyruğa ekler ve sonucunu döndürür"""
+        return (await self.submit_many([item]))[0]
+
+    async def submit_many(self, items: List[Any]) -> List[Any]:
+        """
+        Girdileri kuyruğa ekler ve sonuçlarını aynı sırayla döndürür
+
+        Girdiler diğer isteklerin girdileriyle aynı batch'te işlenebilir;
+        bir batch hata verirse o batch'teki tüm çağıranlara hata iletilir.
+
+        Raises:
+            InferenceQueueFullError: Yürütücü kuyruğu dolu ve bekleme süresi aşıldıysa
+        """
+        if not items:
+            return []
+
+        async with self.executor.slot():
+            return await self._submit_admitted(items)
+
+    async def _submit_admitted(self, items: List[Any]) -> List[Any]:
+        loop = asyncio.get_running_loop()
+        self.requests += 1
+        futures = []
+        now = time.perf_counter()
+        for item in items:
+            future = loop.create_future()
+            self._pending.append((item, future, now))
+            futures.append(future)
+            if len(self._pending) >= self.max_batch_size:
+                self.size_flushes += 1
+                self._flush()
+
+        if self._pending and self._timer is None:
+            self._timer = loop.call_later(self.window_ms / 1000, self._on_window)
+
+        try:
+            return list(await asyncio.gather(*futures))
+        finally:
+            # Hata/iptal durumunda bekleyen girdiler iptal edilir; başlamamış batch'ler bunları atlar
+            for future in futures:
+                future.cancel()
+
+    def _on_window(self):
+        self._timer = None
+        if self._pending:
+            self.window_flushes += 1
+            self._flush()
+
+    def _flush(self):
+        """Bekleyen girdilerden bir batch oluşturup arka planda çalıştırır"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch = self._pending[:self.max_batch_size]
+        self._pending = self._pending[self.max_batch_size:]
+        if not batch:
+            return
+
+        now = time.perf_counter()
+        self.batches += 1
+        self.items += len(batch)
+        self.max_observed_batch = max(self.max_observed_batch, len(batch))
+        self.total_wait += sum(now - enqueued for _, _, enqueued in batch)
+
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        if self._pending:
+            self._timer = asyncio.get_running_loop().call_later(self.window_ms / 1000, self._on_window)
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future, float]]):
+        if self._running is None:
+            self._running = asyncio.Semaphore(self.executor.workers)
+        async with self._running:
+            batch = [entry for entry in batch if not entry[1].done()]
+            if not batch:
+                self.skipped_batches += 1
+                return
+            try:
+                results = await self.executor.run_admitted(self.run_batch, [item for item, _, _ in batch])
+            except Exception as e:
+                self.failed_batches += 1
+                self.logger.error(f"Mikro-batch hatası: {str(e)}")
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+        for (_, future, _), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """Batch boyutu ve bekleme istatistiklerini döndürür"""
+        return {
+            "window_ms": self.window_ms,
+            "max_batch_size": self.max_batch_size,
+            "requests": self.requests,
+            "items": self.items,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "skipped_batches": self.skipped_batches,
+            "pending": len(self._pending),
+            "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "max_observed_batch": self.max_observed_batch,
+            "avg_wait_ms": round(self.total_wait / self.items * 1000, 2) if self.items else 0.0,
+            "size_flushes": self.size_flushes,
+            "window_flushes": self.window_flushes
+        }
+
@@ -0,0 +1,114 @@
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+import nltk
+
+# Dil kodu -> NLTK Punkt modeli
+PUNKT_LANGUAGES = {
+    'tr': 'turkish',
+    'en': 'english',
+}
+
+
+@lru_cache(maxsize=None)
+def punkt_tokenizer(language: str):
+    """
+    Dil için Punkt tokenizer'ı (bir kez yüklenir)
+
+    sent_tokenize her çağrıda modeli kaynak yolundan yeniden çözümler; toplu
+    ayırmada tokenizer doğrudan kullanılır.
+    """
+    try:
+        # NLTK >= 3.8.2 (punkt_tab verisi)
+        from nltk.tokenize import PunktTokenizer
+        return PunktTokenizer(language)
+    except ImportError:
+        return nltk.data.load(f"tokenizers/punkt/{language}.pickle")
+
+
+class SentenceSegmenter:
+    """
+    Yorumları cümlelere ayırır
+
+    YouTube yorumlarının çoğu tek kısa cümledir. Cümle sonu karakteri
+    (. ? !) içermeyen veya yalnızca sonunda nokta(lar) ya da tek bir ? / !
+    içeren metinlerde Punkt'un da tek cümle döndüreceği kesin olduğundan
+    tokenizer çalıştırılmaz (hızlı yol); sonuç Punkt ile aynıdır. fast_path_chars > 0 ise bu uzunluğun
+    altındaki metinler de noktalamadan bağımsız olarak tek cümle sayılır.
+    Kalan metinler dile uygun Punkt modeliyle (Türkçe yorumlar için
+    turkish) bölünür.
+    """
+
+    def __init__(self, fast_path_chars: int = 0, languages: Optional[Dict[str, str]] = None):
+        self.fast_path_chars = fast_path_chars
+        self.languages = languages or PUNKT_LANGUAGES
+        self.fast_path_count = 0
+        self.punkt_count = 0
+
+    def _fast_path(self, text: str) -> Optional[List[str]]:
+        """Metin Punkt çalıştırılmadan bölünebiliyorsa cümleleri, aksi halde None döndürür"""
+        stripped = text.rstrip()
+        if not stripped:
+            return [text]
+        if len(stripped) < self.fast_path_chars:
+            return [stripped]
+        # Sondaki noktalar veya tek bir ? / ! dışında cümle sonu karakteri yoksa bölünecek yer yoktur
+        # (Punkt "!!", "?!" gibi dizileri kendi içinde bölebilir)
+        body = stripped[:-1] if stripped[-1] in '?!' else stripped.rstrip('.')
+        if '.' not in body and '?' not in body and '!' not in body:
+            return [stripped]
+        return None
+
+    def _punkt(self, text: str, lang: str) -> List[str]:
+        """Metni dile uygun Punkt modeliyle böler"""
+        sentences = punkt_tokenizer(self.languages.get(lang, 'english')).tokenize(text)
+        return sentences or [text]
+
+    def segment(self, text: str, lang: str = 'en') -> List[str]:
+        """
+        Metni cümlelere ayırır, cümle bulunamazsa metnin kendisini döndürür
+
+        Args:
+            text: Metin
+            lang: Dil kodu ('tr' veya 'en')
+        """
+        sentences = self._fast_path(text)
+        if sentences is not None:
+            self.fast_path_count += 1
+            return sentences
+        self.punkt_count += 1
+        return self._punkt(text, lang)
+
+    def segment_batch(self, texts: Sequence[str], languages: Sequence[str]) -> List[List[str]]:
+        """
+        Metinleri toplu olarak cümlelere ayırır
+
+        Hızlı yola uyan metinler doğrudan ayrılır; kalanlar dile göre
+        gruplanır ve aynı metin (aynı dilde) yalnızca bir kez Punkt'tan
+        geçirilir.
+
+        Args:
+            texts: Metinler
+            languages: Girdi sırasıyla dil kodları
+
+        Returns:
+            List[List[str]]: Girdi sırasıyla her metnin cümleleri
+        """
+        results: List[Optional[List[str]]] = [None] * len(texts)
+        pending: Dict[str, Dict[str, List[int]]] = {}
+        for index, (text, lang) in enumerate(zip(texts, languages)):
+            sentences = self._fast_path(text)
+            if sentences is not None:
+                results[index] = sentences
+            else:
+                pending.setdefault(lang, {}).setdefault(text, []).append(index)
+
+        self.fast_path_count += len(texts) - sum(len(indices) for group in pending.values()
+                                                 for indices in group.values())
+        for lang, group in pending.items():
+            for text, indices in group.items():
+                sentences = self._punkt(text, lang)
+                self.punkt_count += len(indices)
+                for position, index in enumerate(indices):
+                    results[index] = sentences if position == 0 else list(sentences)
+        return results
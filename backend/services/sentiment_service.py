@@ -1,15 +1,53 @@
 import os
+import copy
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 import logging
-from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
-from nltk.tokenize import sent_tokenize
 import nltk
 from collections import Counter
-import re
 from nltk.corpus import stopwords
 import asyncio
+import threading
+import time
 from datetime import datetime
+from services.batch_scheduler import token_lengths, plan_token_budget_batches, run_batches
+from services.inference_cache import inference_cache
+from services.inference_backend import resolve_backend, backend_id, load_sequence_classifier
+from services.inference_executor import inference_executor, InferenceQueueFullError
+from services.micro_batcher import MicroBatcher
+from services.word_cloud import (document_frequencies, word_weight, word_cloud_item, weighted_words,
+                                 HeavyHitterSketch, WordCloudMode)
+from services.text_normalizer import TextNormalizer
+from services.analysis_frame import AnalysisFrame, CATEGORIES
+from services.comment_records import CommentRecords, AnalyzedComments
+from services.stats_accumulator import SentimentAccumulator
+from services.theme_taxonomy import ThemeTaxonomy, load_theme_taxonomy, DEFAULT_TAXONOMY_PATH
+from services.sentence_segmenter import SentenceSegmenter
+from services.language_id import LanguageIdentifier, load_language_identifier, DEFAULT_LANGUAGE_CORPUS_PATH, TURKISH_CHARS
+
+# Kullanılan modeller (önbellek anahtarlarında model kimliği olarak da kullanılır)
+TR_SENTIMENT_MODEL = "savasy/bert-base-turkish-sentiment-cased"
+EN_SENTIMENT_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
+THEME_MODEL = "facebook/bart-large-mnli"
+
+# Model adı -> (Hugging Face kimliği, models/ altındaki dizin, açıklama, pipeline görevi)
+MODEL_SPECS = {
+    "tr_sentiment": (TR_SENTIMENT_MODEL, "tr-sentiment", "Türkçe duygu analizi", "sentiment-analysis"),
+    "en_sentiment": (EN_SENTIMENT_MODEL, "en-sentiment", "İngilizce duygu analizi", "sentiment-analysis"),
+    "theme_classifier": (THEME_MODEL, "theme-analysis", "Tema analizi", "zero-shot-classification"),
+}
+
+# Duygu pipeline'ı çağrı ayarları; batch'li ve tekil yollarda aynıdır (model sınırını aşan cümleler kırpılır)
+SENTIMENT_PIPELINE_KWARGS = {"truncation": True}
+
+# Skorlama mantığı değiştiğinde artırılmalı; önbellekteki eski sonuçları geçersiz kılar
+ANALYSIS_VERSION = "1"
+
+def warmup_models_from_env() -> List[str]:
+    """MODEL_WARMUP açıksa tüm modeller, kapalıysa hiçbiri (modeller ilk istekte yüklenir)"""
+    if os.getenv("MODEL_WARMUP", "true").lower() in ("1", "true", "yes"):
+        return list(MODEL_SPECS)
+    return []
 
 class SentimentService:
     _instance = None
@@ -39,486 +77,887 @@ class SentimentService:
             self.firestore_service = None
             self.firestore_enabled = False
         
+        # Analiz sonuçları önbelleği
+        self.cache = inference_cache
+        
         # Model dosyalarının yolu - kök dizindeki models klasörünü kullan
         self.models_dir = "models"
         os.makedirs(self.models_dir, exist_ok=True)
         
-        # Türkçe duygu analizi modeli
-        tr_model_path = os.path.join(self.models_dir, "tr-sentiment")
-        if not os.path.exists(tr_model_path):
-            print("Türkçe duygu analizi modeli indiriliyor...")
-            self.tr_tokenizer = AutoTokenizer.from_pretrained("savasy/bert-base-turkish-sentiment-cased")
-            self.tr_model = AutoModelForSequenceClassification.from_pretrained("savasy/bert-base-turkish-sentiment-cased")
-            self.tr_tokenizer.save_pretrained(tr_model_path)
-            self.tr_model.save_pretrained(tr_model_path)
-        else:
-            print("Türkçe duygu analizi modeli yükleniyor...")
-            self.tr_tokenizer = AutoTokenizer.from_pretrained(tr_model_path)
-            self.tr_model = AutoModelForSequenceClassification.from_pretrained(tr_model_path)
-        
-        # İngilizce duygu analizi modeli
-        en_model_path = os.path.join(self.models_dir, "en-sentiment")
-        if not os.path.exists(en_model_path):
-            print("İngilizce duygu analizi modeli indiriliyor...")
-            self.en_tokenizer = AutoTokenizer.from_pretrained("distilbert-base-uncased-finetuned-sst-2-english")
-            self.en_model = AutoModelForSequenceClassification.from_pretrained("distilbert-base-uncased-finetuned-sst-2-english")
-            self.en_tokenizer.save_pretrained(en_model_path)
-            self.en_model.save_pretrained(en_model_path)
-        else:
-            print("İngilizce duygu analizi modeli yükleniyor...")
-            self.en_tokenizer = AutoTokenizer.from_pretrained(en_model_path)
-            self.en_model = AutoModelForSequenceClassification.from_pretrained(en_model_path)
-        
-        # Tema analizi modeli
-        theme_model_path = os.path.join(self.models_dir, "theme-analysis")
-        if not os.path.exists(theme_model_path):
-            print("Tema analizi modeli indiriliyor...")
-            self.theme_tokenizer = AutoTokenizer.from_pretrained("facebook/bart-large-mnli")
-            self.theme_model = AutoModelForSequenceClassification.from_pretrained("facebook/bart-large-mnli")
-            self.theme_tokenizer.save_pretrained(theme_model_path)
-            self.theme_model.save_pretrained(theme_model_path)
-        else:
-            print("Tema analizi modeli yükleniyor...")
-            self.theme_tokenizer = AutoTokenizer.from_pretrained(theme_model_path)
-            self.theme_model = AutoModelForSequenceClassification.from_pretrained(theme_model_path)
-        
-        # Pipeline'ları oluştur
-        self.tr_sentiment = pipeline(
-            "sentiment-analysis",
-            model=self.tr_model,
-            tokenizer=self.tr_tokenizer
-        )
+        # Çıkarım arka ucu (INFERENCE_BACKEND=torch|onnx, ONNX_QUANTIZE=true|false)
+        self.backend, self.quantize = resolve_backend()
+        self.backend_id = backend_id(self.backend, self.quantize)
+        print(f"Çıkarım arka ucu: {self.backend_id}")
         
-        self.en_sentiment = pipeline(
-            "sentiment-analysis",
-            model=self.en_model,
-            tokenizer=self.en_tokenizer
-        )
+        # Modeller ilk ihtiyaç duyulduğunda (ve yalnızca ihtiyaç duyulanlar) yüklenir
+        self._pipelines: Dict[str, Any] = {}
+        self._model_status = {name: "not_loaded" for name in MODEL_SPECS}
+        self._model_errors: Dict[str, str] = {}
+        self._model_locks = {name: threading.Lock() for name in MODEL_SPECS}
+        # Açılışta arka planda ısındırılacak modeller; hazırlık (readiness) yalnızca bunları bekler
+        self.warmup_models = warmup_models_from_env()
+        self._nltk_lock = threading.Lock()
+        self._nltk_ready = False
+        self._stop_words: Optional[set] = None
+        self._word_cloud_stop_words: Optional[set] = None
+        self._text_normalizer: Optional[TextNormalizer] = None
+        
+        # Tema kategorileri ve anahtar kelimeleri sürümlü taksonomi dosyasından yüklenir;
+        # süreç veya modeller yeniden başlatılmadan yeniden yüklenebilir
+        self.taxonomy_path = os.getenv("THEME_TAXONOMY_PATH", DEFAULT_TAXONOMY_PATH)
+        # Dosya değişikliğinin kontrol aralığı (saniye, 0 = yalnızca reload_taxonomy ile). API ile
+        # yeniden yükleme yalnızca isteği alan süreçte çalışır; çok worker'lı dağıtımda diğer
+        # worker'lar dosya değişikliğini bu kontrolle en geç bu aralık sonunda alır
+        self.taxonomy_reload_interval = float(os.getenv("THEME_TAXONOMY_RELOAD_INTERVAL", "30"))
+        self._taxonomy_lock = threading.Lock()
+        self._taxonomy_checked_at = time.monotonic()
+        self.taxonomy: ThemeTaxonomy = load_theme_taxonomy(self.taxonomy_path)
+        print(f"Tema taksonomisi yüklendi: sürüm {self.taxonomy.version}, {len(self.taxonomy.categories)} tema")
+        
+        # Toplu (batch) analizde model başına tek seferde işlenecek cümle sayısı
+        self.batch_size = int(os.getenv("SENTIMENT_BATCH_SIZE", "32"))
+        # Batch başına padding dahil token bütçesi (uzunluk bazlı dinamik batch'leme)
+        self.max_batch_tokens = int(os.getenv("SENTIMENT_MAX_BATCH_TOKENS", "4096"))
+        # Zero-shot tema modelinde tek seferde işlenecek premise/hipotez çifti sayısı
+        self.theme_batch_size = int(os.getenv("THEME_BATCH_SIZE", "16"))
+        # Birleştirilebilir istatistiklerin kelime özetinde izlenen kelime sayısı (hata sınırları
+        # approximate kelime bulutuyla ortaktır)
+        self.word_sketch_capacity = int(os.getenv("WORD_SKETCH_CAPACITY", "2000"))
+        # Varsayılan kelime bulutu modu (exact | approximate; istek bazında değiştirilebilir) ve
+        # approximate modda kelime/bigram başına izlenen terim sayısı ile Count-Min hata sınırları
+        self.word_cloud_mode = os.getenv("WORD_CLOUD_MODE", "exact").lower()
+        self.word_cloud_capacity = int(os.getenv("WORD_CLOUD_APPROX_CAPACITY", "5000"))
+        self.word_cloud_epsilon = float(os.getenv("WORD_CLOUD_APPROX_EPSILON", "0.0005"))
+        self.word_cloud_delta = float(os.getenv("WORD_CLOUD_APPROX_DELTA", "0.01"))
         
-        self.theme_classifier = pipeline(
-            "zero-shot-classification",
-            model=self.theme_model,
-            tokenizer=self.theme_tokenizer
+        # Dil tespiti (LANGUAGE_DETECTOR=ngram|charset); ngram modeli ilk kullanımda yerel dosyadan eğitilir
+        self.language_detector = os.getenv("LANGUAGE_DETECTOR", "ngram").lower()
+        self.language_corpus_path = os.getenv("LANGUAGE_ID_CORPUS_PATH", DEFAULT_LANGUAGE_CORPUS_PATH)
+        self._language_identifier: Optional[LanguageIdentifier] = None
+        self._language_lock = threading.Lock()
+        # Dil bazında işlenen yorum/cümle sayıları ve süreler (language_stats)
+        self._language_stats: Dict[str, Dict[str, float]] = {}
+        self._detection_stats = {"texts": 0, "seconds": 0.0}
+        self._language_stats_lock = threading.Lock()
+        
+        # Cümlelere ayırma: noktalamasız / tek cümlelik yorumlarda Punkt atlanır; SENTENCE_FAST_PATH_CHARS > 0
+        # ise bu uzunluğun altındaki yorumlar da tek cümle sayılır
+        self.sentence_segmenter = SentenceSegmenter(int(os.getenv("SENTENCE_FAST_PATH_CHARS", "0")))
+        
+        # Eşzamanlı isteklerden gelen metinleri tek toplu analizde birleştiren mikro-batch katmanı
+        self.micro_batcher = MicroBatcher(
+            self.analyze_sentiment_batch,
+            window_ms=float(os.getenv("MICRO_BATCH_WINDOW_MS", "10")),
+            max_batch_size=int(os.getenv("MICRO_BATCH_MAX_SIZE", "128"))
         )
         
-        # NLTK veri setlerini indir
+        print("Duygu analizi servisi başlatıldı!")
+
+    def _load_pipeline(self, name: str):
+        """Modeli ve pipeline'ını yükler; aynı model için eşzamanlı çağrılarda tek yükleme yapılır"""
+        pipe = self._pipelines.get(name)
+        if pipe is not None:
+            return pipe
+        
+        with self._model_locks[name]:
+            pipe = self._pipelines.get(name)
+            if pipe is not None:
+                return pipe
+            
+            model_name, directory, description, task = MODEL_SPECS[name]
+            self._model_status[name] = "loading"
+            try:
+                # transformers/torch importu da ilk model yüklemesine kadar ertelenir
+                from transformers import pipeline
+                
+                tokenizer, model = load_sequence_classifier(
+                    model_name, os.path.join(self.models_dir, directory), description,
+                    self.backend, self.quantize
+                )
+                pipe = pipeline(task, model=model, tokenizer=tokenizer)
+            except Exception as e:
+                self._model_status[name] = "error"
+                self._model_errors[name] = str(e)
+                self.logger.error(f"{description} modeli yüklenemedi: {e}")
+                raise
+            
+            self._pipelines[name] = pipe
+            self._model_status[name] = "ready"
+            self._model_errors.pop(name, None)
+            return pipe
+
+    @property
+    def tr_sentiment(self):
+        """Türkçe duygu analizi pipeline'ı (ilk kullanımda yüklenir)"""
+        return self._load_pipeline("tr_sentiment")
+
+    @property
+    def en_sentiment(self):
+        """İngilizce duygu analizi pipeline'ı (ilk kullanımda yüklenir)"""
+        return self._load_pipeline("en_sentiment")
+
+    @property
+    def theme_classifier(self):
+        """Zero-shot tema sınıflandırma pipeline'ı (ilk kullanımda yüklenir)"""
+        return self._load_pipeline("theme_classifier")
+
+    def _ensure_nltk_data(self):
+        """Gerekli NLTK veri setlerini ilk kullanımda kontrol eder, eksikse indirir"""
+        if self._nltk_ready:
+            return
+        with self._nltk_lock:
+            if self._nltk_ready:
+                return
+            try:
+                nltk.data.find('tokenizers/punkt')
+                nltk.data.find('corpora/stopwords')
+            except LookupError:
+                nltk.download('punkt')
+                nltk.download('stopwords')
+            self._nltk_ready = True
+
+    @property
+    def stop_words(self) -> set:
+        """Türkçe ve İngilizce stopwords listesi (ilk kullanımda yüklenir)"""
+        if self._stop_words is None:
+            self._ensure_nltk_data()
+            self._stop_words = set(stopwords.words('turkish') + stopwords.words('english'))
+        return self._stop_words
+
+    @property
+    def word_cloud_stop_words(self) -> set:
+        """Kelime bulutunda atlanan kelimeler: stopwords ve genişletilmiş liste (ilk kullanımda oluşturulur)"""
+        if self._word_cloud_stop_words is None:
+            self._word_cloud_stop_words = self.stop_words.union({
+                'video', 'çok', 'güzel', 'iyi', 'kötü', 'var', 'yok', 'bu', 'şu', 'o', 'bir', 've', 'de', 'da', 
+                'ki', 'için', 'ile', 'olan', 'olur', 'gibi', 'kadar', 'daha', 'en', 'az', 'tüm', 'hep', 'her', 
+                'hiç', 'şey', 'kez', 'defa', 'youtube', 'like', 'subscribe', 'comment', 'bence', 'sanki', 
+                'gerçekten', 'kesinlikle', 'muhtemelen', 'belki', 'acaba', 'zaten', 'artık', 'sadece', 'bile',
+                'öyle', 'böyle', 'şöyle', 'nasıl', 'neden', 'niçin', 'nereye', 'nereden', 'kim', 'ne', 'hangi'
+            })
+        return self._word_cloud_stop_words
+
+    def _is_cloud_word(self, word: str, stop_words: set) -> bool:
+        """Kelimenin kelime bulutuna alınıp alınmayacağını belirler"""
+        return not (len(word) < 3 or len(word) > 25 or 
+                    word.lower() in stop_words or 
+                    word.isdigit() or 
+                    not word.replace('ş', 's').replace('ğ', 'g').replace('ü', 'u').replace('ç', 'c').replace('ö', 'o').replace('ı', 'i').isalpha())
+
+    @property
+    def text_normalizer(self) -> TextNormalizer:
+        """Yorum metinleri için token önbellekli normalizasyon (ilk kullanımda oluşturulur)"""
+        if self._text_normalizer is None:
+            self._text_normalizer = TextNormalizer(self.stop_words)
+        return self._text_normalizer
+
+    @property
+    def theme_categories(self) -> List[str]:
+        """Geçerli taksonomideki tema kategorileri"""
+        return self.taxonomy.categories
+
+    @property
+    def theme_keywords(self) -> Dict[str, List[str]]:
+        """Geçerli taksonomideki tema anahtar kelimeleri"""
+        return self.taxonomy.keywords
+
+    @property
+    def theme_matcher(self):
+        """Geçerli taksonomi için derlenmiş anahtar kelime eşleştirici"""
+        return self.taxonomy.matcher
+
+    def reload_taxonomy(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Tema taksonomisini dosyadan yeniden yükler
+        
+        Yeni taksonomi ve eşleştiricisi tamamen hazırlandıktan sonra tek atamayla
+        devreye alınır. Önbellek anahtarları taksonomi sürümünü içerdiğinden eski
+        sürümle hesaplanmış sonuçlar artık kullanılmaz. Dosya geçersizse mevcut
+        taksonomi korunur.
+        
+        Args:
+            force: İçerik değişmemiş olsa da yeniden derle
+            
+        Returns:
+            Dict: Önceki ve yeni sürüm bilgisi
+            
+        Raises:
+            ValueError: Taksonomi dosyası okunamaz veya geçersizse
+        """
+        with self._taxonomy_lock:
+            previous = self.taxonomy
+            try:
+                taxonomy = load_theme_taxonomy(self.taxonomy_path)
+            except Exception as e:
+                self.logger.error(f"Tema taksonomisi yüklenemedi, mevcut sürüm korunuyor: {e}")
+                raise ValueError(f"Tema taksonomisi yüklenemedi: {e}")
+            
+            changed = taxonomy.digest != previous.digest
+            if changed or force:
+                self.taxonomy = taxonomy
+                self.logger.info(f"Tema taksonomisi yeniden yüklendi: {previous.version} -> {taxonomy.version}")
+            
+            return {
+                "previous_version": previous.version,
+                "version": self.taxonomy.version,
+                "changed": changed,
+                "themes": len(self.taxonomy.categories)
+            }
+
+    def _maybe_reload_taxonomy(self):
+        """THEME_TAXONOMY_RELOAD_INTERVAL ayarlıysa dosya değişikliğini kontrol eder"""
+        if self.taxonomy_reload_interval <= 0:
+            return
+        now = time.monotonic()
+        if now - self._taxonomy_checked_at < self.taxonomy_reload_interval:
+            return
+        self._taxonomy_checked_at = now
         try:
-            nltk.data.find('tokenizers/punkt')
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            nltk.download('punkt')
-            nltk.download('stopwords')
-        
-        # Gelişmiş tema kategorileri
-        self.theme_categories = [
-            "içerik kalitesi",
-            "sunum tarzı",
-            "video düzeni",
-            "ses ve görüntü",
-            "konu seçimi",
-            "etkileşim",
-            "öğreticilik",
-            "eğlence",
-            "güncellik",
-            "topluluk",
-            "teknik sorunlar",
-            "yaratıcılık",
-            "özgünlük",
-            "samimilik",
-            "profesyonellik",
-            "faydalılık",
-            "motivasyon",
-            "komedi",
-            "bilgi vericilik",
-            "güvenilirlik"
-        ]
+            if os.path.getmtime(self.taxonomy_path) != self.taxonomy.mtime:
+                self.reload_taxonomy()
+        except Exception as e:
+            self.logger.warning(f"Tema taksonomisi kontrol edilemedi: {e}")
+
+    def warm_up(self, models: Optional[List[str]] = None):
+        """
+        Modelleri önceden yükler (uygulama açılışında arka planda çağrılabilir)
         
-        # Tema anahtar kelimeleri (Türkçe ve İngilizce)
-        self.theme_keywords = {
-            "içerik kalitesi": ["kalite", "güzel", "harika", "mükemmel", "kötü", "berbat", "quality", "great", "awesome", "terrible", "bad"],
-            "sunum tarzı": ["sunum", "anlatım", "stil", "presentation", "style", "delivery", "speaking"],
-            "video düzeni": ["montaj", "düzen", "editing", "layout", "structure", "organization"],
-            "ses ve görüntü": ["ses", "görüntü", "audio", "video", "sound", "visual", "mikrofon", "microphone"],
-            "konu seçimi": ["konu", "konu", "topic", "subject", "theme", "idea"],
-            "etkileşim": ["etkileşim", "soru", "cevap", "interaction", "question", "answer", "response"],
-            "öğreticilik": ["öğren", "öğret", "ders", "learn", "teach", "tutorial", "lesson", "education"],
-            "eğlence": ["eğlen", "komik", "gül", "fun", "funny", "entertaining", "laugh", "humor"],
-            "güncellik": ["güncel", "yeni", "fresh", "new", "current", "update", "recent"],
-            "topluluk": ["abone", "takip", "community", "subscriber", "follower", "fan"],
-            "teknik sorunlar": ["sorun", "hata", "bug", "problem", "issue", "error", "glitch"],
-            "yaratıcılık": ["yaratıcı", "kreatif", "özgün", "creative", "original", "innovative"],
-            "özgünlük": ["özgün", "farklı", "unique", "different", "original", "special"],
-            "samimilik": ["samimi", "doğal", "genuine", "authentic", "natural", "sincere"],
-            "profesyonellik": ["profesyonel", "kaliteli", "professional", "polished", "refined"],
-            "faydalılık": ["faydalı", "yararlı", "useful", "helpful", "beneficial", "valuable"],
-            "motivasyon": ["motive", "ilham", "motivation", "inspiration", "encouraging"],
-            "komedi": ["komik", "espri", "funny", "comedy", "joke", "hilarious"],
-            "bilgi vericilik": ["bilgi", "info", "information", "educational", "informative"],
-            "güvenilirlik": ["güvenilir", "doğru", "reliable", "trustworthy", "accurate", "credible"]
+        Args:
+            models: Yüklenecek modeller (varsayılan: warmup_models)
+        """
+        self._ensure_nltk_data()
+        _ = self.stop_words
+        for name in self.warmup_models if models is None else models:
+            try:
+                self._load_pipeline(name)
+            except Exception:
+                # Hata _model_status'a işlendi; diğer modellerin yüklenmesine devam et
+                continue
+        print("Model ısındırma tamamlandı!")
+
+    def model_status(self) -> Dict[str, Any]:
+        """
+        Modellerin yüklenme durumunu döndürür
+
+        ready: ısındırılacak modellerin (warmup_models) tamamı yüklendi; ısındırma
+        kapalıysa servis istekleri hemen kabul eder ve modeller ilk istekte yüklenir.
+        models_hot: tüm modeller bellekte (ilk istek model yükleme süresini beklemez).
+        """
+        return {
+            "ready": all(self._model_status[name] == "ready" for name in self.warmup_models),
+            "models_hot": all(status == "ready" for status in self._model_status.values()),
+            "warmup_models": list(self.warmup_models),
+            "backend": self.backend_id,
+            "models": dict(self._model_status),
+            "errors": dict(self._model_errors)
         }
+
+    @property
+    def language_identifier(self) -> Optional[LanguageIdentifier]:
+        """Karakter n-gram dil tanıyıcı (charset modunda veya yüklenemezse None)"""
+        if self.language_detector != "ngram":
+            return None
+        if self._language_identifier is None:
+            with self._language_lock:
+                if self._language_identifier is None and self.language_detector == "ngram":
+                    try:
+                        self._language_identifier = load_language_identifier(self.language_corpus_path)
+                    except Exception as e:
+                        self.logger.warning(f"Dil tanıma modeli yüklenemedi, karakter tabanlı tespite geçiliyor: {e}")
+                        self.language_detector = "charset"
+        return self._language_identifier
+
+    @property
+    def language_detector_id(self) -> str:
+        """Önbellek anahtarlarında kullanılan dil tespit yöntemi kimliği"""
+        identifier = self.language_identifier
+        return identifier.cache_id if identifier is not None else "charset"
+
+    def detect_languages(self, texts: Sequence[Any]) -> List[str]:
+        """
+        Metinlerin dillerini toplu olarak tespit eder
         
-        # Stopwords listesi
-        self.stop_words = set(stopwords.words('turkish') + stopwords.words('english'))
+        Args:
+            texts: Metinler
+            
+        Returns:
+            List[str]: Girdi sırasıyla dil kodları ('tr' veya 'en')
+        """
+        start = time.perf_counter()
+        identifier = self.language_identifier
+        try:
+            if identifier is not None:
+                languages = identifier.identify_batch(texts)
+            else:
+                # Basit bir dil tespiti
+                languages = ['tr' if isinstance(text, str) and not TURKISH_CHARS.isdisjoint(text) else 'en'
+                             for text in texts]
+        except Exception as e:
+            self.logger.error(f"Dil tespiti hatası: {str(e)}")
+            languages = ['en'] * len(texts)
         
-        print("Duygu analizi servisi başlatıldı!")
+        with self._language_stats_lock:
+            self._detection_stats["texts"] += len(texts)
+            self._detection_stats["seconds"] += time.perf_counter() - start
+        return languages
 
     def detect_language(self, text: str) -> str:
         """Metnin dilini tespit eder"""
+        return self.detect_languages([text])[0]
+
+    def _record_language_throughput(self, lang: str, texts: int, sentences: int, seconds: float):
+        """Dil bazında model çıkarımı istatistiklerini günceller"""
+        with self._language_stats_lock:
+            stats = self._language_stats.setdefault(lang, {"texts": 0, "sentences": 0, "seconds": 0.0})
+            stats["texts"] += texts
+            stats["sentences"] += sentences
+            stats["seconds"] += seconds
+
+    def language_stats(self) -> Dict[str, Any]:
+        """Dil tespiti, cümlelere ayırma ve dil bazında duygu modeli verimlilik istatistiklerini döndürür"""
+        with self._language_stats_lock:
+            detection = dict(self._detection_stats)
+            languages = {lang: dict(stats) for lang, stats in self._language_stats.items()}
+        
+        return {
+            "detector": self.language_detector_id,
+            "segmentation": {
+                "fast_path": self.sentence_segmenter.fast_path_count,
+                "punkt": self.sentence_segmenter.punkt_count
+            },
+            "detection": {
+                "texts": detection["texts"],
+                "seconds": round(detection["seconds"], 4),
+                "texts_per_sec": round(detection["texts"] / detection["seconds"], 1) if detection["seconds"] else 0.0
+            },
+            "languages": {
+                lang: {
+                    "texts": stats["texts"],
+                    "sentences": stats["sentences"],
+                    "seconds": round(stats["seconds"], 4),
+                    "sentences_per_sec": round(stats["sentences"] / stats["seconds"], 1) if stats["seconds"] else 0.0
+                }
+                for lang, stats in languages.items()
+            }
+        }
+
+    def _normalize_label(self, label: str) -> str:
+        """Model çıktısındaki etiketi positive/negative/neutral olarak normalize eder"""
+        normalized_label = label.lower()
+        if normalized_label in ["positive", "pos"]:
+            return "positive"
+        elif normalized_label in ["negative", "neg"]:
+            return "negative"
+        return "neutral"
+
+    def _split_sentences(self, text: str, lang: str = 'en') -> List[str]:
+        """Metni cümlelere ayırır, cümle bulunamazsa metnin kendisini döndürür"""
+        self._ensure_nltk_data()
+        return self.sentence_segmenter.segment(text, lang)
+
+    def _split_sentences_batch(self, texts: List[str], languages: List[str]) -> List[Any]:
+        """
+        Metinleri toplu olarak cümlelere ayırır
+        
+        Toplu ayırma başarısız olursa (ör. metin olmayan girdi) metinler tek
+        tek ayrılır; ayrılamayan metnin yerine hata nesnesi döndürülür.
+        """
         try:
-            # Basit bir dil tespiti
-            turkish_chars = set('çğıöşüÇĞİÖŞÜ')
-            if any(char in text for char in turkish_chars):
-                return 'tr'
-            return 'en'
-        except Exception as e:
-            self.logger.error(f"Dil tespiti hatası: {str(e)}")
-            return 'en'
+            self._ensure_nltk_data()
+            return self.sentence_segmenter.segment_batch(texts, languages)
+        except Exception:
+            segmented = []
+            for text, lang in zip(texts, languages):
+                try:
+                    segmented.append(self.sentence_segmenter.segment(text, lang))
+                except Exception as e:
+                    segmented.append(e)
+            return segmented
 
-    def analyze_sentiment(self, text: str) -> Dict[str, Any]:
-        """Metin için detaylı duygu analizi yapar"""
+    def _get_sentiment_pipeline(self, lang: str):
+        """Dile göre uygun duygu analizi pipeline'ını döndürür"""
+        return self.tr_sentiment if lang == 'tr' else self.en_sentiment
+
+    def _run_sentiment_pipeline(self, lang: str, sentences: List[str], batch_size: int) -> List[Dict[str, Any]]:
+        """
+        Cümleleri ilgili pipeline'dan uzunluk bazlı batch'ler halinde geçirir
+        
+        Cümleler token uzunluklarına göre gruplanır; her batch en fazla
+        batch_size cümle ve padding dahil SENTIMENT_MAX_BATCH_TOKENS token
+        içerir. Sonuçlar cümlelerin orijinal sırasıyla döndürülür.
+        """
+        sentiment_pipeline = self._get_sentiment_pipeline(lang)
+        lengths = token_lengths(sentiment_pipeline.tokenizer, sentences)
+        batches = plan_token_budget_batches(lengths, self.max_batch_tokens, batch_size)
+        return run_batches(
+            sentences,
+            batches,
+            lambda batch: sentiment_pipeline(batch, batch_size=len(batch), **SENTIMENT_PIPELINE_KWARGS)
+        )
+
+    def _build_sentiment_result(self, lang: str, sentence_analyses: List[Dict[str, Any]],
+                                theme_result: Dict[str, float]) -> Dict[str, Any]:
+        """Cümle analizlerinden yorum bazlı duygu sonucunu oluşturur"""
+        # Skorları topla
+        total_positive_score = 0
+        total_negative_score = 0
+        total_neutral_score = 0
+        for analysis in sentence_analyses:
+            if analysis["sentiment"] == "positive":
+                total_positive_score += analysis["score"]
+            elif analysis["sentiment"] == "negative":
+                total_negative_score += analysis["score"]
+            else:
+                total_neutral_score += analysis["score"]
+        
+        # Gelişmiş duygu hesaplama
+        total_sentences = len(sentence_analyses)
+        
+        # Sayısal skorlar
+        positive_count = sum(1 for s in sentence_analyses if s["sentiment"] == "positive")
+        negative_count = sum(1 for s in sentence_analyses if s["sentiment"] == "negative")
+        neutral_count = sum(1 for s in sentence_analyses if s["sentiment"] == "neutral")
+        
+        # Ağırlıklı skorlar (confidence skorlarını dikkate al)
+        weighted_positive = total_positive_score / total_sentences if total_sentences > 0 else 0
+        weighted_negative = total_negative_score / total_sentences if total_sentences > 0 else 0
+        weighted_neutral = total_neutral_score / total_sentences if total_sentences > 0 else 0
+        
+        # Polarite hesaplama (daha gelişmiş)
+        # Negatif skorları negatif yapmak için -1 ile çarp
+        polarity = (weighted_positive - weighted_negative)
+        
+        # Nötr durumları da dikkate al (nötr yüksekse polarite 0'a yaklaşsın)
+        if weighted_neutral > 0.6:  # %60'dan fazla nötr ise
+            polarity = polarity * (1 - weighted_neutral * 0.5)
+        
+        # Ana kategoriyi belirle - hem sayı hem de confidence'ı dikkate al
+        if positive_count > negative_count and positive_count > neutral_count and weighted_positive > 0.5:
+            main_category = "positive"
+            confidence = weighted_positive
+        elif negative_count > positive_count and negative_count > neutral_count and weighted_negative > 0.5:
+            main_category = "negative" 
+            confidence = weighted_negative
+        else:
+            main_category = "neutral"
+            confidence = max(weighted_neutral, 0.5)  # En az %50 confidence
+        
+        # Eğer tüm skorlar düşükse, nötr kabul et
+        if max(weighted_positive, weighted_negative, weighted_neutral) < 0.3:
+            main_category = "neutral"
+            polarity = 0
+            confidence = 0.6
+        
+        return {
+            "polarity": round(polarity, 4),
+            "category": main_category,
+            "confidence": round(confidence, 4),
+            "language": lang,
+            "sentence_analyses": sentence_analyses,
+            "theme": theme_result,
+            "detailed_scores": {
+                "positive_score": round(weighted_positive, 4),
+                "negative_score": round(weighted_negative, 4),
+                "neutral_score": round(weighted_neutral, 4),
+                "positive_count": positive_count,
+                "negative_count": negative_count,
+                "neutral_count": neutral_count
+            }
+        }
+
+    def _error_sentiment_result(self, error: Exception) -> Dict[str, Any]:
+        """Analiz başarısız olduğunda döndürülen varsayılan (nötr) sonuç"""
+        return {
+            "polarity": 0,
+            "category": "neutral",
+            "confidence": 0.6,
+            "language": "en",
+            "error": str(error),
+            "detailed_scores": {
+                "positive_score": 0,
+                "negative_score": 0,
+                "neutral_score": 0.6,
+                "positive_count": 0,
+                "negative_count": 0,
+                "neutral_count": 1
+            }
+        }
+
+    def _sentiment_cache_key(self, text: Any) -> Optional[str]:
+        """Duygu analizi sonucu için önbellek anahtarı"""
+        return self.cache.make_key("sentiment", text, TR_SENTIMENT_MODEL, EN_SENTIMENT_MODEL,
+                                   THEME_MODEL, self.backend_id, ANALYSIS_VERSION, self.taxonomy.cache_id,
+                                   self.language_detector_id)
+
+    def _theme_cache_key(self, text: Any, taxonomy: Optional[ThemeTaxonomy] = None) -> Optional[str]:
+        """Tema analizi sonucu için önbellek anahtarı"""
+        taxonomy = taxonomy or self.taxonomy
+        return self.cache.make_key("theme", text, THEME_MODEL, self.backend_id, ANALYSIS_VERSION, taxonomy.cache_id)
+
+    def _cached_batch(self, texts: List[Any], key_fn, compute_fn) -> Tuple[List[Any], List[bool]]:
+        """
+        Toplu analizi önbellek üzerinden çalıştırır
+        
+        Önbellekte bulunan sonuçlar doğrudan kullanılır; kalan metinler
+        tekilleştirilerek (aynı metin bir kez) compute_fn ile hesaplanır ve
+        önbelleğe alınabilir olanlar kaydedilir.
+        
+        Args:
+            texts: Analiz edilecek metinler
+            key_fn: Metin için önbellek anahtarı üreten fonksiyon
+            compute_fn: Metin listesi alıp (sonuçlar, önbelleğe alınabilir mi) döndüren fonksiyon
+            
+        Returns:
+            Tuple: Girdi sırasıyla sonuçlar ve her sonucun önbelleğe alınabilir olup olmadığı
+        """
+        keys = [key_fn(text) for text in texts]
+        results = self.cache.get_many(keys)
+        cacheable = [result is not None for result in results]
+        
+        pending: Dict[Any, List[int]] = {}
+        for index, result in enumerate(results):
+            if result is None:
+                pending.setdefault(keys[index] if keys[index] is not None else ("index", index), []).append(index)
+        
+        if pending:
+            computed, flags = compute_fn([texts[indices[0]] for indices in pending.values()])
+            to_store = []
+            for indices, result, flag in zip(pending.values(), computed, flags):
+                for position, index in enumerate(indices):
+                    results[index] = result if position == 0 else copy.deepcopy(result)
+                    cacheable[index] = flag
+                if flag:
+                    to_store.append((keys[indices[0]], result))
+            self.cache.set_many(to_store)
+        
+        return results, cacheable
+
+    def _analyze_sentiment_single(self, text: str) -> Tuple[Dict[str, Any], bool]:
+        """Tek metin için (batch'siz) duygu analizi yapar; sonucu ve önbelleğe alınabilirliğini döndürür"""
         try:
             # Dil tespiti
             lang = self.detect_language(text)
             
             # Cümlelere ayır
-            sentences = sent_tokenize(text)
-            if not sentences:
-                sentences = [text]
+            sentences = self._split_sentences(text, lang)
             
             # Her cümle için analiz yap
+            sentiment_pipeline = self._get_sentiment_pipeline(lang)
             sentence_analyses = []
-            total_positive_score = 0
-            total_negative_score = 0
-            total_neutral_score = 0
-            
+            start = time.perf_counter()
             for sentence in sentences:
-                if lang == 'tr':
-                    result = self.tr_sentiment(sentence)[0]
-                else:
-                    result = self.en_sentiment(sentence)[0]
-                
-                # Label normalizasyonu
-                normalized_label = result["label"].lower()
-                if normalized_label in ["positive", "pos"]:
-                    normalized_label = "positive"
-                elif normalized_label in ["negative", "neg"]:
-                    normalized_label = "negative"
-                else:
-                    normalized_label = "neutral"
-                
+                result = sentiment_pipeline(sentence, **SENTIMENT_PIPELINE_KWARGS)[0]
                 sentence_analyses.append({
                     "text": sentence,
-                    "sentiment": normalized_label,
+                    "sentiment": self._normalize_label(result["label"]),
                     "score": result["score"]
                 })
-                
-                # Skorları topla
-                if normalized_label == "positive":
-                    total_positive_score += result["score"]
-                elif normalized_label == "negative":
-                    total_negative_score += result["score"]
-                else:
-                    total_neutral_score += result["score"]
+            self._record_language_throughput(lang, 1, len(sentences), time.perf_counter() - start)
             
             # Tema analizi
-            theme_result = self.analyze_theme(text)
-            
-            # Gelişmiş duygu hesaplama
-            total_sentences = len(sentences)
-            
-            # Sayısal skorlar
-            positive_count = sum(1 for s in sentence_analyses if s["sentiment"] == "positive")
-            negative_count = sum(1 for s in sentence_analyses if s["sentiment"] == "negative")
-            neutral_count = sum(1 for s in sentence_analyses if s["sentiment"] == "neutral")
-            
-            # Ağırlıklı skorlar (confidence skorlarını dikkate al)
-            weighted_positive = total_positive_score / total_sentences if total_sentences > 0 else 0
-            weighted_negative = total_negative_score / total_sentences if total_sentences > 0 else 0
-            weighted_neutral = total_neutral_score / total_sentences if total_sentences > 0 else 0
-            
-            # Polarite hesaplama (daha gelişmiş)
-            # Negatif skorları negatif yapmak için -1 ile çarp
-            polarity = (weighted_positive - weighted_negative)
-            
-            # Nötr durumları da dikkate al (nötr yüksekse polarite 0'a yaklaşsın)
-            if weighted_neutral > 0.6:  # %60'dan fazla nötr ise
-                polarity = polarity * (1 - weighted_neutral * 0.5)
-            
-            # Ana kategoriyi belirle - hem sayı hem de confidence'ı dikkate al
-            if positive_count > negative_count and positive_count > neutral_count and weighted_positive > 0.5:
-                main_category = "positive"
-                confidence = weighted_positive
-            elif negative_count > positive_count and negative_count > neutral_count and weighted_negative > 0.5:
-                main_category = "negative" 
-                confidence = weighted_negative
-            else:
-                main_category = "neutral"
-                confidence = max(weighted_neutral, 0.5)  # En az %50 confidence
-            
-            # Eğer tüm skorlar düşükse, nötr kabul et
-            if max(weighted_positive, weighted_negative, weighted_neutral) < 0.3:
-                main_category = "neutral"
-                polarity = 0
-                confidence = 0.6
+            theme_results, theme_cacheable = self._analyze_themes([text])
             
-            return {
-                "polarity": round(polarity, 4),
-                "category": main_category,
-                "confidence": round(confidence, 4),
-                "language": lang,
-                "sentence_analyses": sentence_analyses,
-                "theme": theme_result,
-                "detailed_scores": {
-                    "positive_score": round(weighted_positive, 4),
-                    "negative_score": round(weighted_negative, 4),
-                    "neutral_score": round(weighted_neutral, 4),
-                    "positive_count": positive_count,
-                    "negative_count": negative_count,
-                    "neutral_count": neutral_count
-                }
-            }
+            return self._build_sentiment_result(lang, sentence_analyses, theme_results[0]), theme_cacheable[0]
                 
         except Exception as e:
             self.logger.error(f"Duygu analizi hatası: {str(e)}")
-            return {
-                "polarity": 0,
-                "category": "neutral",
-                "confidence": 0.6,
-                "language": "en",
-                "error": str(e),
-                "detailed_scores": {
-                    "positive_score": 0,
-                    "negative_score": 0,
-                    "neutral_score": 0.6,
-                    "positive_count": 0,
-                    "negative_count": 0,
-                    "neutral_count": 1
-                }
-            }
+            return self._error_sentiment_result(e), False
 
-    def analyze_comments(self, comments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Yorum listesi için duygu analizi yapar"""
-        analyzed_comments = []
+    def analyze_sentiment(self, text: str) -> Dict[str, Any]:
+        """Metin için detaylı duygu analizi yapar"""
+        self._maybe_reload_taxonomy()
+        key = self._sentiment_cache_key(text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        result, cacheable = self._analyze_sentiment_single(text)
+        if cacheable:
+            self.cache.set(key, result)
+        return result
+
+    def analyze_sentiment_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Metin listesi için toplu (batch) duygu analizi yapar
+        
+        Tüm yorumların cümleleri toplanır, dile göre gruplanır ve modellerden
+        batch'ler halinde geçirilir. Sonuçlar her yorum için analyze_sentiment
+        ile aynı formatta yeniden birleştirilir. Daha önce analiz edilmiş
+        metinler önbellekten döndürülür.
+        
+        Args:
+            texts: Analiz edilecek metinler
+            batch_size: Model başına batch boyutu (varsayılan: SENTIMENT_BATCH_SIZE)
+            
+        Returns:
+            List[Dict]: Girdi sırasıyla duygu analizi sonuçları
+        """
+        batch_size = max(1, batch_size or self.batch_size)
+        self._maybe_reload_taxonomy()
+        results, _ = self._cached_batch(
+            texts,
+            self._sentiment_cache_key,
+            lambda pending: self._compute_sentiment_batch(pending, batch_size)
+        )
+        return results
+
+    def _compute_sentiment_batch(self, texts: List[str], batch_size: int) -> Tuple[List[Dict[str, Any]], List[bool]]:
+        """Önbelleğe bakmadan toplu duygu analizi yapar; sonuçları ve önbelleğe alınabilirliklerini döndürür"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        cacheable = [False] * len(texts)
+        
+        # Dil tespiti (tüm batch için tek seferde) ve cümlelere ayırma
+        detected = self.detect_languages(texts)
+        languages = {}
+        sentence_groups: Dict[str, List[tuple]] = {}
+        segmented = self._split_sentences_batch(texts, detected)
+        for index, (lang, sentences) in enumerate(zip(detected, segmented)):
+            if isinstance(sentences, Exception):
+                self.logger.error(f"Duygu analizi hatası: {str(sentences)}")
+                results[index] = self._error_sentiment_result(sentences)
+                continue
+            
+            languages[index] = lang
+            group = sentence_groups.setdefault(lang, [])
+            for sentence in sentences:
+                group.append((index, sentence))
+        
+        # Her dil için cümleleri batch'ler halinde analiz et
+        sentence_analyses: Dict[int, List[Dict[str, Any]]] = {index: [] for index in languages}
+        for lang, group in sentence_groups.items():
+            try:
+                start = time.perf_counter()
+                outputs = self._run_sentiment_pipeline(lang, [sentence for _, sentence in group], batch_size)
+                self._record_language_throughput(lang, len({index for index, _ in group}), len(group),
+                                                 time.perf_counter() - start)
+            except Exception as e:
+                # Batch başarısız olursa bu gruptaki yorumları tek tek analiz et
+                self.logger.warning(f"Batch duygu analizi hatası ({lang}), tekli analize geçiliyor: {e}")
+                for index in {index for index, _ in group}:
+                    results[index], cacheable[index] = self._analyze_sentiment_single(texts[index])
+                    sentence_analyses.pop(index, None)
+                continue
+            
+            for (index, sentence), result in zip(group, outputs):
+                sentence_analyses[index].append({
+                    "text": sentence,
+                    "sentiment": self._normalize_label(result["label"]),
+                    "score": result["score"]
+                })
+        
+        # Tema analizi (toplu)
+        theme_indices = list(sentence_analyses)
+        theme_results, theme_cacheable = self._analyze_themes([texts[i] for i in theme_indices])
+        themes = dict(zip(theme_indices, zip(theme_results, theme_cacheable)))
+        
+        # Yorum bazlı sonuçları oluştur
+        for index, analyses in sentence_analyses.items():
+            try:
+                theme_result, theme_is_cacheable = themes[index]
+                results[index] = self._build_sentiment_result(languages[index], analyses, theme_result)
+                cacheable[index] = theme_is_cacheable
+            except Exception as e:
+                self.logger.error(f"Duygu analizi hatası: {str(e)}")
+                results[index] = self._error_sentiment_result(e)
+        
+        return results, cacheable
+
+    def _collect_comment_texts(self, comments: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], Any]]:
+        """Analiz edilebilecek yorumları (yorum, metin) çiftleri olarak döndürür"""
+        valid_comments = []
         for comment in comments:
             try:
-                # YouTube yorumu için duygu analizi
-                sentiment = self.analyze_sentiment(comment['text'])
-                
-                # Yorumu analiz sonuçlarıyla zenginleştir
-                analyzed_comment = {
-                    'id': comment.get('id'),
-                    'text': comment.get('text'),
-                    'author': comment.get('author'),
-                    'date': comment.get('published_at'),
-                    'video_id': comment.get('video_id'),
-                    'video_title': comment.get('video_title'),
-                    'sentiment': sentiment,
-                    'theme': self.analyze_theme(comment['text'])
-                }
+                valid_comments.append((comment, comment['text']))
+            except Exception as e:
+                self.logger.error(f"Yorum analizi hatası: {str(e)}")
+                continue
+        return valid_comments
+
+    def _build_comment_records(self, valid_comments: List[Tuple[Dict[str, Any], Any]],
+                               sentiments: List[Dict[str, Any]],
+                               records: Optional[CommentRecords] = None) -> CommentRecords:
+        """Yorumları duygu ve tema sonuçlarıyla birlikte kompakt kayıtlara ekler"""
+        records = records if records is not None else CommentRecords()
+        for (comment, text), sentiment in zip(valid_comments, sentiments):
+            try:
+                # Tema skorları duygu analizi sırasında bir kez hesaplanır ve paylaşılır;
+                # yalnızca analiz hata verdiyse (tema sonucu yoksa) ayrıca hesaplanır
+                theme = sentiment.get('theme')
+                if theme is None:
+                    theme = self.analyze_theme(text)
                 
-                analyzed_comments.append(analyzed_comment)
+                records.append(comment, sentiment, theme)
             except Exception as e:
                 self.logger.error(f"Yorum analizi hatası: {str(e)}")
                 continue
                 
-        return analyzed_comments
+        return records
 
-    def get_sentiment_stats(self, comments: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Yorumların detaylı duygu dağılımını hesaplar"""
-        total_comments = len(comments)
-        if total_comments == 0:
-            return {
-                "total": 0,
-                "categories": {
-                    "positive": 0,
-                    "negative": 0,
-                    "neutral": 0
-                },
-                "average_polarity": 0,
-                "language_distribution": {"tr": 0, "en": 0},
-                "themes": {},
-                "confidence_distribution": {
-                    "high": 0,    # >0.8
-                    "medium": 0,  # 0.5-0.8
-                    "low": 0      # <0.5
-                },
-                "polarity_distribution": {
-                    "strongly_positive": 0,  # >0.5
-                    "moderately_positive": 0, # 0.1-0.5
-                    "neutral": 0,            # -0.1-0.1
-                    "moderately_negative": 0, # -0.5-(-0.1)
-                    "strongly_negative": 0   # <-0.5
-                }
-            }
+    def analyze_comment_records(self, comments: List[Dict[str, Any]],
+                                records: Optional[CommentRecords] = None) -> CommentRecords:
+        """
+        Yorum listesi için duygu analizi yapar ve sonuçları kompakt kayıtlar olarak döndürür
+        
+        Args:
+            comments: Analiz edilecek yorumlar
+            records: Sonuçların ekleneceği mevcut kayıtlar (opsiyonel)
+        """
+        valid_comments = self._collect_comment_texts(comments)
+        
+        # YouTube yorumları için toplu duygu analizi
+        sentiments = self.analyze_sentiment_batch([text for _, text in valid_comments])
+        
+        return self._build_comment_records(valid_comments, sentiments, records)
 
-        sentiment_counts = {
-            "positive": 0,
-            "negative": 0,
-            "neutral": 0
-        }
+    def analyze_comments(self, comments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Yorum listesi için duygu analizi yapar"""
+        return self.analyze_comment_records(comments).to_dicts()
 
-        theme_counts = {}
-        language_counts = {"tr": 0, "en": 0}
-        total_polarity = 0
-        
-        # Yeni metriklerin sayaçları
-        confidence_counts = {"high": 0, "medium": 0, "low": 0}
-        polarity_counts = {
-            "strongly_positive": 0,
-            "moderately_positive": 0,
-            "neutral": 0,
-            "moderately_negative": 0,
-            "strongly_negative": 0
-        }
+    async def analyze_sentiment_async(self, text: str) -> Dict[str, Any]:
+        """Tek metin için duygu analizi; eşzamanlı çağrılar mikro-batch'te birleştirilir"""
+        return await self.micro_batcher.submit(text)
+
+    async def analyze_comment_records_async(self, comments: List[Dict[str, Any]],
+                                            records: Optional[CommentRecords] = None) -> CommentRecords:
+        """
+        analyze_comment_records'ın async karşılığı
         
-        total_positive_score = 0
-        total_negative_score = 0
-        total_neutral_score = 0
+        Metinler mikro-batch katmanına gönderilir; böylece aynı anda başlayan
+        analizlerin yorumları modelden birlikte geçer.
+        """
+        valid_comments = self._collect_comment_texts(comments)
+        sentiments = await self.micro_batcher.submit_many([text for _, text in valid_comments])
+        return await inference_executor.run(self._build_comment_records, valid_comments, sentiments, records)
 
-        for comment in comments:
-            sentiment = comment.get('sentiment', {})
-            category = sentiment.get('category', 'neutral')
-            polarity = sentiment.get('polarity', 0)
-            confidence = sentiment.get('confidence', 0)
-            themes = sentiment.get('theme', {})
-            detailed_scores = sentiment.get('detailed_scores', {})
-            
-            # Duygu sayılarını güncelle
-            sentiment_counts[category] += 1
-            
-            # Detaylı skorları topla
-            total_positive_score += detailed_scores.get('positive_score', 0)
-            total_negative_score += detailed_scores.get('negative_score', 0) 
-            total_neutral_score += detailed_scores.get('neutral_score', 0)
-            
-            # Confidence dağılımı
-            if confidence > 0.8:
-                confidence_counts["high"] += 1
-            elif confidence > 0.5:
-                confidence_counts["medium"] += 1
-            else:
-                confidence_counts["low"] += 1
-                
-            # Polarite dağılımı
-            if polarity > 0.5:
-                polarity_counts["strongly_positive"] += 1
-            elif polarity > 0.1:
-                polarity_counts["moderately_positive"] += 1
-            elif polarity > -0.1:
-                polarity_counts["neutral"] += 1
-            elif polarity > -0.5:
-                polarity_counts["moderately_negative"] += 1
-            else:
-                polarity_counts["strongly_negative"] += 1
-            
-            # Tema sayılarını güncelle (daha düşük threshold)
-            for theme, score in themes.items():
-                if score > 0.05:  # Düşürülmüş eşik değeri
-                    theme_counts[theme] = theme_counts.get(theme, 0) + 1
-            
-            # Dil dağılımını güncelle
-            language = sentiment.get('language', 'en')
-            if language in language_counts:
-                language_counts[language] += 1
-            else:
-                language_counts[language] = 1
-            
-            total_polarity += polarity
+    async def analyze_comments_async(self, comments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """analyze_comments'in async karşılığı"""
+        records = await self.analyze_comment_records_async(comments)
+        return records.to_dicts()
 
-        # Ortalama skorları hesapla
-        avg_polarity = total_polarity / total_comments if total_comments > 0 else 0
-        avg_positive_score = total_positive_score / total_comments if total_comments > 0 else 0
-        avg_negative_score = total_negative_score / total_comments if total_comments > 0 else 0
-        avg_neutral_score = total_neutral_score / total_comments if total_comments > 0 else 0
+    def _analysis_frame(self, comments: AnalyzedComments, start: int = 0) -> AnalysisFrame:
+        """Analiz sonuçlarının (start'tan itibaren) sütunlu gösterimi (kompakt kayıtlarda sözlüğe dönüştürmeden)"""
+        if isinstance(comments, CommentRecords):
+            return AnalysisFrame.from_records(comments, start)
+        return AnalysisFrame(comments[start:] if start else comments)
 
-        return {
-            "total": total_comments,
-            "categories": sentiment_counts,
-            "average_polarity": round(avg_polarity, 4),
-            "language_distribution": language_counts,
-            "themes": dict(sorted(theme_counts.items(), key=lambda x: x[1], reverse=True)),  # Temaları büyükten küçüğe sırala
-            "confidence_distribution": confidence_counts,
-            "polarity_distribution": polarity_counts,
-            "detailed_averages": {
-                "positive_score": round(avg_positive_score, 4),
-                "negative_score": round(avg_negative_score, 4),
-                "neutral_score": round(avg_neutral_score, 4)
-            },
-            "sentiment_ratios": {
-                "positive_ratio": round(sentiment_counts["positive"] / total_comments, 4) if total_comments > 0 else 0,
-                "negative_ratio": round(sentiment_counts["negative"] / total_comments, 4) if total_comments > 0 else 0,
-                "neutral_ratio": round(sentiment_counts["neutral"] / total_comments, 4) if total_comments > 0 else 0
-            }
-        }
+    def create_accumulator(self) -> SentimentAccumulator:
+        """Kelime özeti bu servisin ayarlarıyla (WORD_SKETCH_CAPACITY, WORD_CLOUD_APPROX_EPSILON/DELTA) boş birikim"""
+        return SentimentAccumulator(self.word_sketch_capacity, self.word_cloud_epsilon, self.word_cloud_delta)
+
+    def accumulate(self, comments: AnalyzedComments, accumulator: Optional[SentimentAccumulator] = None,
+                   start: int = 0) -> SentimentAccumulator:
+        """
+        Analiz edilmiş yorumları birleştirilebilir istatistik birikimine ekler
+        
+        Birikim parça parça güncellenebilir ve başka birikimlerle (parçalar,
+        videolar, işçiler) merge ile birleştirilebilir; istatistikler, tema
+        analizi ve yaklaşık kelime bulutu yorumlar yeniden taranmadan üretilir.
+        
+        Args:
+            comments: Analiz edilmiş yorumlar
+            accumulator: Güncellenecek birikim (verilmezse yenisi oluşturulur)
+            start: Yalnızca bu indeksten itibaren eklenen yorumları ekle (ör. son parça)
+            
+        Returns:
+            SentimentAccumulator: Güncellenmiş birikim
+        """
+        if accumulator is None:
+            accumulator = self.create_accumulator()
+        frame = self._analysis_frame(comments, start)
+        accumulator.add_frame(frame)
+        
+        # Kelime özeti get_word_cloud ile aynı filtreden geçen tokenlarla güncellenir
+        stop_words = self.word_cloud_stop_words
+        for text, code in zip(frame.texts, frame.category_codes.tolist()):
+            tokens = self.text_normalizer.tokens(text) if isinstance(text, str) else ()
+            words = [word for word in tokens if self._is_cloud_word(word, stop_words)]
+            accumulator.add_words(words, CATEGORIES[code] if code >= 0 else None)
+        return accumulator
+
+    def get_sentiment_stats(self, comments: AnalyzedComments,
+                            frame: Optional[AnalysisFrame] = None) -> Dict[str, Any]:
+        """
+        Yorumların detaylı duygu dağılımını hesaplar
+        
+        Args:
+            comments: Analiz edilmiş yorumlar
+            frame: Yorumların önceden oluşturulmuş sütunlu gösterimi (opsiyonel)
+        """
+        if not len(comments):
+            return SentimentAccumulator().sentiment_stats()
+        
+        # Sayaçlar, histogramlar ve toplamlar sütunlu gösterim üzerinde vektörel hesaplanır;
+        # aynı birleştirilebilir birikim parça parça (canlı) istatistiklerde de kullanılır
+        frame = frame or self._analysis_frame(comments)
+        return SentimentAccumulator().add_stats(frame).sentiment_stats()
 
-    def get_word_cloud(self, comments: List[Dict[str, Any]], max_words: int = 100) -> List[Dict[str, Any]]:
-        """Gelişmiş kelime bulutu için sık kullanılan kelimeleri hesaplar"""
+    def get_word_cloud(self, comments: AnalyzedComments, max_words: int = 100,
+                       frame: Optional[AnalysisFrame] = None,
+                       mode: Optional[WordCloudMode] = None,
+                       accumulator: Optional[SentimentAccumulator] = None) -> List[Dict[str, Any]]:
+        """
+        Gelişmiş kelime bulutu için sık kullanılan kelimeleri hesaplar
+        
+        Args:
+            comments: Analiz edilmiş yorumlar
+            max_words: Döndürülecek en fazla kelime sayısı
+            frame: Yorumların önceden oluşturulmuş sütunlu gösterimi (opsiyonel)
+            mode: "exact" veya "approximate" (varsayılan WORD_CLOUD_MODE); approximate
+                çok büyük girdilerde sınırlı bellekli özetler kullanır
+            accumulator: Verilirse her yorumun kelimeleri aynı taramada bu birikimin
+                kelime özetine de eklenir (opsiyonel)
+        """
         try:
-            if not comments:
+            if not len(comments):
                 return []
+            
+            # Metinler ve kategoriler; sütunlu gösterim varsa oradan, yoksa sözlüklerden
+            if frame is not None or isinstance(comments, CommentRecords):
+                frame = frame or self._analysis_frame(comments)
+                texts = frame.texts
+                categories = [CATEGORIES[code] if code >= 0 else None for code in frame.category_codes.tolist()]
+            else:
+                texts = [comment.get('text', '') for comment in comments]
+                categories = [comment.get('sentiment', {}).get('category', 'neutral') for comment in comments]
+            
+            if (mode or self.word_cloud_mode) == "approximate":
+                return self._approximate_word_cloud(texts, categories, len(comments), max_words, accumulator)
                 
             # Duygu bazlı yorumları ayır
             sentiment_texts = {'positive': [], 'negative': [], 'neutral': []}
             
-            for comment in comments:
-                text = comment.get('text', '')
-                sentiment = comment.get('sentiment', {})
-                category = sentiment.get('category', 'neutral')
-                
+            for text, category in zip(texts, categories):
                 if category in sentiment_texts:
                     sentiment_texts[category].append(text)
             
-            # Tüm metinleri birleştir
-            all_text = ' '.join(comment.get('text', '') for comment in comments)
-            
-            # Metni temizle
-            cleaned_text = self.clean_text(all_text)
-            
-            # Kelimelere ayır ve N-gram'ları dahil et
-            words = cleaned_text.split()
-            
-            # Gelişmiş stop words listesi
-            extended_stop_words = self.stop_words.union({
-                'video', 'çok', 'güzel', 'iyi', 'kötü', 'var', 'yok', 'bu', 'şu', 'o', 'bir', 've', 'de', 'da', 
-                'ki', 'için', 'ile', 'olan', 'olur', 'gibi', 'kadar', 'daha', 'en', 'az', 'tüm', 'hep', 'her', 
-                'hiç', 'şey', 'kez', 'defa', 'youtube', 'like', 'subscribe', 'comment', 'bence', 'sanki', 
-                'gerçekten', 'kesinlikle', 'muhtemelen', 'belki', 'acaba', 'zaten', 'artık', 'sadece', 'bile',
-                'öyle', 'böyle', 'şöyle', 'nasıl', 'neden', 'niçin', 'nereye', 'nereden', 'kim', 'ne', 'hangi'
-            })
-            
-            # Kelime filtreleme ve ağırlık hesaplama
+            # Her yorumun temizlenmiş tokenları (tema ve bigram analiziyle paylaşılan önbellekten),
+            # gelişmiş stop words listesiyle filtrelenmiş
+            extended_stop_words = self.word_cloud_stop_words
+            document_words = [
+                [word for word in (self.text_normalizer.tokens(text) if isinstance(text, str) else ())
+                 if self._is_cloud_word(word, extended_stop_words)]
+                for text in texts
+            ]
+            kept_words = [word for words in document_words for word in words]
+            if accumulator is not None:
+                for words, category in zip(document_words, categories):
+                    accumulator.add_words(words, category)
+            
+            # Her yorum bir kez küçük harfe çevrilir ve duygu bazlı belge frekansları
+            # tek taramada çıkarılır (kelime x yorum alt dizi taraması yerine)
+            lowered_texts = {sentiment: [text.lower() for text in texts] for sentiment, texts in sentiment_texts.items()}
+            frequencies = document_frequencies(lowered_texts, {word.lower() for word in kept_words})
+            
+            # Kelime ağırlığı yalnızca kelimeye bağlıdır; her farklı kelime için bir kez hesaplanır
+            word_base_weights = {}
             word_weights = {}
             
-            for word in words:
-                # Temel filtreler
-                if (len(word) < 3 or len(word) > 25 or 
-                    word.lower() in extended_stop_words or 
-                    word.isdigit() or 
-                    not word.replace('ş', 's').replace('ğ', 'g').replace('ü', 'u').replace('ç', 'c').replace('ö', 'o').replace('ı', 'i').isalpha()):
-                    continue
-                
-                # Kelime ağırlığını hesapla
-                base_weight = 1
-                
-                # Duygu bazlı ağırlık
-                for sentiment, texts in sentiment_texts.items():
-                    sentiment_count = sum(1 for text in texts if word.lower() in text.lower())
-            
-                    # Pozitif ve negatif kelimelere daha fazla ağırlık ver
-                    if sentiment in ['positive', 'negative']:
-                        base_weight += sentiment_count * 1.5
-                    else:
-                        base_weight += sentiment_count * 0.8
-                
-                # Büyük harf kontrolü (önemli kelimeler genellikle büyük harfle başlar)
-                if word[0].isupper() and len(word) > 4:
-                    base_weight *= 1.3
-                
-                # Uzunluk bazlı ağırlık (orta uzunlukta kelimeler daha anlamlı)
-                if 4 <= len(word) <= 8:
-                    base_weight *= 1.2
-                elif 9 <= len(word) <= 12:
-                    base_weight *= 1.1
+            for word in kept_words:
+                base_weight = word_base_weights.get(word)
+                if base_weight is None:
+                    base_weight = word_weight(word, {sentiment: frequencies[sentiment][word.lower()]
+                                                     for sentiment in sentiment_texts})
+                    word_base_weights[word] = base_weight
                 
                 word_weights[word.lower()] = word_weights.get(word.lower(), 0) + base_weight
             
@@ -528,61 +967,87 @@ class SentimentService:
                             if weight >= min_frequency}
             
             # N-gram'lar ekle (2-kelimeli anlamlı kombinasyonlar)
-            bigrams = self._extract_meaningful_bigrams(comments, extended_stop_words)
+            bigrams = self._extract_meaningful_bigrams(texts, extended_stop_words)
             filtered_words.update(bigrams)
             
             # Sırala ve döndür
             sorted_words = sorted(filtered_words.items(), key=lambda x: x[1], reverse=True)
             
-            # Sentiment bilgisi ekle
-            result = []
-            for word, weight in sorted_words[:max_words]:
-                # Bu kelimenin hangi duyguda daha çok geçtiğini bul
-                sentiment_counts = {}
-                for sentiment, texts in sentiment_texts.items():
-                    count = sum(1 for text in texts if word.lower() in text.lower())
-                    if count > 0:
-                        sentiment_counts[sentiment] = count
-                
-                # Dominant duyguyu belirle
-                dominant_sentiment = 'neutral'
-                if sentiment_counts:
-                    dominant_sentiment = max(sentiment_counts.items(), key=lambda x: x[1])[0]
-                
-                result.append({
-                    "text": word.title() if word.islower() else word,
-                    "value": int(weight),
-                    "sentiment": dominant_sentiment,
-                    "sentiment_distribution": sentiment_counts
-                })
+            # Seçilen kelimeler ve bigram'lar için duygu dağılımı
+            top_words = sorted_words[:max_words]
+            top_frequencies = document_frequencies(lowered_texts, {word.lower() for word, _ in top_words})
             
-            return result
+            # Sentiment bilgisi ekle
+            return [
+                word_cloud_item(word, weight, {sentiment: top_frequencies[sentiment][word.lower()]
+                                                     for sentiment in sentiment_texts})
+                for word, weight in top_words
+            ]
                     
         except Exception as e:
             self.logger.error(f"Kelime bulutu oluşturma hatası: {str(e)}")
             return []
 
-    def _extract_meaningful_bigrams(self, comments: List[Dict[str, Any]], stop_words: set, min_freq: int = 2) -> Dict[str, float]:
-        """Anlamlı 2-kelimeli kombinasyonları çıkarır"""
+    def _approximate_word_cloud(self, texts: List[Any], categories: List[Optional[str]],
+                                total_comments: int, max_words: int,
+                                accumulator: Optional[SentimentAccumulator] = None) -> List[Dict[str, Any]]:
+        """
+        Sınırlı bellekli (yaklaşık) kelime bulutu
+        
+        Kelimeler ve bigram'lar tek geçişte Space-Saving + Count-Min özetlerine
+        eklenir; bellek yorum ve kelime sayısından bağımsızdır. Ağırlıklar ve
+        filtreler tam moddakiyle aynıdır; farklar:
+        - Geçiş sayıları üst sınırdır: en fazla min(N / kapasite, epsilon * N)
+          fazla (ikincisi 1 - delta olasılıkla; N: toplam kelime geçişi)
+        - Duygu dağılımı alt dizi yerine kelimenin yorumun tokenları arasında
+          bulunmasına göre sayılır ve en fazla epsilon * (duygudaki yorum-kelime
+          çifti sayısı) fazladır
+        """
+        stop_words = self.word_cloud_stop_words
+        sketches = [
+            HeavyHitterSketch(self.word_cloud_capacity, self.word_cloud_epsilon, self.word_cloud_delta, CATEGORIES)
+            for _ in range(2)
+        ]
+        word_sketch, bigram_sketch = sketches
+        for text, category in zip(texts, categories):
+            tokens = self.text_normalizer.tokens(text) if isinstance(text, str) else ()
+            words = [word for word in tokens if self._is_cloud_word(word, stop_words)]
+            word_sketch.add_document(words, category)
+            if accumulator is not None:
+                accumulator.add_words(words, category)
+            bigram_sketch.add_document(self._meaningful_bigrams(tokens, stop_words), category)
+        
+        # Kelimeler birleştirilebilir istatistiklerin kelime bulutuyla aynı ağırlıklarla seçilir
+        weighted = weighted_words(word_sketch, max(1, total_comments // 100))
+        for bigram in bigram_sketch.heavy_hitters():
+            weight = bigram_sketch.count(bigram) * 1.5
+            if weight >= 2:
+                weighted.append((bigram, weight, bigram_sketch.document_counts(bigram)))
+        
+        weighted.sort(key=lambda x: x[1], reverse=True)
+        return [word_cloud_item(term, weight, documents) for term, weight, documents in weighted[:max_words]]
+
+    def _meaningful_bigrams(self, words: Sequence[str], stop_words: set) -> List[str]:
+        """Token dizisindeki anlamlı 2-kelimeli kombinasyonlar (geçiş sırasıyla)"""
+        bigrams = []
+        for i in range(len(words) - 1):
+            word1, word2 = words[i].lower(), words[i + 1].lower()
+            
+            # Filtrele
+            if (len(word1) >= 3 and len(word2) >= 3 and 
+                word1 not in stop_words and word2 not in stop_words and
+                not word1.isdigit() and not word2.isdigit()):
+                bigrams.append(f"{word1} {word2}")
+        return bigrams
+
+    def _extract_meaningful_bigrams(self, texts: List[Any], stop_words: set, min_freq: int = 2) -> Dict[str, float]:
+        """Yorum metinlerinden anlamlı 2-kelimeli kombinasyonları çıkarır"""
         try:
             bigram_weights = {}
             
-            for comment in comments:
-                text = comment.get('text', '')
-                cleaned_text = self.clean_text(text)
-                words = cleaned_text.split()
-                
-                # 2-gram'ları oluştur
-                for i in range(len(words) - 1):
-                    word1, word2 = words[i].lower(), words[i + 1].lower()
-                    
-                    # Filtrele
-                    if (len(word1) >= 3 and len(word2) >= 3 and 
-                        word1 not in stop_words and word2 not in stop_words and
-                        not word1.isdigit() and not word2.isdigit()):
-                        
-                        bigram = f"{word1} {word2}"
-                        bigram_weights[bigram] = bigram_weights.get(bigram, 0) + 1.5
+            for text in texts:
+                for bigram in self._meaningful_bigrams(self.text_normalizer.tokens(text), stop_words):
+                    bigram_weights[bigram] = bigram_weights.get(bigram, 0) + 1.5
             
             # Minimum frekans filtresi
             return {bigram: weight for bigram, weight in bigram_weights.items() 
@@ -592,194 +1057,209 @@ class SentimentService:
             self.logger.error(f"Bigram çıkarma hatası: {str(e)}")
             return {}
 
-    def analyze_theme(self, text: str) -> Dict[str, float]:
-        """Metin için gelişmiş tema analizi yapar"""
-        try:
-            if not text or len(text.strip()) == 0:
-                return {theme: 0.0 for theme in self.theme_categories}
-
-            # Metni temizle
-            cleaned_text = self.clean_text(text)
-            original_text = text.lower()
-            
-            # Anahtar kelime bazlı tema skoru hesaplama
-            keyword_scores = {}
-            for theme, keywords in self.theme_keywords.items():
-                score = 0.0
-                word_count = 0
-                
-                for keyword in keywords:
-                    # Anahtar kelimenin metinde geçme sıklığı
-                    keyword_count = original_text.count(keyword.lower())
-                    if keyword_count > 0:
-                        # Kelime uzunluğuna göre ağırlık (daha uzun kelimeler daha önemli)
-                        weight = len(keyword) / 10.0
-                        score += keyword_count * weight
-                        word_count += keyword_count
-                
-                # Normalize et (0-1 arası)
-                if word_count > 0:
-                    keyword_scores[theme] = min(score / 5.0, 1.0)  # Max 1.0
-                else:
-                    keyword_scores[theme] = 0.0
-            
-            # ML tabanlı tema analizi (sadece anlamlı temalar için)
-            ml_scores = {}
+    def _keyword_theme_scores(self, original_text: str, taxonomy: Optional[ThemeTaxonomy] = None) -> Dict[str, float]:
+        """Anahtar kelime bazlı tema skorlarını hesaplar (metin küçük harfe çevrilmiş olmalı)"""
+        taxonomy = taxonomy or self.taxonomy
+        
+        # Tüm anahtar kelimelerin metinde geçme sıklığı tek taramada bulunur
+        theme_hits = taxonomy.matcher.group_hits(original_text)
+        
+        keyword_scores = {}
+        for theme in taxonomy.keywords:
+            score = 0.0
+            word_count = 0
+            
+            for keyword, keyword_count in theme_hits.get(theme, ()):
+                # Kelime uzunluğuna göre ağırlık (daha uzun kelimeler daha önemli)
+                weight = len(keyword) / 10.0
+                score += keyword_count * weight
+                word_count += keyword_count
+            
+            # Normalize et (0-1 arası)
+            if word_count > 0:
+                keyword_scores[theme] = min(score / 5.0, 1.0)  # Max 1.0
+            else:
+                keyword_scores[theme] = 0.0
+        return keyword_scores
+
+    def _combine_theme_scores(self, keyword_scores: Dict[str, float], ml_scores: Dict[str, float],
+                              taxonomy: Optional[ThemeTaxonomy] = None) -> Dict[str, float]:
+        """Anahtar kelime ve ML skorlarını hibrit tema skoruna dönüştürür"""
+        taxonomy = taxonomy or self.taxonomy
+        
+        # Hibrit skorlama: Anahtar kelime + ML skorlarını birleştir
+        final_scores = {}
+        for theme in taxonomy.categories:
+            keyword_score = keyword_scores.get(theme, 0.0)
+            ml_score = ml_scores.get(theme, 0.0)
+            
+            # Ağırlıklı ortalama (keyword %60, ML %40)
+            if keyword_score > 0 or ml_score > 0:
+                final_score = (keyword_score * 0.6) + (ml_score * 0.4)
+                final_scores[theme] = round(final_score, 4)
+            else:
+                final_scores[theme] = 0.0
+        
+        # En az 0.05 threshold uygula
+        filtered_scores = {theme: score for theme, score in final_scores.items() if score >= 0.05}
+        
+        # Hiç tema bulunamazsa, en yüksek 3 keyword skorunu döndür
+        if not filtered_scores:
+            top_keyword_themes = sorted(keyword_scores.items(), key=lambda x: x[1], reverse=True)[:3]
+            for theme, score in top_keyword_themes:
+                if score > 0:
+                    filtered_scores[theme] = max(score, 0.1)  # Minimum 0.1 ver
+        
+        return filtered_scores if filtered_scores else taxonomy.empty_scores()
+
+    def _classify_themes_batch(self, requests: List[tuple]) -> List[Optional[Dict[str, float]]]:
+        """
+        Zero-shot tema sınıflandırmasını toplu olarak çalıştırır
+        
+        İstekler aday tema kümelerine göre gruplanır; her grup için hipotezler
+        bir kez oluşturulur ve premise/hipotez çiftleri tek pipeline çağrısında
+        THEME_BATCH_SIZE'lık batch'ler halinde işlenir. multi_label=True ile her
+        tema bağımsız skorlandığından sonuçlar tekli çağrılarla aynıdır.
+        
+        Args:
+            requests: (temizlenmiş metin, aday temalar) çiftleri
+            
+        Returns:
+            List[Dict]: Her istek için tema -> ML skoru; model hatası olan isteklerde None
+        """
+        ml_scores: List[Optional[Dict[str, float]]] = [{} for _ in requests]
+        
+        groups: Dict[tuple, List[int]] = {}
+        for index, (cleaned_text, labels) in enumerate(requests):
+            groups.setdefault(tuple(labels), []).append(index)
+        
+        for labels, indices in groups.items():
+            # Benzer uzunluktaki metinler aynı batch'e düşsün (daha az padding)
+            indices = sorted(indices, key=lambda i: len(requests[i][0]))
             try:
-                # Sadece yüksek keyword skoru olan temaları ML ile kontrol et
-                relevant_themes = [theme for theme, score in keyword_scores.items() if score > 0.1]
+                results = self.theme_classifier(
+                    sequences=[requests[i][0] for i in indices],
+                    candidate_labels=list(labels),
+                    multi_label=True,
+                    batch_size=self.theme_batch_size
+                )
+                if isinstance(results, dict):
+                    results = [results]
                 
-                if relevant_themes and len(cleaned_text) > 10:
-                    # ML analizi yap
-                    result = self.theme_classifier(
-                        sequences=[cleaned_text],
-                        candidate_labels=relevant_themes,
-                        multi_label=True
-                    )
-                    
-                    # Sonuçları parse et
-                    if isinstance(result, list) and len(result) > 0:
-                        first_result = result[0]
-                        if isinstance(first_result, dict) and 'labels' in first_result and 'scores' in first_result:
-                            ml_scores = dict(zip(first_result['labels'], first_result['scores']))
+                # Sonuçları parse et
+                for index, result in zip(indices, results):
+                    if isinstance(result, dict) and 'labels' in result and 'scores' in result:
+                        ml_scores[index] = dict(zip(result['labels'], result['scores']))
             
             except Exception as ml_error:
                 self.logger.warning(f"ML tema analizi hatası, anahtar kelime analizi kullanılıyor: {ml_error}")
-            
-            # Hibrit skorlama: Anahtar kelime + ML skorlarını birleştir
-            final_scores = {}
-            for theme in self.theme_categories:
-                keyword_score = keyword_scores.get(theme, 0.0)
-                ml_score = ml_scores.get(theme, 0.0)
-                
-                # Ağırlıklı ortalama (keyword %60, ML %40)
-                if keyword_score > 0 or ml_score > 0:
-                    final_score = (keyword_score * 0.6) + (ml_score * 0.4)
-                    final_scores[theme] = round(final_score, 4)
-                else:
-                    final_scores[theme] = 0.0
-            
-            # En az 0.05 threshold uygula
-            filtered_scores = {theme: score for theme, score in final_scores.items() if score >= 0.05}
-            
-            # Hiç tema bulunamazsa, en yüksek 3 keyword skorunu döndür
-            if not filtered_scores:
-                top_keyword_themes = sorted(keyword_scores.items(), key=lambda x: x[1], reverse=True)[:3]
-                for theme, score in top_keyword_themes:
-                    if score > 0:
-                        filtered_scores[theme] = max(score, 0.1)  # Minimum 0.1 ver
-            
-            return filtered_scores if filtered_scores else {theme: 0.0 for theme in self.theme_categories}
-            
-        except Exception as e:
-            self.logger.error(f"Tema analizi hatası: {str(e)}")
-            return {theme: 0.0 for theme in self.theme_categories}
-
-    def clean_text(self, text: str) -> str:
-        """Metni temizler ve normalize eder."""
-        if not text:
-            return ""
-            
-        # Küçük harfe çevir
-        text = text.lower()
-        
-        # URL'leri kaldır
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+                for index in indices:
+                    ml_scores[index] = None
         
-        # Email adreslerini kaldır
-        text = re.sub(r'\S+@\S+', '', text)
+        return ml_scores
+
+    def _compute_themes_batch(self, texts: List[str],
+                              taxonomy: Optional[ThemeTaxonomy] = None) -> Tuple[List[Dict[str, float]], List[bool]]:
+        """Önbelleğe bakmadan toplu tema analizi yapar; sonuçları ve önbelleğe alınabilirliklerini döndürür"""
+        taxonomy = taxonomy or self.taxonomy
+        results: List[Optional[Dict[str, float]]] = [None] * len(texts)
+        cacheable = [True] * len(texts)
+        keyword_results = {}
+        ml_requests = []
+        ml_indices = []
         
-        # Emojileri koruyarak diğer özel karakterleri kaldır
-        text = re.sub(r'[^\w\s\u263a-\U0001f645]', ' ', text)
+        for index, text in enumerate(texts):
+            try:
+                if not text or len(text.strip()) == 0:
+                    results[index] = taxonomy.empty_scores()
+                    continue
+                
+                # Metni temizle
+                cleaned_text = self.text_normalizer.clean(text)
+                
+                # Anahtar kelime bazlı tema skoru hesaplama
+                keyword_scores = self._keyword_theme_scores(text.lower(), taxonomy)
+                keyword_results[index] = keyword_scores
+                
+                # ML tabanlı tema analizi (sadece yüksek keyword skoru olan temalar için)
+                relevant_themes = [theme for theme, score in keyword_scores.items() if score > 0.1]
+                if relevant_themes and len(cleaned_text) > 10:
+                    ml_requests.append((cleaned_text, relevant_themes))
+                    ml_indices.append(index)
+            except Exception as e:
+                self.logger.error(f"Tema analizi hatası: {str(e)}")
+                results[index] = taxonomy.empty_scores()
+                cacheable[index] = False
         
-        # Sayıları kaldır (ama zamanları koru)
-        text = re.sub(r'\b\d{5,}\b', '', text)  # 5+ haneli sayıları kaldır
+        ml_results = dict(zip(ml_indices, self._classify_themes_batch(ml_requests))) if ml_requests else {}
         
-        # Çoklu boşlukları tek boşluğa çevir
-        text = re.sub(r'\s+', ' ', text)
+        for index, keyword_scores in keyword_results.items():
+            ml_scores = ml_results.get(index, {})
+            if ml_scores is None:
+                # ML başarısız oldu; yalnızca anahtar kelime skorları kullanılır, sonuç önbelleğe alınmaz
+                ml_scores = {}
+                cacheable[index] = False
+            try:
+                results[index] = self._combine_theme_scores(keyword_scores, ml_scores, taxonomy)
+            except Exception as e:
+                self.logger.error(f"Tema analizi hatası: {str(e)}")
+                results[index] = taxonomy.empty_scores()
+                cacheable[index] = False
         
-        # Stopwords'leri kaldır
-        words = text.split()
-        words = [word for word in words if word not in self.stop_words]
+        return results, cacheable
+
+    def _analyze_themes(self, texts: List[str]) -> Tuple[List[Dict[str, float]], List[bool]]:
+        """Önbellek üzerinden toplu tema analizi yapar; sonuçları ve önbelleğe alınabilirliklerini döndürür"""
+        self._maybe_reload_taxonomy()
         
-        # Tekrar eden boşlukları kaldır
-        text = ' '.join(words)
-        text = re.sub(r'\s+', ' ', text).strip()
+        # Anahtarlar ve skorlar aynı taksonomi anlık görüntüsüyle hesaplanır
+        taxonomy = self.taxonomy
+        return self._cached_batch(
+            texts,
+            lambda text: self._theme_cache_key(text, taxonomy),
+            lambda pending: self._compute_themes_batch(pending, taxonomy)
+        )
+
+    def analyze_themes_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        """
+        Metin listesi için toplu tema analizi yapar
         
-        return text 
+        Args:
+            texts: Analiz edilecek metinler
+            
+        Returns:
+            List[Dict]: Girdi sırasıyla hibrit (anahtar kelime + ML) tema skorları
+        """
+        return self._analyze_themes(texts)[0]
+
+    def analyze_theme(self, text: str) -> Dict[str, float]:
+        """Metin için gelişmiş tema analizi yapar"""
+        return self.analyze_themes_batch([text])[0]
 
-    def get_theme_analysis(self, comments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def clean_text(self, text: str) -> str:
+        """Metni temizler ve normalize eder."""
+        return self.text_normalizer.clean(text)
+
+    def get_theme_analysis(self, comments: AnalyzedComments,
+                           frame: Optional[AnalysisFrame] = None) -> List[Dict[str, Any]]:
         """
         Yorumlar için tema analizi sonuçlarını döndürür
         
         Args:
             comments: Analiz edilmiş yorumlar
+            frame: Yorumların önceden oluşturulmuş sütunlu gösterimi (opsiyonel)
             
         Returns:
             List[Dict]: Tema analizi sonuçları
         """
         try:
-            theme_counts = {}
-            theme_scores = {}
-            total_comments = len(comments)
-            
-            # Her yorum için tema skorlarını topla
-            for comment in comments:
-                # Hem sentiment altındaki theme hem de doğrudan theme alanını kontrol et
-                themes = comment.get('theme', {})
-                if not themes and 'sentiment' in comment:
-                    themes = comment['sentiment'].get('theme', {})
-                
-                for theme, score in themes.items():
-                    if score > 0.05:  # Düşürülmüş eşik değeri
-                        theme_counts[theme] = theme_counts.get(theme, 0) + 1
-                        if theme not in theme_scores:
-                            theme_scores[theme] = []
-                        theme_scores[theme].append(score)
-            
-            # Tema analizi sonuçlarını oluştur
-            theme_analysis = []
-            for theme, count in theme_counts.items():
-                percentage = (count / total_comments * 100) if total_comments > 0 else 0
-                avg_score = sum(theme_scores[theme]) / len(theme_scores[theme]) if theme in theme_scores else 0
-                
-                theme_analysis.append({
-                    'theme': theme,
-                    'count': count,
-                    'percentage': round(percentage, 2),
-                    'avg_score': round(avg_score, 3)
-                })
+            # Hem sentiment altındaki theme hem de doğrudan theme alanı tema matrisine alınmıştır
+            frame = frame or self._analysis_frame(comments)
+            accumulator = SentimentAccumulator().add_themes(frame)
+            accumulator.total = len(comments)
             
-            # Sayıya göre sırala
-            theme_analysis.sort(key=lambda x: x['count'], reverse=True)
-            
-            # En az bir tema olması için fallback
-            if not theme_analysis and total_comments > 0:
-                # En yüksek skorlu temaları bul
-                all_themes_scores = {}
-                for comment in comments:
-                    themes = comment.get('theme', {})
-                    if not themes and 'sentiment' in comment:
-                        themes = comment['sentiment'].get('theme', {})
-                    
-                    for theme, score in themes.items():
-                        if theme not in all_themes_scores:
-                            all_themes_scores[theme] = []
-                        all_themes_scores[theme].append(score)
-                
-                # En yüksek ortalama skora sahip temaları ekle
-                for theme, scores in all_themes_scores.items():
-                    if scores:
-                        avg_score = sum(scores) / len(scores)
-                        if avg_score > 0.01:  # Çok düşük eşik
-                            theme_analysis.append({
-                                'theme': theme,
-                                'count': len(scores),
-                                'percentage': round((len(scores) / total_comments * 100), 2),
-                                'avg_score': round(avg_score, 3)
-                            })
-                
-                theme_analysis.sort(key=lambda x: x['avg_score'], reverse=True)
+            # Eşiği aşan temalar sayıya göre; yoksa en yüksek ortalama skora sahip temalar
+            theme_analysis = accumulator.theme_analysis()
             
             return theme_analysis[:15]  # En fazla 15 tema döndür
             
@@ -787,8 +1267,85 @@ class SentimentService:
             self.logger.error(f"Tema analizi sonuçları oluşturma hatası: {str(e)}")
             return []
 
+    def summarize_analysis(self, analyzed_comments: AnalyzedComments, max_words: int = 100,
+                           word_cloud_mode: Optional[WordCloudMode] = None,
+                           rollup: Optional[SentimentAccumulator] = None) -> Tuple[
+            Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Analiz edilmiş yorumlar için istatistikleri, kelime bulutunu ve tema analizini hesaplar
+        
+        Args:
+            analyzed_comments: Analiz edilmiş yorumlar
+            max_words: Kelime bulutundaki en fazla kelime sayısı
+            word_cloud_mode: Kelime bulutu modu (exact | approximate, varsayılan WORD_CLOUD_MODE)
+            rollup: Bu yorumların istatistik birikiminin (kelime özeti dahil) ekleneceği
+                birikim (opsiyonel); yorumlar bunun için ikinci kez taranmaz
+        
+        Returns:
+            Tuple: (duygu istatistikleri, kelime bulutu, tema analizi)
+        """
+        # Sütunlu gösterim bir kez oluşturulur; istatistikler ve tema analizi aynı birikimden,
+        # birikimin kelime özeti kelime bulutunun token taramasında üretilir
+        frame = self._analysis_frame(analyzed_comments)
+        accumulator = self.create_accumulator().add_frame(frame)
+        
+        # İstatistikleri hesapla
+        sentiment_stats = accumulator.sentiment_stats()
+        
+        # Kelime bulutu oluştur
+        word_cloud = self.get_word_cloud(analyzed_comments, max_words=max_words, frame=frame, mode=word_cloud_mode,
+                                         accumulator=accumulator if rollup is not None else None)
+        
+        # Tema analizi (en fazla 15 tema)
+        theme_analysis = accumulator.theme_analysis()
+        
+        if rollup is not None:
+            rollup.merge(accumulator)
+        
+        # sentiment_stats'e tema verilerini de ekle (backward compatibility için)
+        sentiment_stats['themes'] = {}
+        for theme_item in theme_analysis:
+            sentiment_stats['themes'][theme_item['theme']] = theme_item['count']
+        
+        return sentiment_stats, word_cloud, theme_analysis
+
+    def analyze_and_summarize(self, comments: List[Dict[str, Any]], max_words: int = 100,
+                              word_cloud_mode: Optional[WordCloudMode] = None) -> Tuple[
+            CommentRecords, Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Yorumları analiz eder; istatistikleri, kelime bulutunu ve tema analizini hesaplar
+        
+        Senkron ve CPU yoğundur; async kodda analyze_and_summarize_async kullanılmalıdır.
+        
+        Returns:
+            Tuple: (kompakt yorum kayıtları, duygu istatistikleri, kelime bulutu, tema analizi);
+            kayıtlar API yanıtında to_dicts ile yorum listesine çevrilir
+        """
+        records = self.analyze_comment_records(comments)
+        return (records, *self.summarize_analysis(records, max_words=max_words, word_cloud_mode=word_cloud_mode))
+
+    async def analyze_and_summarize_async(self, comments: List[Dict[str, Any]], max_words: int = 100,
+                                          word_cloud_mode: Optional[WordCloudMode] = None,
+                                          rollup: Optional[SentimentAccumulator] = None) -> Tuple[
+            CommentRecords, Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        analyze_and_summarize'ın async karşılığı (mikro-batch + çıkarım yürütücüsü)
+        
+        rollup verilirse yorumların birikimi özet iş parçacığında ayrı bir birikimde
+        üretilir ve rollup'a event loop'ta eklenir.
+        """
+        records = await self.analyze_comment_records_async(comments)
+        video_stats = self.create_accumulator() if rollup is not None else None
+        summary = await inference_executor.run(self.summarize_analysis, records, max_words, word_cloud_mode,
+                                               video_stats)
+        if rollup is not None:
+            rollup.merge(video_stats)
+        return (records, *summary)
+
     async def analyze_and_save_comments(self, comments: List[Dict[str, Any]], user_id: str, 
-                                      video_id: Optional[str] = None, video_title: Optional[str] = None) -> Dict[str, Any]:
+                                      video_id: Optional[str] = None, video_title: Optional[str] = None,
+                                      rollup: Optional[SentimentAccumulator] = None,
+                                      word_cloud_mode: Optional[WordCloudMode] = None) -> Dict[str, Any]:
         """
         Yorumları analiz eder ve sonuçları Firestore'a kaydeder
         
@@ -797,27 +1354,18 @@ class SentimentService:
             user_id: Kullanıcı ID'si
             video_id: Video ID'si (opsiyonel)
             video_title: Video başlığı (opsiyonel)
+            rollup: Bu analizin istatistik birikiminin ekleneceği birikim (opsiyonel, ör. kanal özeti)
+            word_cloud_mode: Kelime bulutu modu (exact | approximate, varsayılan WORD_CLOUD_MODE)
             
         Returns:
             Dict: Analiz sonuçları ve Firestore doküman ID'si
         """
         try:
-            # Yorumları analiz et
-            analyzed_comments = self.analyze_comments(comments)
-            
-            # İstatistikleri hesapla
-            sentiment_stats = self.get_sentiment_stats(analyzed_comments)
-            
-            # Kelime bulutu oluştur
-            word_cloud = self.get_word_cloud(analyzed_comments)
-            
-            # Tema analizi
-            theme_analysis = self.get_theme_analysis(analyzed_comments)
-            
-            # sentiment_stats'e tema verilerini de ekle (backward compatibility için)
-            sentiment_stats['themes'] = {}
-            for theme_item in theme_analysis:
-                sentiment_stats['themes'][theme_item['theme']] = theme_item['count']
+            # Analiz ve istatistikler event loop'u bloklamamak için çıkarım iş parçacığında çalışır;
+            # eşzamanlı analizlerin yorumları mikro-batch katmanında birleştirilir
+            records, sentiment_stats, word_cloud, theme_analysis = \
+                await self.analyze_and_summarize_async(comments, word_cloud_mode=word_cloud_mode, rollup=rollup)
+            analyzed_comments = records.to_dicts()
             
             # Analiz sonuçlarını hazırla
             analysis_result = {
@@ -853,6 +1401,8 @@ class SentimentService:
             
             return result
             
+        except InferenceQueueFullError:
+            raise
         except Exception as e:
             self.logger.error(f"Analiz ve kaydetme hatası: {str(e)}")
             raise Exception(f"Analiz işlemi başarısız: {str(e)}")
@@ -940,22 +1490,10 @@ class SentimentService:
             Dict: Analiz özeti
         """
         try:
-            # Yorumları analiz et
-            analyzed_comments = self.analyze_comments(comments)
-            
-            # İstatistikleri hesapla
-            sentiment_stats = self.get_sentiment_stats(analyzed_comments)
-            
-            # Kelime bulutu oluştur
-            word_cloud = self.get_word_cloud(analyzed_comments, max_words=20)
-            
-            # Tema analizi
-            theme_analysis = self.get_theme_analysis(analyzed_comments)
-            
-            # sentiment_stats'e tema verilerini de ekle (backward compatibility için)
-            sentiment_stats['themes'] = {}
-            for theme_item in theme_analysis:
-                sentiment_stats['themes'][theme_item['theme']] = theme_item['count']
+            records, sentiment_stats, word_cloud, theme_analysis = self.analyze_and_summarize(
+                comments, max_words=20
+            )
+            analyzed_comments = records.to_dicts()
             
             return {
                 'video_id': video_id,
@@ -0,0 +1,45 @@
+import os
+import sqlite3
+from typing import Callable, List, Optional
+
+
+class ProcessLocalConnection:
+    """
+    Süreç (PID) başına açılan SQLite bağlantısı
+
+    SQLite bağlantıları fork() üzerinden kullanılamaz (kilitler süreç
+    başınadır); gunicorn ana süreçte uygulamayı yüklediğinde (preload_app)
+    worker'lar devraldıkları bağlantıyı paylaşarak dosyayı bozabilir. Bağlantı
+    ilk kullanımda açılır ve farklı bir süreçte kullanılırsa yeniden açılır.
+    Devralınan bağlantı kapatılmaz (kapatmak bu sürecin aynı dosyadaki
+    kilitlerini bırakabilir), yalnızca referansı tutulur.
+
+    Çağıranlar erişimi kendi kilitleriyle sıralar (check_same_thread=False).
+    """
+
+    def __init__(self, db_path: str, setup: Optional[Callable[[sqlite3.Connection], None]] = None):
+        self.db_path = db_path
+        self.setup = setup
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._inherited: List[sqlite3.Connection] = []
+
+    def get(self) -> sqlite3.Connection:
+        """Bu sürece ait bağlantıyı döndürür (gerekirse açar ve tabloları oluşturur)"""
+        pid = os.getpid()
+        if self._connection is not None and self._pid == pid:
+            return self._connection
+        if self._connection is not None:
+            self._inherited.append(self._connection)
+            self._connection = None
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        if self.setup is not None:
+            self.setup(connection)
+            connection.commit()
+        self._connection = connection
+        self._pid = pid
+        return connection
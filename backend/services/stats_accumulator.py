@@ -0,0 +1,226 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+from services.analysis_frame import AnalysisFrame, CATEGORIES, THEME_THRESHOLD, sequential_sum
+from services.word_cloud import HeavyHitterSketch, weighted_words, word_cloud_item
+
+CONFIDENCE_BUCKETS = ("high", "medium", "low")
+POLARITY_BUCKETS = ("strongly_positive", "moderately_positive", "neutral", "moderately_negative", "strongly_negative")
+
+# Kelime özetinde izlenecek kelime sayısı ve Count-Min hata sınırları
+# (WORD_SKETCH_CAPACITY, WORD_CLOUD_APPROX_EPSILON ve WORD_CLOUD_APPROX_DELTA ile değiştirilebilir)
+DEFAULT_WORD_CAPACITY = 2000
+DEFAULT_WORD_EPSILON = 0.0005
+DEFAULT_WORD_DELTA = 0.01
+
+
+class SentimentAccumulator:
+    """
+    Birleştirilebilir (mergeable) duygu istatistikleri
+
+    get_sentiment_stats, get_theme_analysis ve kelime bulutu için gereken
+    sayaçları, histogramları ve toplamları tutar. Yorumlar parça parça
+    (add_frame) eklenebilir; ayrı parçalardan, videolardan veya
+    işçilerden gelen birikimler merge ile birleştirilir ve sonuçlar
+    yorumlar yeniden taranmadan üretilir.
+
+    Tek parçada toplamlar get_sentiment_stats / get_theme_analysis ile aynı
+    sırada alınır ve sonuçlar birebir aynıdır; birleştirilen parçalarda
+    ortalamalar yalnızca son basamakta farklılaşabilir.
+    """
+
+    def __init__(self, word_capacity: int = DEFAULT_WORD_CAPACITY, word_epsilon: float = DEFAULT_WORD_EPSILON,
+                 word_delta: float = DEFAULT_WORD_DELTA):
+        self.total = 0
+        self.categories: Dict[str, int] = {category: 0 for category in CATEGORIES}
+        self.languages: Dict[str, int] = {}
+        self.confidence: Dict[str, int] = {bucket: 0 for bucket in CONFIDENCE_BUCKETS}
+        self.polarity: Dict[str, int] = {bucket: 0 for bucket in POLARITY_BUCKETS}
+        self.sums: Dict[str, float] = {"polarity": 0.0, "positive_score": 0.0,
+                                       "negative_score": 0.0, "neutral_score": 0.0}
+
+        # Duygu sonucundaki temalar (istatistikler) ve yorum temaları (tema analizi);
+        # sözlükler ilk görülme sırasını korur
+        self.sentiment_themes: Dict[str, int] = {}
+        self.theme_counts: Dict[str, int] = {}
+        self.theme_sums: Dict[str, float] = {}
+        # Eşik uygulanmamış tema skorları (tema analizi fallback'i için)
+        self.theme_all_counts: Dict[str, int] = {}
+        self.theme_all_sums: Dict[str, float] = {}
+
+        # Kelime özeti (approximate kelime bulutuyla aynı yapı); yalnızca kelime eklenen
+        # veya birleştirilen birikimlerde oluşturulur
+        self.word_capacity = word_capacity
+        self.word_epsilon = word_epsilon
+        self.word_delta = word_delta
+        self._words: Optional[HeavyHitterSketch] = None
+
+    @property
+    def words(self) -> HeavyHitterSketch:
+        """Kelime bulutu kelimelerinin birleştirilebilir özeti (Space-Saving + Count-Min)"""
+        if self._words is None:
+            self._words = HeavyHitterSketch(self.word_capacity, self.word_epsilon, self.word_delta, CATEGORIES)
+        return self._words
+
+    def add_frame(self, frame: AnalysisFrame) -> 'SentimentAccumulator':
+        """Sütunlu gösterimdeki yorumların istatistiklerini ve tema skorlarını ekler"""
+        self.add_stats(frame)
+        self.add_themes(frame)
+        return self
+
+    def add_stats(self, frame: AnalysisFrame) -> 'SentimentAccumulator':
+        """Yorumların sayaçlarını, histogramlarını ve toplamlarını ekler (yorum sayısı dahil)"""
+        if not frame.total:
+            return self
+        self.total += frame.total
+        _add_counts(self.categories, frame.category_counts())
+        _add_counts(self.languages, {language: count for language, count in frame.language_counts().items() if count})
+        _add_counts(self.confidence, frame.confidence_histogram())
+        _add_counts(self.polarity, frame.polarity_histogram())
+        self.sums["polarity"] += sequential_sum(frame.polarity)
+        for column, key in enumerate(("positive_score", "negative_score", "neutral_score")):
+            self.sums[key] += sequential_sum(frame.detailed[:, column])
+
+        _add_counts(self.sentiment_themes, frame.theme_counts())
+        return self
+
+    def add_themes(self, frame: AnalysisFrame) -> 'SentimentAccumulator':
+        """
+        Yorum temalarının skorlarını ekler
+
+        Tema analizi tek başına istendiğinde (get_theme_analysis) yorum sayısı
+        add_stats çağrılmadan `total` ile ayrıca artırılır.
+        """
+        scores = frame.comment_themes
+        mask = scores.values > THEME_THRESHOLD
+        _add_theme_scores(self.theme_counts, self.theme_sums, scores, mask)
+        _add_theme_scores(self.theme_all_counts, self.theme_all_sums, scores, None)
+        return self
+
+    def add_words(self, words: Iterable[str], category: Optional[str]) -> 'SentimentAccumulator':
+        """Bir yorumun kelime bulutu kelimelerini ekler"""
+        self.words.add_document(words, category)
+        return self
+
+    def merge(self, other: 'SentimentAccumulator') -> 'SentimentAccumulator':
+        """Başka bir birikimi bu birikime ekler (diğeri değişmez)"""
+        self.total += other.total
+        _add_counts(self.categories, other.categories)
+        _add_counts(self.languages, other.languages)
+        _add_counts(self.confidence, other.confidence)
+        _add_counts(self.polarity, other.polarity)
+        _add_counts(self.sums, other.sums)
+        _add_counts(self.sentiment_themes, other.sentiment_themes)
+        _add_counts(self.theme_counts, other.theme_counts)
+        _add_counts(self.theme_sums, other.theme_sums)
+        _add_counts(self.theme_all_counts, other.theme_all_counts)
+        _add_counts(self.theme_all_sums, other.theme_all_sums)
+        if other._words is not None:
+            self.words.merge(other._words)
+        return self
+
+    def sentiment_stats(self) -> Dict[str, Any]:
+        """get_sentiment_stats ile aynı biçimde duygu istatistikleri"""
+        total = self.total
+        if total == 0:
+            return {
+                "total": 0,
+                "categories": {
+                    "positive": 0,
+                    "negative": 0,
+                    "neutral": 0
+                },
+                "average_polarity": 0,
+                "language_distribution": {"tr": 0, "en": 0},
+                "themes": {},
+                "confidence_distribution": {
+                    "high": 0,    # >0.8
+                    "medium": 0,  # 0.5-0.8
+                    "low": 0      # <0.5
+                },
+                "polarity_distribution": {
+                    "strongly_positive": 0,  # >0.5
+                    "moderately_positive": 0, # 0.1-0.5
+                    "neutral": 0,            # -0.1-0.1
+                    "moderately_negative": 0, # -0.5-(-0.1)
+                    "strongly_negative": 0   # <-0.5
+                }
+            }
+
+        return {
+            "total": total,
+            "categories": dict(self.categories),
+            "average_polarity": round(self.sums["polarity"] / total, 4),
+            "language_distribution": {"tr": 0, "en": 0, **self.languages},
+            # Temaları büyükten küçüğe sırala
+            "themes": dict(sorted(self.sentiment_themes.items(), key=lambda x: x[1], reverse=True)),
+            "confidence_distribution": dict(self.confidence),
+            "polarity_distribution": dict(self.polarity),
+            "detailed_averages": {
+                "positive_score": round(self.sums["positive_score"] / total, 4),
+                "negative_score": round(self.sums["negative_score"] / total, 4),
+                "neutral_score": round(self.sums["neutral_score"] / total, 4)
+            },
+            "sentiment_ratios": {
+                "positive_ratio": round(self.categories["positive"] / total, 4),
+                "negative_ratio": round(self.categories["negative"] / total, 4),
+                "neutral_ratio": round(self.categories["neutral"] / total, 4)
+            }
+        }
+
+    def theme_analysis(self, limit: int = 15) -> List[Dict[str, Any]]:
+        """get_theme_analysis ile aynı biçimde tema analizi"""
+        total = self.total
+        analysis = [
+            {
+                'theme': theme,
+                'count': count,
+                'percentage': round((count / total * 100) if total > 0 else 0, 2),
+                'avg_score': round(self.theme_sums[theme] / count, 3)
+            }
+            for theme, count in self.theme_counts.items()
+        ]
+        analysis.sort(key=lambda x: x['count'], reverse=True)
+
+        # Eşiği aşan tema yoksa en yüksek ortalama skora sahip temalar (çok düşük eşik)
+        if not analysis and total > 0:
+            for theme, count in self.theme_all_counts.items():
+                avg_score = self.theme_all_sums[theme] / count
+                if avg_score > 0.01:
+                    analysis.append({
+                        'theme': theme,
+                        'count': count,
+                        'percentage': round((count / total * 100), 2),
+                        'avg_score': round(avg_score, 3)
+                    })
+            analysis.sort(key=lambda x: x['avg_score'], reverse=True)
+
+        return analysis[:limit]
+
+    def word_cloud(self, max_words: int = 100) -> List[Dict[str, Any]]:
+        """
+        Kelime özetinden yaklaşık kelime bulutu
+
+        approximate moddaki kelime bulutunun kelime kısmıyla aynı ağırlıklar ve
+        öğe biçimi kullanılır; bigram'lar dahil edilmez.
+        """
+        if self._words is None:
+            return []
+        weighted = weighted_words(self._words, max(1, self.total // 100))
+        weighted.sort(key=lambda item: item[1], reverse=True)
+        return [word_cloud_item(word, weight, documents) for word, weight, documents in weighted[:max_words]]
+
+
+def _add_counts(target: Dict[str, Any], counts: Dict[str, Any]):
+    """Sayaç sözlüğünü hedefe ekler (yeni anahtarlar sona eklenir)"""
+    for key, value in counts.items():
+        target[key] = target.get(key, 0) + value
+
+
+def _add_theme_scores(counts: Dict[str, int], sums: Dict[str, float], scores, mask):
+    """Maskedeki tema skorlarının sayılarını ve toplamlarını ilk görülme sırasıyla ekler"""
+    column_counts = scores.counts(mask)
+    values = scores.column_values(mask)
+    for column in scores.first_seen_order(mask):
+        theme = scores.themes[column]
+        counts[theme] = counts.get(theme, 0) + int(column_counts[column])
+        sums[theme] = sums.get(theme, 0.0) + sum(values[column])
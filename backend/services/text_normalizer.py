@@ -0,0 +1,60 @@
+import re
+from functools import lru_cache
+from typing import Iterable, Tuple
+
+# URL'ler
+URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+# Email adresleri
+EMAIL_PATTERN = re.compile(r'\S+@\S+')
+# Emojiler dışındaki özel karakterler (boşlukla değiştirilir) veya 5+ haneli sayılar (kaldırılır)
+SYMBOL_OR_NUMBER_PATTERN = re.compile(r'(\b\d{5,}\b)|[^\w\s\u263a-\U0001f645]')
+
+
+def _replace_symbol_or_number(match: re.Match) -> str:
+    return '' if match.group(1) else ' '
+
+
+class TextNormalizer:
+    """
+    Yorum metinleri için önceden derlenmiş, tek geçişli normalizasyon
+
+    Metin küçük harfe çevrilir; URL, email, özel karakter ve uzun sayılar
+    derlenmiş desenlerle temizlenir, stopwords çıkarılıp tokenlara ayrılır.
+    URL ve email desenleri yalnızca metinde "http" / "@" geçiyorsa çalışır;
+    özel karakter ve sayı temizliği tek geçiştedir. Token listeleri metin
+    bazında LRU önbellekte tutulur; böylece aynı analizde tema skorlama,
+    kelime bulutu ve bigram çıkarımı her yorumu yalnızca bir kez temizler.
+    """
+
+    def __init__(self, stop_words: Iterable[str], cache_size: int = 50000):
+        self.stop_words = frozenset(stop_words)
+        self.tokens = lru_cache(maxsize=cache_size)(self._tokenize)
+
+    def _tokenize(self, text: str) -> Tuple[str, ...]:
+        """Metni temizleyip stopwords içermeyen tokenlara ayırır"""
+        if not text:
+            return ()
+
+        # Küçük harfe çevir
+        text = text.lower()
+
+        # URL'leri ve email adreslerini kaldır
+        if 'http' in text:
+            text = URL_PATTERN.sub('', text)
+        if '@' in text:
+            text = EMAIL_PATTERN.sub('', text)
+
+        # Emojileri koruyarak diğer özel karakterleri ve 5+ haneli sayıları kaldır
+        text = SYMBOL_OR_NUMBER_PATTERN.sub(_replace_symbol_or_number, text)
+
+        # Boşluklara göre ayır ve stopwords'leri kaldır
+        stop_words = self.stop_words
+        return tuple(word for word in text.split() if word not in stop_words)
+
+    def clean(self, text: str) -> str:
+        """Temizlenmiş metni tek boşlukla birleştirilmiş tokenlar olarak döndürür"""
+        return ' '.join(self.tokens(text))
+
+    def cache_info(self):
+        """Token önbelleğinin isabet/ıska bilgisini döndürür"""
+        return self.tokens.cache_info()
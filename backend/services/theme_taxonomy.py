@@ -0,0 +1,85 @@
+import os
+import json
+import hashlib
+from typing import Dict, List, Optional, Tuple
+
+from services.keyword_matcher import KeywordMatcher
+
+# Varsayılan taksonomi dosyası (THEME_TAXONOMY_PATH ile değiştirilebilir)
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                     "app", "data", "theme_taxonomy.json")
+
+
+class ThemeTaxonomy:
+    """
+    Tema kategorileri, anahtar kelimeleri ve bunlardan derlenen yapıların değişmez anlık görüntüsü
+
+    Yeniden yüklemede yeni bir örnek oluşturulup tek atamayla değiştirilir;
+    devam eden analizler başladıkları örneği kullanmaya devam eder.
+    """
+
+    def __init__(self, version: str, themes: List[Tuple[str, List[str]]], digest: str = "",
+                 path: Optional[str] = None, mtime: float = 0.0):
+        self.version = version
+        self.categories: List[str] = [name for name, _ in themes]
+        self.keywords: Dict[str, List[str]] = {name: list(keywords) for name, keywords in themes}
+        self.matcher = KeywordMatcher(self.keywords)
+        self.digest = digest
+        self.path = path
+        self.mtime = mtime
+
+    @property
+    def cache_id(self) -> str:
+        """Önbellek anahtarlarında kullanılan kimlik (sürüm + içerik özeti)"""
+        return f"{self.version}:{self.digest[:12]}" if self.digest else self.version
+
+    def empty_scores(self) -> Dict[str, float]:
+        """Tüm temalar için sıfır skor sözlüğü"""
+        return {theme: 0.0 for theme in self.categories}
+
+    def to_dict(self) -> Dict[str, object]:
+        """API yanıtı için taksonomi içeriğini döndürür"""
+        return {
+            "version": self.version,
+            "digest": self.digest,
+            "themes": [{"name": name, "keywords": self.keywords[name]} for name in self.categories]
+        }
+
+
+def load_theme_taxonomy(path: str) -> ThemeTaxonomy:
+    """
+    Tema taksonomisini JSON dosyasından yükler ve doğrular
+
+    Dosya biçimi:
+        {"version": "1", "themes": [{"name": "...", "keywords": ["...", ...]}, ...]}
+
+    Raises:
+        ValueError: Dosya biçimi geçersizse
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    mtime = os.path.getmtime(path)
+
+    data = json.loads(raw.decode("utf-8"))
+    version = data.get("version") if isinstance(data, dict) else None
+    if not version:
+        raise ValueError("Tema taksonomisinde 'version' alanı eksik")
+
+    themes = []
+    seen = set()
+    for item in data.get("themes") or []:
+        name = item.get("name") if isinstance(item, dict) else None
+        keywords = item.get("keywords", []) if isinstance(item, dict) else None
+        if not isinstance(name, str) or not name:
+            raise ValueError(f"Geçersiz tema kaydı: {item}")
+        if not isinstance(keywords, list) or not all(isinstance(keyword, str) for keyword in keywords):
+            raise ValueError(f"'{name}' teması için anahtar kelimeler metin listesi olmalı")
+        if name in seen:
+            raise ValueError(f"Tekrarlanan tema: {name}")
+        seen.add(name)
+        themes.append((name, keywords))
+
+    if not themes:
+        raise ValueError("Tema taksonomisi en az bir tema içermeli")
+
+    return ThemeTaxonomy(str(version), themes, hashlib.sha256(raw).hexdigest(), path, mtime)
@@ -0,0 +1,337 @@
+import hashlib
+import heapq
+import math
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Kelime bulutu modu: exact (tüm kelime ve bigram sayıları) veya approximate (sınırlı bellekli özetler)
+WordCloudMode = Literal["exact", "approximate"]
+
+# Harf dizileri (rakam ve alt çizgi hariç \w karakterleri)
+ALPHA_RUN = re.compile(r'[^\W\d_]+')
+
+
+def document_frequencies(texts_by_category: Dict[str, List[str]], terms: Iterable[str],
+                         min_length: int = 3) -> Dict[str, Counter]:
+    """
+    Her kategori için terimlerin kaç metinde alt dizi (substring) olarak geçtiğini sayar
+
+    `term in text` testini her terim x her metin için tekrarlamak yerine her
+    metin bir kez taranır: yalnızca harflerden oluşan bir terim metinde ancak
+    bir harf dizisinin içinde geçebileceğinden, metindeki harf dizilerinin
+    terim uzunluğundaki alt dizileri terim kümesinde aranır (ters indeks).
+    Yorumlar arasında tekrar eden harf dizileri yalnızca bir kez açılır.
+    Sonuç alt dizi testiyle birebir aynıdır; süre metin uzunluğuyla doğrusal
+    artar. Harf dışı karakter içeren terimler (ör. bigram'lar) doğrudan taranır.
+
+    Args:
+        texts_by_category: Kategori -> küçük harfe çevrilmiş metinler
+        terms: Sayılacak terimler (küçük harf)
+        min_length: Harf terimleri için minimum uzunluk
+
+    Returns:
+        Dict: Kategori -> {terim: terimi içeren metin sayısı}
+    """
+    terms = set(terms)
+    alpha_terms = {term for term in terms if term.isalpha() and len(term) >= min_length}
+    other_terms = terms - alpha_terms
+    max_length = max((len(term) for term in alpha_terms), default=0)
+
+    # Aynı harf dizileri yorumlar arasında sık tekrarlandığından alt dizi sonuçları saklanır
+    run_terms: Dict[str, frozenset] = {}
+
+    def terms_in_run(run: str) -> frozenset:
+        matches = run_terms.get(run)
+        if matches is None:
+            run_length = len(run)
+            matches = frozenset(
+                run[start:end]
+                for start in range(run_length - min_length + 1)
+                for end in range(start + min_length, min(run_length, start + max_length) + 1)
+                if run[start:end] in alpha_terms
+            )
+            run_terms[run] = matches
+        return matches
+
+    frequencies = {}
+    for category, texts in texts_by_category.items():
+        counts = Counter()
+        for text in texts:
+            found = set()
+            for run in ALPHA_RUN.findall(text):
+                if len(run) >= min_length:
+                    found.update(terms_in_run(run))
+            counts.update(found)
+
+        for term in other_terms:
+            count = sum(1 for text in texts if term in text)
+            if count:
+                counts[term] = count
+
+        frequencies[category] = counts
+    return frequencies
+
+
+def word_weight(word: str, document_counts: Dict[str, int]) -> float:
+    """
+    Kelimenin bir geçişinin kelime bulutu ağırlığı
+
+    Args:
+        word: Kelime
+        document_counts: Duygu -> kelimeyi içeren yorum sayısı
+    """
+    # Pozitif ve negatif kelimelere daha fazla ağırlık ver
+    weight = 1
+    weight += document_counts.get('positive', 0) * 1.5
+    weight += document_counts.get('negative', 0) * 1.5
+    weight += document_counts.get('neutral', 0) * 0.8
+
+    # Büyük harf kontrolü (önemli kelimeler genellikle büyük harfle başlar)
+    if word[0].isupper() and len(word) > 4:
+        weight *= 1.3
+
+    # Uzunluk bazlı ağırlık (orta uzunlukta kelimeler daha anlamlı)
+    if 4 <= len(word) <= 8:
+        weight *= 1.2
+    elif 9 <= len(word) <= 12:
+        weight *= 1.1
+    return weight
+
+
+def word_cloud_item(word: str, weight: float, document_counts: Dict[str, int]) -> Dict[str, Any]:
+    """Kelime bulutu öğesi: kelime, ağırlık ve en çok geçtiği duygu"""
+    # Bu kelimenin hangi duyguda daha çok geçtiğini bul
+    sentiment_counts = {sentiment: count for sentiment, count in document_counts.items() if count > 0}
+
+    # Dominant duyguyu belirle
+    dominant_sentiment = 'neutral'
+    if sentiment_counts:
+        dominant_sentiment = max(sentiment_counts.items(), key=lambda x: x[1])[0]
+
+    return {
+        "text": word.title() if word.islower() else word,
+        "value": int(weight),
+        "sentiment": dominant_sentiment,
+        "sentiment_distribution": sentiment_counts
+    }
+
+
+@lru_cache(maxsize=16384)
+def _hash_pair(term: str) -> Tuple[int, int]:
+    """Terimin süreçten bağımsız iki 32 bitlik özeti (çift hashing için)"""
+    digest = hashlib.blake2b(term.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest[:4], 'little'), int.from_bytes(digest[4:], 'little') | 1
+
+
+class CountMinSketch:
+    """
+    Count-Min sketch: sabit bellekte terim sayılarının tahmini
+
+    width = ⌈e / epsilon⌉ ve depth = ⌈ln(1 / delta)⌉ sayaç satırıyla her
+    tahmin gerçek sayıdan küçük olmaz ve 1 - delta olasılıkla gerçek sayıyı
+    en fazla epsilon * total aşar (total: eklenen toplam sayı). Bellek terim
+    sayısından bağımsızdır: depth x width tamsayı.
+    """
+
+    def __init__(self, epsilon: float = 0.0005, delta: float = 0.01):
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.table = np.zeros((self.depth, self.width), dtype=np.int64)
+        self.total = 0
+
+    def _indexes(self, terms: Sequence[str]) -> np.ndarray:
+        """Terimlerin her satırdaki sayaç indeksleri (depth x len(terms))"""
+        pairs = np.array([_hash_pair(term) for term in terms], dtype=np.int64).reshape(-1, 2)
+        rows = np.arange(self.depth, dtype=np.int64)[:, None]
+        return (pairs[:, 0] + rows * pairs[:, 1]) % self.width
+
+    def add_many(self, terms: Sequence[str]):
+        """Her terim geçişi için sayaçları bir artırır"""
+        if not terms:
+            return
+        flat = self._indexes(terms) + np.arange(self.depth, dtype=np.int64)[:, None] * self.width
+        self.table += np.bincount(flat.ravel(), minlength=self.table.size).reshape(self.table.shape)
+        self.total += len(terms)
+
+    def estimate(self, term: str) -> int:
+        """Terim sayısının üst sınır tahmini"""
+        columns = self._indexes([term])[:, 0]
+        return int(self.table[np.arange(self.depth), columns].min())
+
+    def merge(self, other: 'CountMinSketch') -> 'CountMinSketch':
+        """Aynı boyutlu başka bir sketch'in sayaçlarını ekler (hata sınırı toplam sayıyla birlikte büyür)"""
+        if self.table.shape != other.table.shape:
+            raise ValueError("Count-Min sketch'leri yalnızca aynı epsilon/delta ile birleştirilebilir")
+        self.table += other.table
+        self.total += other.total
+        return self
+
+
+class SpaceSaving:
+    """
+    Space-Saving: en sık `capacity` terimi sabit bellekte izler
+
+    İzlenmeyen bir terim geldiğinde en küçük sayaç ona devredilir (sayı =
+    en küçük + 1, hata = en küçük). İzlenen her terimin sayısı gerçek
+    sayıdan küçük olmaz ve gerçek sayıyı en fazla errors[terim] <=
+    total / capacity aşar; gerçek sayısı total / capacity'yi aşan her terim
+    izlenir.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.total = 0
+        # İzlenen her terim için bir (sayı, terim) girişi; sayı eskimiş (küçük) olabilir
+        self._heap: List[Tuple[int, str]] = []
+
+    def add(self, term: str):
+        """Terimin bir geçişini ekler"""
+        self.total += 1
+        counts = self.counts
+        count = counts.get(term)
+        if count is not None:
+            counts[term] = count + 1
+            return
+        if len(counts) < self.capacity:
+            counts[term] = 1
+            self.errors[term] = 0
+            heapq.heappush(self._heap, (1, term))
+            return
+
+        # En küçük sayacı bul; eskimiş girişler güncel sayıyla yeniden yerleştirilir
+        heap = self._heap
+        while True:
+            minimum, victim = heap[0]
+            current = counts[victim]
+            if current == minimum:
+                break
+            heapq.heapreplace(heap, (current, victim))
+        heapq.heapreplace(heap, (minimum + 1, term))
+        del counts[victim]
+        del self.errors[victim]
+        counts[term] = minimum + 1
+        self.errors[term] = minimum
+
+    def minimum(self) -> int:
+        """Dolu özette izlenmeyen bir terimin sayısı için üst sınır (en küçük sayaç; dolu değilse 0)"""
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+
+    def merge(self, other: 'SpaceSaving') -> 'SpaceSaving':
+        """
+        Başka bir özeti ekler
+
+        Bir özette izlenmeyen terimin o özetteki sayısı en fazla o özetin en
+        küçük sayacıdır; sayılar ve hatalar buna göre toplanır ve en büyük
+        `capacity` terim tutulur. Böylece sayılar üst sınır olmaya ve hata
+        toplam / capacity ile sınırlı kalmaya devam eder.
+        """
+        own_minimum, other_minimum = self.minimum(), other.minimum()
+        counts, errors = {}, {}
+        for term in self.counts.keys() | other.counts.keys():
+            counts[term] = self.counts.get(term, own_minimum) + other.counts.get(term, other_minimum)
+            errors[term] = self.errors.get(term, own_minimum) + other.errors.get(term, other_minimum)
+
+        kept = heapq.nlargest(self.capacity, counts.items(), key=lambda item: item[1])
+        self.counts = dict(kept)
+        self.errors = {term: errors[term] for term in self.counts}
+        self.total += other.total
+        self._heap = [(count, term) for term, count in self.counts.items()]
+        heapq.heapify(self._heap)
+        return self
+
+
+class HeavyHitterSketch:
+    """
+    Terimlerin (kelime veya bigram) geçiş sayıları ve duygu bazında belge
+    frekansları için sınırlı bellekli özet
+
+    Sık terimler Space-Saving ile seçilir; geçiş sayıları Space-Saving ve
+    Count-Min tahminlerinin küçüğüdür (ikisi de üst sınırdır), belge
+    frekansları duygu başına bir Count-Min sketch ile tahmin edilir. Count-Min
+    güncellemeleri tamponda biriktirilip toplu (vektörel) uygulanır.
+    """
+
+    def __init__(self, capacity: int, epsilon: float, delta: float,
+                 categories: Sequence[str] = ('positive', 'negative', 'neutral'), buffer_size: int = 8192):
+        self.top = SpaceSaving(capacity)
+        self.occurrences = CountMinSketch(epsilon, delta)
+        self.documents = {category: CountMinSketch(epsilon, delta) for category in categories}
+        self.buffer_size = buffer_size
+        self._pending_occurrences: List[str] = []
+        self._pending_documents: Dict[str, List[str]] = {category: [] for category in categories}
+
+    def add_document(self, terms: Sequence[str], category: Optional[str]):
+        """Bir yorumun terimlerini ve yorumun duygu kategorisini ekler"""
+        add = self.top.add
+        for term in terms:
+            add(term)
+        self._pending_occurrences.extend(terms)
+        pending = self._pending_documents.get(category)
+        if pending is not None:
+            pending.extend(set(terms))
+        if len(self._pending_occurrences) >= self.buffer_size:
+            self._flush()
+
+    def _flush(self):
+        """Tampondaki Count-Min güncellemelerini uygular"""
+        self.occurrences.add_many(self._pending_occurrences)
+        self._pending_occurrences = []
+        for category, terms in self._pending_documents.items():
+            self.documents[category].add_many(terms)
+            terms.clear()
+
+    def merge(self, other: 'HeavyHitterSketch') -> 'HeavyHitterSketch':
+        """
+        Başka bir özeti bu özete ekler (ör. parçalar, videolar, işçiler)
+
+        Özetler aynı epsilon/delta ile oluşturulmuş olmalıdır; sayılar
+        birleştirilmiş özette de üst sınırdır.
+        """
+        self._flush()
+        other._flush()
+        self.top.merge(other.top)
+        self.occurrences.merge(other.occurrences)
+        for category, sketch in self.documents.items():
+            if category in other.documents:
+                sketch.merge(other.documents[category])
+        return self
+
+    def heavy_hitters(self) -> List[str]:
+        """İzlenen (sık) terimler"""
+        return list(self.top.counts)
+
+    def count(self, term: str) -> int:
+        """Terimin geçiş sayısı tahmini (üst sınır)"""
+        self._flush()
+        return min(self.top.counts.get(term, self.top.total), self.occurrences.estimate(term))
+
+    def document_counts(self, term: str) -> Dict[str, int]:
+        """Duygu -> terimi içeren yorum sayısı tahmini (üst sınır)"""
+        self._flush()
+        return {category: sketch.estimate(term) for category, sketch in self.documents.items()}
+
+
+def weighted_words(sketch: HeavyHitterSketch, min_frequency: float) -> List[Tuple[str, float, Dict[str, int]]]:
+    """
+    Özetteki sık kelimelerin kelime bulutu ağırlıkları
+
+    Returns:
+        List: ağırlığı min_frequency'den küçük olmayan (kelime, ağırlık, duygu -> belge sayısı) üçlüleri
+    """
+    weighted = []
+    for word in sketch.heavy_hitters():
+        documents = sketch.document_counts(word)
+        weight = sketch.count(word) * word_weight(word, documents)
+        if weight >= min_frequency:
+            weighted.append((word, weight, documents))
+    return weighted
@@ -0,0 +1,128 @@
+import os
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+from services.fetch_scheduler import AsyncRateLimiter
+
+# YouTube Data API v3 adresi (YOUTUBE_API_BASE_URL ile yerel stub sunucuya yönlendirilebilir)
+DEFAULT_YOUTUBE_API_BASE_URL = "https://www.googleapis.com/youtube/v3"
+
+# İstek başına kota maliyeti (birim); listede olmayan list istekleri 1 birimdir
+QUOTA_COSTS = {
+    "search": 100,
+}
+
+
+class YouTubeApiError(Exception):
+    """YouTube Data API'nin başarısız (HTTP 4xx/5xx) yanıtı"""
+
+    def __init__(self, status: int, message: str, reason: Optional[str] = None):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+        self.reason = reason
+
+
+class YouTubeApiClient:
+    """
+    YouTube Data API v3 için asenkron (httpx) istemci
+
+    Sayfa istekleri olay döngüsünü bloklamadan beklenir; bağlantılar tek
+    bir AsyncClient üzerinden yeniden kullanılır. OAuth token'ı süresi
+    dolmuşsa yenileme (senkron google-auth çağrısı) iş parçacığında
+    yapılır ve yenilenen kimlik bilgisi on_token_refresh ile (ör. dosyaya
+    kaydetmek için) aynı iş parçacığında bildirilir. credentials verilmezse istekler kimlik doğrulamasız gönderilir
+    (yerel stub sunucu ile test için).
+    """
+
+    def __init__(self, credentials: Any = None, base_url: Optional[str] = None,
+                 timeout: Optional[float] = None, transport: Optional[httpx.AsyncBaseTransport] = None,
+                 rate_limit: Optional[float] = None,
+                 on_token_refresh: Optional[Callable[[Any], None]] = None):
+        self.credentials = credentials
+        self.on_token_refresh = on_token_refresh
+        self.base_url = (base_url or os.getenv("YOUTUBE_API_BASE_URL", DEFAULT_YOUTUBE_API_BASE_URL)).rstrip("/")
+        self.timeout = timeout if timeout is not None else float(os.getenv("YOUTUBE_API_TIMEOUT", "30"))
+        self.transport = transport
+        # Saniye başına en fazla istek (0 = sınırsız); eşzamanlı video çekimlerinde kota/hız aşımını önler
+        self.rate_limiter = AsyncRateLimiter(
+            rate_limit if rate_limit is not None else float(os.getenv("YOUTUBE_API_RATE_LIMIT", "20"))
+        )
+        self.logger = logging.getLogger(__name__)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        # Gönderilen istek sayısı (kaynak bazında) ve harcanan tahmini kota birimi
+        self.request_counts: Dict[str, int] = {}
+        self.quota_units = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Bağlantıları yeniden kullanan HTTP istemcisi (ilk istekte oluşturulur)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout, transport=self.transport)
+        return self._client
+
+    async def _authorization(self) -> Dict[str, str]:
+        """Authorization başlığı; gerekirse token'ı yeniler"""
+        if self.credentials is None:
+            return {}
+        if not self.credentials.valid:
+            if self._refresh_lock is None:
+                self._refresh_lock = asyncio.Lock()
+            async with self._refresh_lock:
+                if not self.credentials.valid:
+                    await asyncio.get_running_loop().run_in_executor(None, self._refresh_credentials)
+        return {"Authorization": f"Bearer {self.credentials.token}"}
+
+    def _refresh_credentials(self):
+        """Token'ı yeniler ve yenilenen kimlik bilgisini bildirir (iş parçacığında çalışır)"""
+        from google.auth.transport.requests import Request
+        self.credentials.refresh(Request())
+        if self.on_token_refresh is not None:
+            try:
+                self.on_token_refresh(self.credentials)
+            except Exception as e:
+                # Kaydetme hatası isteği başarısız kılmaz; token bellekte geçerlidir
+                self.logger.warning(f"Yenilenen token kaydedilemedi: {e}")
+
+    async def get(self, resource: str, **params: Any) -> Dict[str, Any]:
+        """
+        API kaynağına GET isteği gönderir
+
+        Args:
+            resource: Kaynak yolu (ör. "channels", "commentThreads")
+            params: Sorgu parametreleri (None olanlar gönderilmez)
+
+        Returns:
+            Dict: JSON yanıt
+
+        Raises:
+            YouTubeApiError: API hata döndürürse
+        """
+        query = {
+            name: ("true" if value else "false") if isinstance(value, bool) else value
+            for name, value in params.items() if value is not None
+        }
+        self.request_counts[resource] = self.request_counts.get(resource, 0) + 1
+        self.quota_units += QUOTA_COSTS.get(resource, 1)
+        await self.rate_limiter.acquire()
+        response = await self.client.get(f"/{resource}", params=query, headers=await self._authorization())
+
+        if response.status_code >= 400:
+            message, reason = response.reason_phrase, None
+            try:
+                error = response.json().get("error", {})
+                message = error.get("message", message)
+                reason = (error.get("errors") or [{}])[0].get("reason")
+            except (ValueError, AttributeError):
+                pass
+            raise YouTubeApiError(response.status_code, message, reason)
+        return response.json()
+
+    async def aclose(self):
+        """HTTP bağlantılarını kapatır"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
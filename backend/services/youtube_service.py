@@ -1,18 +1,38 @@
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Optional
 import os
 import asyncio
 import logging
 from datetime import datetime, timedelta
+from services.inference_executor import InferenceQueueFullError
+from services.word_cloud import WordCloudMode
+from services.youtube_client import YouTubeApiClient, YouTubeApiError
+from services.fetch_scheduler import FetchScheduler
+from services.comment_store import CommentStore, comment_store as default_comment_store
+
+# videos.list isteğinde tek seferde sorgulanabilecek en fazla video ID'si
+VIDEOS_LIST_MAX_IDS = 50
 
 class YouTubeService:
-    def __init__(self, credentials: Credentials):
-        self.youtube = build('youtube', 'v3', credentials=credentials)
+    def __init__(self, credentials: Optional[Credentials], api: Optional[YouTubeApiClient] = None,
+                 comment_store: Optional[CommentStore] = None,
+                 on_token_refresh: Optional[Callable[[Credentials], None]] = None):
+        # Data API istekleri olay döngüsünü bloklamayan asenkron istemciyle yapılır; süresi dolan
+        # token istemci tarafından iş parçacığında yenilenir ve on_token_refresh ile bildirilir
+        self.api = api or YouTubeApiClient(credentials, on_token_refresh=on_token_refresh)
         self.logger = logging.getLogger(__name__)
         
+        # Kanal ID'si ve yüklemeler (uploads) oynatma listesi ID'si değişmediğinden ilk istekten sonra saklanır
+        self._channel_id: Optional[str] = None
+        self._uploads_playlist_id: Optional[str] = None
+        
+        # Videoların yorumları en fazla YOUTUBE_FETCH_CONCURRENCY video için eşzamanlı çekilir
+        self.fetch_scheduler = FetchScheduler(int(os.getenv("YOUTUBE_FETCH_CONCURRENCY", "8")))
+        
+        # Çekilen yorumlar saklanır; sonraki isteklerde yalnızca yeni/düzenlenmiş yorumlar çekilir
+        self.comment_store = comment_store or default_comment_store
+        
         # SentimentService global instance'ını kullan
         try:
             from services.sentiment_service import sentiment_service
@@ -28,16 +48,18 @@ class YouTubeService:
         """Kullanıcının YouTube kanal bilgilerini getirir."""
         try:
             print("Kanal bilgileri alınıyor...")
-            response = self.youtube.channels().list(
-                part='snippet,statistics',
+            response = await self.api.get(
+                'channels',
+                part='snippet,statistics,contentDetails',
                 mine=True
-            ).execute()
+            )
 
             if not response['items']:
                 print("Kanal bulunamadı")
                 raise Exception("Kanal bulunamadı")
 
             channel = response['items'][0]
+            self._remember_channel(channel)
             snippet = channel['snippet']
             statistics = channel['statistics']
             
@@ -63,9 +85,9 @@ class YouTubeService:
                 'video_count': statistics['videoCount'],
                 'view_count': statistics['viewCount']
             }
-        except HttpError as e:
+        except YouTubeApiError as e:
             print(f'YouTube API hatası: {e}')
-            if e.resp.status == 401:
+            if e.status == 401:
                 print("Token süresi dolmuş veya geçersiz")
                 raise Exception("Token süresi dolmuş veya geçersiz")
             raise Exception(f"YouTube API hatası: {str(e)}")
@@ -129,29 +151,43 @@ class YouTubeService:
             raise Exception(f"Kanal istatistikleri getirilemedi: {str(e)}")
 
     async def get_video_comments(self, video_id: str, max_results: int = 100) -> List[Dict[str, Any]]:
-        """Belirli bir videonun yorumlarını getirir."""
+        """
+        Belirli bir videonun yorumlarını getirir.
+
+        Video daha önce senkronize edildiyse yalnızca yeni veya düzenlenmiş
+        yorumlar çekilir (sayfalama değişmemiş ilk yorumda durur); kalanlar
+        yorum deposundan (comment_store) döndürülür. Saklanan yorumların analizi
+        modeli yeniden çalıştırmadan kalıcı çıkarım önbelleğinden gelir (depo
+        yalnızca INFERENCE_CACHE_DB ile etkinleşir).
+        """
         try:
+            incremental = await self._run_store(self.comment_store.can_sync_incrementally, video_id, max_results)
             comments = []
             next_page_token = None
+            # Artımlı senkronizasyonda depodaki değişmemiş bir yoruma ulaşıldı mı
+            reached_stored = False
+            failed = False
 
             while len(comments) < max_results:
                 try:
-                    response = self.youtube.commentThreads().list(
+                    response = await self.api.get(
+                        'commentThreads',
                         part='snippet',
                         videoId=video_id,
                         maxResults=min(100, max_results - len(comments)),
                         pageToken=next_page_token,
                         textFormat='plainText',
                         moderationStatus='published'  # Sadece onaylanmış yorumları al
-                    ).execute()
+                    )
 
                     if 'items' not in response:
                         print(f"Video için yorum bulunamadı: {video_id}")
                         break
 
+                    page = []
                     for item in response['items']:
                         comment = item['snippet']['topLevelComment']['snippet']
-                        comments.append({
+                        page.append({
                             'id': item['id'],
                             'author': comment['authorDisplayName'],
                             'text': comment['textDisplay'],
@@ -160,62 +196,125 @@ class YouTubeService:
                             'updated_at': comment['updatedAt']
                         })
 
+                    if incremental:
+                        # Yorumlar zaman sırasıyla (en yeni önce) gelir; değişmemiş ilk yorumdan sonrası depoda var
+                        unchanged = await self._run_store(self.comment_store.unchanged_ids, page)
+                        for comment in page:
+                            if comment['id'] in unchanged:
+                                reached_stored = True
+                                break
+                            comments.append(comment)
+                        if reached_stored:
+                            break
+                    else:
+                        comments.extend(page)
+
                     next_page_token = response.get('nextPageToken')
                     if not next_page_token:
                         break
-                except HttpError as e:
-                    if e.resp.status == 403:
+                except YouTubeApiError as e:
+                    failed = True
+                    if e.status == 403:
                         print(f"Yorumlara erişim engellendi: {video_id}")
                         break
-                    elif e.resp.status == 404:
+                    elif e.status == 404:
                         print(f"Video bulunamadı: {video_id}")
                         break
                     else:
                         print(f'YouTube API hatası: {e}')
                         break
 
-            return comments
+            # Hatalı senkronizasyon depoya yazılmaz; artımlı senkronizasyonda çekilen yorumlar
+            # saklananlarla birlikte döndürülür (geçici bir hata videoyu boş göstermesin)
+            if failed:
+                if not incremental:
+                    return comments
+                fetched_ids = {comment['id'] for comment in comments}
+                stored = await self._run_store(self.comment_store.comments, video_id, max_results)
+                return (comments + [comment for comment in stored if comment['id'] not in fetched_ids])[:max_results]
+
+            if not reached_stored:
+                # Tam senkronizasyon (ya da depodaki yorumlara ulaşılamadı): videonun yorumları yenilenir
+                await self._run_store(self.comment_store.replace, video_id, comments, next_page_token is None)
+                return comments
+
+            await self._run_store(self.comment_store.merge, video_id, comments)
+            stored = await self._run_store(self.comment_store.comments, video_id, max_results)
+            self.comment_store.record_reused(max(0, len(stored) - len(comments)))
+            return stored
         except Exception as e:
             print(f'Beklenmeyen hata: {e}')
             import traceback
             print(f"Stack trace: {traceback.format_exc()}")
             return []
 
+    async def _run_store(self, fn, *args):
+        """Yorum deposu (SQLite) çağrısını olay döngüsünü bloklamadan iş parçacığında çalıştırır"""
+        if not self.comment_store.enabled:
+            return fn(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, fn, *args)
+
+    def _remember_channel(self, channel: Dict[str, Any]):
+        """channels.list kaynağından kanal ve uploads oynatma listesi ID'lerini saklar"""
+        self._channel_id = channel['id']
+        uploads = channel.get('contentDetails', {}).get('relatedPlaylists', {}).get('uploads')
+        # Yüklemeler listesi ID'si kanal ID'sinin "UC" öneki "UU" yapılarak da elde edilir
+        if not uploads and self._channel_id.startswith('UC'):
+            uploads = 'UU' + self._channel_id[2:]
+        self._uploads_playlist_id = uploads
+
+    async def _get_uploads_playlist_id(self) -> Optional[str]:
+        """Kanalın yüklemeler (uploads) oynatma listesi ID'si (ilk çağrıdan sonra önbellekten)"""
+        if self._uploads_playlist_id is None:
+            response = await self.api.get('channels', part='contentDetails', mine=True)
+            if not response.get('items'):
+                raise Exception("Kanal bulunamadı")
+            self._remember_channel(response['items'][0])
+        return self._uploads_playlist_id
+
     async def get_channel_videos(self, max_results: int = 50) -> List[Dict[str, Any]]:
-        """Kanalın son videolarını getirir."""
+        """
+        Kanalın son videolarını getirir
+        
+        Videolar search.list (sayfa başına 100 kota birimi) yerine kanalın
+        uploads oynatma listesinden (playlistItems.list, 1 birim) en yeniden
+        eskiye listelenir; herkese açık olmayan videolar atlanır.
+        """
         try:
             videos = []
             next_page_token = None
 
-            # Önce kanal ID'sini al
-            channel_info = await self.get_channel_info()
-            if not channel_info:
+            playlist_id = await self._get_uploads_playlist_id()
+            if not playlist_id:
                 return []
 
             while len(videos) < max_results:
-                response = self.youtube.search().list(
-                    part='snippet',
-                    channelId=channel_info['id'],
+                response = await self.api.get(
+                    'playlistItems',
+                    part='snippet,contentDetails,status',
+                    playlistId=playlist_id,
                     maxResults=min(50, max_results - len(videos)),
-                    order='date',
-                    type='video',
                     pageToken=next_page_token
-                ).execute()
+                )
 
-                for item in response['items']:
-                    video_id = item['id']['videoId']
-                    video_details = self.youtube.videos().list(
-                        part='statistics',
-                        id=video_id
-                    ).execute()
+                items = [
+                    item for item in response.get('items', [])
+                    if item.get('status', {}).get('privacyStatus', 'public') == 'public'
+                ]
 
-                    statistics = video_details['items'][0]['statistics']
+                # Sayfadaki tüm videoların istatistikleri tek videos.list isteğiyle alınır
+                details = await self._list_videos([item['contentDetails']['videoId'] for item in items], 'statistics')
+                for item in items:
+                    video_id = item['contentDetails']['videoId']
+                    snippet = item['snippet']
+                    statistics = details.get(video_id, {}).get('statistics', {})
                     videos.append({
                         'id': video_id,
-                        'title': item['snippet']['title'],
-                        'description': item['snippet']['description'],
-                        'thumbnail': item['snippet']['thumbnails']['default']['url'],
-                        'published_at': item['snippet']['publishedAt'],
+                        'title': snippet['title'],
+                        'description': snippet['description'],
+                        'thumbnail': snippet.get('thumbnails', {}).get('default', {}).get('url', ''),
+                        'published_at': item['contentDetails'].get('videoPublishedAt', snippet['publishedAt']),
                         'view_count': statistics.get('viewCount', 0),
                         'like_count': statistics.get('likeCount', 0),
                         'comment_count': statistics.get('commentCount', 0)
@@ -226,7 +325,7 @@ class YouTubeService:
                     break
 
             return videos
-        except HttpError as e:
+        except YouTubeApiError as e:
             print(f'YouTube API hatası: {e}')
             return []
 
@@ -242,15 +341,21 @@ class YouTubeService:
             print(f"Toplam {len(videos)} video bulundu")
             all_comments = []
             
+            # Video yorumları devre dışı bırakılmış mı kontrol et
+            commented_videos = []
             for video in videos:
+                if int(video.get('comment_count', 0)) == 0:
+                    print(f"Video için yorumlar devre dışı bırakılmış: {video['title']}")
+                else:
+                    commented_videos.append(video)
+            
+            # Yorumlar videolar için eşzamanlı çekilir; sonuçlar video sırasıyla birleştirilir
+            results = await self.fetch_scheduler.map(lambda video: self.get_video_comments(video['id']), commented_videos)
+            for video, comments in zip(commented_videos, results):
                 print(f"Video yorumları alınıyor: {video['title']}")
                 try:
-                    # Video yorumları devre dışı bırakılmış mı kontrol et
-                    if int(video.get('comment_count', 0)) == 0:
-                        print(f"Video için yorumlar devre dışı bırakılmış: {video['title']}")
-                        continue
-
-                    comments = await self.get_video_comments(video['id'])
+                    if isinstance(comments, Exception):
+                        raise comments
                     for comment in comments:
                         comment['video_title'] = video['title']
                         comment['video_id'] = video['id']
@@ -267,7 +372,8 @@ class YouTubeService:
             print(f"Stack trace: {traceback.format_exc()}")
             raise
 
-    async def analyze_video_comments(self, video_id: str, user_id: str, max_comments: int = 100) -> Dict[str, Any]:
+    async def analyze_video_comments(self, video_id: str, user_id: str, max_comments: int = 100,
+                                     word_cloud_mode: Optional[WordCloudMode] = None) -> Dict[str, Any]:
         """
         Belirli bir videonun yorumlarını analiz eder ve Firestore'a kaydeder
         
@@ -275,6 +381,7 @@ class YouTubeService:
             video_id: YouTube video ID'si
             user_id: Kullanıcı ID'si
             max_comments: Maksimum yorum sayısı
+            word_cloud_mode: Kelime bulutu modu (exact | approximate, opsiyonel)
             
         Returns:
             Dict: Analiz sonuçları
@@ -307,7 +414,8 @@ class YouTubeService:
                 comments,
                 user_id,
                 video_id=video_id,
-                video_title=video_info.get('title', 'Bilinmeyen Video')
+                video_title=video_info.get('title', 'Bilinmeyen Video'),
+                word_cloud_mode=word_cloud_mode
             )
             
             print(f"Video analizi tamamlandı: {video_id} - {result['total_analyzed']} yorum analiz edildi")
@@ -329,11 +437,14 @@ class YouTubeService:
                 }
             }
             
+        except InferenceQueueFullError:
+            raise
         except Exception as e:
             self.logger.error(f"Video analizi hatası: {str(e)}")
             raise Exception(f"Video analizi başarısız: {str(e)}")
 
-    async def analyze_channel_comments(self, user_id: str, max_videos: int = 10, max_comments_per_video: int = 50) -> Dict[str, Any]:
+    async def analyze_channel_comments(self, user_id: str, max_videos: int = 10, max_comments_per_video: int = 50,
+                                       word_cloud_mode: Optional[WordCloudMode] = None) -> Dict[str, Any]:
         """
         Kanalın son videolarının yorumlarını analiz eder
         
@@ -341,6 +452,7 @@ class YouTubeService:
             user_id: Kullanıcı ID'si
             max_videos: Maksimum video sayısı
             max_comments_per_video: Video başına maksimum yorum sayısı
+            word_cloud_mode: Video kelime bulutlarının modu (exact | approximate, opsiyonel)
             
         Returns:
             Dict: Kanal analiz sonuçları
@@ -367,42 +479,55 @@ class YouTubeService:
             
             analyses = []
             total_comments = 0
-            
-            for video in videos:
-                try:
-                    print(f"Video analiz ediliyor: {video['title']}")
-                    
-                    # Video yorumlarını al
-                    comments = await self.get_video_comments(video['id'], max_comments_per_video)
-                    if not comments:
-                        print(f"Video için yorum bulunamadı: {video['title']}")
+            # Videoların istatistik birikimleri kanal özeti için birleştirilir (yorumlar yeniden taranmaz)
+            channel_stats = self.sentiment_service.create_accumulator()
+            
+            # Yorumlar videolar için eşzamanlı çekilir; her video yorumları geldiği anda analiz edilir
+            # (diğer videoların çekimi analiz sırasında sürer)
+            fetch = lambda video: self.get_video_comments(video['id'], max_comments_per_video)
+            async with self.fetch_scheduler.stream(fetch, videos) as fetched:
+                async for index, video, comments in fetched:
+                    try:
+                        print(f"Video analiz ediliyor: {video['title']}")
+                        
+                        if isinstance(comments, Exception):
+                            raise comments
+                        if not comments:
+                            print(f"Video için yorum bulunamadı: {video['title']}")
+                            continue
+                        
+                        # Yorumları analiz et ve kaydet
+                        result = await self.sentiment_service.analyze_and_save_comments(
+                            comments,
+                            user_id,
+                            video_id=video['id'],
+                            video_title=video['title'],
+                            rollup=channel_stats,
+                            word_cloud_mode=word_cloud_mode
+                        )
+                        
+                        analyses.append((index, {
+                            'video_id': video['id'],
+                            'video_title': video['title'],
+                            'analysis_id': result.get('analysis_id'),
+                            'total_comments': result['total_analyzed'],
+                            'sentiment_summary': {
+                                'dominant_sentiment': self._get_dominant_sentiment(result['sentiment_stats']['categories']),
+                                'average_polarity': result['sentiment_stats']['average_polarity']
+                            }
+                        }))
+                        
+                        total_comments += result['total_analyzed']
+                        print(f"Video analizi tamamlandı: {video['title']} - {result['total_analyzed']} yorum")
+                        
+                    except InferenceQueueFullError:
+                        raise
+                    except Exception as e:
+                        self.logger.error(f"Video analizi hatası ({video['title']}): {str(e)}")
                         continue
-                    
-                    # Yorumları analiz et ve kaydet
-                    result = await self.sentiment_service.analyze_and_save_comments(
-                        comments,
-                        user_id,
-                        video_id=video['id'],
-                        video_title=video['title']
-                    )
-                    
-                    analyses.append({
-                        'video_id': video['id'],
-                        'video_title': video['title'],
-                        'analysis_id': result.get('analysis_id'),
-                        'total_comments': result['total_analyzed'],
-                        'sentiment_summary': {
-                            'dominant_sentiment': self._get_dominant_sentiment(result['sentiment_stats']['categories']),
-                            'average_polarity': result['sentiment_stats']['average_polarity']
-                        }
-                    })
-                    
-                    total_comments += result['total_analyzed']
-                    print(f"Video analizi tamamlandı: {video['title']} - {result['total_analyzed']} yorum")
-                    
-                except Exception as e:
-                    self.logger.error(f"Video analizi hatası ({video['title']}): {str(e)}")
-                    continue
+            
+            # Analizler tamamlanma sırasıyla değil video sırasıyla döndürülür
+            analyses = [analysis for _, analysis in sorted(analyses, key=lambda pair: pair[0])]
             
             return {
                 'channel_info': channel_info,
@@ -410,13 +535,41 @@ class YouTubeService:
                 'total_analyzed_videos': len(analyses),
                 'total_comments': total_comments,
                 'analyses': analyses,
-                'channel_summary': self._create_channel_summary(analyses)
+                'channel_summary': self._create_channel_summary(analyses),
+                'channel_stats': channel_stats.sentiment_stats(),
+                'channel_theme_analysis': channel_stats.theme_analysis(),
+                'channel_word_cloud': channel_stats.word_cloud(20)
             }
             
+        except InferenceQueueFullError:
+            raise
         except Exception as e:
             self.logger.error(f"Kanal analizi hatası: {str(e)}")
             raise Exception(f"Kanal analizi başarısız: {str(e)}")
 
+    async def _list_videos(self, video_ids: List[str], part: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Video kaynaklarını en fazla VIDEOS_LIST_MAX_IDS ID'lik videos.list istekleriyle getirir
+        
+        Args:
+            video_ids: YouTube video ID'leri
+            part: İstenecek kaynak bölümleri (ör. 'statistics')
+            
+        Returns:
+            Dict: Video ID -> video kaynağı (bulunamayan videolar dahil edilmez)
+        """
+        unique_ids = list(dict.fromkeys(video_ids))
+        videos = {}
+        for start in range(0, len(unique_ids), VIDEOS_LIST_MAX_IDS):
+            response = await self.api.get(
+                'videos',
+                part=part,
+                id=','.join(unique_ids[start:start + VIDEOS_LIST_MAX_IDS])
+            )
+            for item in response.get('items', []):
+                videos[item['id']] = item
+        return videos
+
     async def get_video_info(self, video_id: str) -> Optional[Dict[str, Any]]:
         """
         Belirli bir videonun detaylı bilgilerini getirir
@@ -427,38 +580,46 @@ class YouTubeService:
         Returns:
             Dict: Video bilgileri veya None
         """
-        try:
-            response = self.youtube.videos().list(
-                part='snippet,statistics',
-                id=video_id
-            ).execute()
-            
-            if not response['items']:
-                return None
-            
-            video = response['items'][0]
-            snippet = video['snippet']
-            statistics = video['statistics']
+        return (await self.get_videos_info([video_id]))[0]
+
+    async def get_videos_info(self, video_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Birden fazla videonun detaylı bilgilerini toplu (50'lik videos.list istekleriyle) getirir
+        
+        Args:
+            video_ids: YouTube video ID'leri
             
-            return {
-                'id': video_id,
-                'title': snippet['title'],
-                'description': snippet['description'],
-                'channel_title': snippet['channelTitle'],
-                'published_at': snippet['publishedAt'],
-                'thumbnail': snippet['thumbnails']['default']['url'],
-                'view_count': int(statistics.get('viewCount', 0)),
-                'like_count': int(statistics.get('likeCount', 0)),
-                'comment_count': int(statistics.get('commentCount', 0)),
-                'duration': video.get('contentDetails', {}).get('duration', 'PT0S')
-            }
+        Returns:
+            List: Girdi sırasıyla video bilgileri (bulunamayan videolar için None)
+        """
+        try:
+            videos = await self._list_videos(video_ids, 'snippet,statistics')
+            return [self._video_info(videos[video_id]) if video_id in videos else None for video_id in video_ids]
             
-        except HttpError as e:
+        except YouTubeApiError as e:
             self.logger.error(f"Video bilgisi alma hatası: {str(e)}")
-            return None
+            return [None] * len(video_ids)
         except Exception as e:
             self.logger.error(f"Beklenmeyen hata: {str(e)}")
-            return None
+            return [None] * len(video_ids)
+
+    def _video_info(self, video: Dict[str, Any]) -> Dict[str, Any]:
+        """videos.list kaynağını video bilgisi sözlüğüne çevirir"""
+        snippet = video['snippet']
+        statistics = video['statistics']
+        
+        return {
+            'id': video['id'],
+            'title': snippet['title'],
+            'description': snippet['description'],
+            'channel_title': snippet['channelTitle'],
+            'published_at': snippet['publishedAt'],
+            'thumbnail': snippet['thumbnails']['default']['url'],
+            'view_count': int(statistics.get('viewCount', 0)),
+            'like_count': int(statistics.get('likeCount', 0)),
+            'comment_count': int(statistics.get('commentCount', 0)),
+            'duration': video.get('contentDetails', {}).get('duration', 'PT0S')
+        }
 
     async def get_user_analysis_history(self, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
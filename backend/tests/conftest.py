@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Testler backend dizininden bağımsız çalıştırıldığında servis modülleri içe aktarılabilsin
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
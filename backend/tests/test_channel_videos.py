@@ -0,0 +1,59 @@
+"""Kanal video listesinin sayfa başına tek toplu videos.list isteği yaptığını stub API'ye karşı doğrular"""
+import asyncio
+
+import pytest
+
+from benchmarks.bench_channel_videos import PerVideoYouTubeService
+from benchmarks.youtube_stub import StubYouTubeServer, synthetic_recordings
+from services.comment_store import CommentStore
+from services.youtube_client import YouTubeApiClient
+from services.youtube_service import VIDEOS_LIST_MAX_IDS, YouTubeService
+
+VIDEOS = 120
+
+
+@pytest.fixture(scope="module")
+def recordings():
+    return synthetic_recordings(VIDEOS, comments_per_video=0)
+
+
+@pytest.fixture(scope="module")
+def server(recordings):
+    with StubYouTubeServer(recordings) as server:
+        yield server
+
+
+def _service(server, service_class=YouTubeService):
+    return service_class(None, api=YouTubeApiClient(base_url=server.base_url, rate_limit=0),
+                         comment_store=CommentStore())
+
+
+def test_channel_videos_one_videos_request_per_page(server, recordings):
+    pages = len(recordings["playlistItems"])
+    server.reset_requests()
+    videos = asyncio.run(_service(server).get_channel_videos(VIDEOS))
+
+    assert len(videos) == VIDEOS
+    assert server.request_count("playlistItems") == pages
+    assert server.request_count("videos") == pages
+
+    server.reset_requests()
+    expected = asyncio.run(_service(server, PerVideoYouTubeService).get_channel_videos(VIDEOS))
+    assert server.request_count("videos") == VIDEOS
+    assert videos == expected
+
+
+def test_videos_info_batches_ids(server, recordings):
+    video_ids = [item["params"]["id"] for item in recordings["videos"]]
+    video_ids.insert(7, "missing-video")
+
+    server.reset_requests()
+    infos = asyncio.run(_service(server).get_videos_info(video_ids))
+
+    assert server.request_count("videos") == -(-len(video_ids) // VIDEOS_LIST_MAX_IDS)
+    assert infos[7] is None
+
+    # Stub tek ID'li isteklerde bilinmeyen video için 404 döndürdüğünden karşılaştırma mevcut videolarla yapılır
+    del video_ids[7], infos[7]
+    expected = asyncio.run(_service(server, PerVideoYouTubeService).get_videos_info(video_ids))
+    assert infos == expected
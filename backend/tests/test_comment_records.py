@@ -0,0 +1,69 @@
+"""Kompakt yorum kayıtlarının (CommentRecords) önceki sözlük biçimini aynen ürettiğini doğrulayan testler"""
+from benchmarks.bench_comment_memory import _dict_form, _record_form
+from benchmarks.synthetic_comments import generate_comments
+from services.analysis_frame import AnalysisFrame
+from services.comment_records import CommentRecords
+from services.sentiment_service import sentiment_service
+
+SEED = 16
+
+
+def key_paths(value, prefix=()):
+    """İç içe sözlük ve listelerdeki anahtarların sıralı yolları (anahtar sırası karşılaştırması için)"""
+    if isinstance(value, dict):
+        return [path for key, item in value.items() for path in [prefix + (key,)] + key_paths(item, prefix + (key,))]
+    if isinstance(value, list):
+        return [path for index, item in enumerate(value) for path in key_paths(item, prefix + (index,))]
+    return []
+
+
+def with_errors(comments, every=7):
+    """Önceki biçim ve kayıtlar; her `every` yorumdan biri hatalı analiz sonucu"""
+    expected = _dict_form(comments, SEED)
+    records = CommentRecords()
+    for index, (comment, analyzed) in enumerate(zip(comments, expected)):
+        if index % every == 0:
+            analyzed['sentiment'] = sentiment_service._error_sentiment_result(ValueError("model hatası"))
+        records.append(comment, analyzed['sentiment'], analyzed['theme'])
+    return expected, records
+
+
+def test_to_dicts_rebuilds_previous_comment_dicts():
+    comments = generate_comments(500, seed=SEED)
+    expected = _dict_form(comments, SEED)
+
+    rebuilt = _record_form(comments, SEED).to_dicts()
+
+    assert rebuilt == expected
+    assert [key_paths(comment) for comment in rebuilt] == [key_paths(comment) for comment in expected]
+
+
+def test_error_results_keep_their_shape():
+    expected, records = with_errors(generate_comments(100, seed=SEED))
+
+    rebuilt = records.to_dicts()
+
+    assert rebuilt == expected
+    assert [key_paths(comment) for comment in rebuilt] == [key_paths(comment) for comment in expected]
+    assert 'theme' not in rebuilt[0]['sentiment'] and rebuilt[0]['theme']
+
+
+def test_stats_from_records_match_stats_from_dicts():
+    expected, records = with_errors(generate_comments(400, seed=SEED))
+
+    assert sentiment_service.get_sentiment_stats(records) == sentiment_service.get_sentiment_stats(expected)
+    assert sentiment_service.get_theme_analysis(records) == sentiment_service.get_theme_analysis(expected)
+    assert (sentiment_service.get_word_cloud(records, mode="exact")
+            == sentiment_service.get_word_cloud(expected, mode="exact"))
+
+
+def test_frame_range_matches_sliced_dicts():
+    expected, records = with_errors(generate_comments(120, seed=SEED))
+
+    frame = AnalysisFrame.from_records(records, 40, 95)
+
+    assert records.to_dicts(40, 95) == expected[40:95]
+    assert (sentiment_service.get_sentiment_stats(expected[40:95], frame=frame)
+            == sentiment_service.get_sentiment_stats(expected[40:95]))
+    assert (sentiment_service.get_theme_analysis(expected[40:95], frame=frame)
+            == sentiment_service.get_theme_analysis(expected[40:95]))
@@ -0,0 +1,113 @@
+"""Yorum deposu ve artımlı yorum senkronizasyonu için stub API'ye karşı testler"""
+import asyncio
+
+import pytest
+
+from benchmarks.bench_comment_sync import _add_comments
+from benchmarks.youtube_stub import StubYouTubeServer, synthetic_recordings
+from services.comment_store import CommentStore, comment_store_from_env
+from services.youtube_client import YouTubeApiClient
+from services.youtube_service import YouTubeService
+
+COMMENTS = 250
+VIDEO_ID = "video00000"
+ERROR_503 = {"error": {"code": 503, "message": "Backend Error", "errors": [{"reason": "backendError"}]}}
+
+
+@pytest.fixture
+def recordings():
+    return synthetic_recordings(1, COMMENTS)
+
+
+@pytest.fixture
+def server(recordings):
+    with StubYouTubeServer(recordings) as server:
+        yield server
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CommentStore(str(tmp_path / "comments.db"))
+
+
+def _fetch(server, store, max_results=COMMENTS + 200):
+    """Videonun yorumlarını çeker; yorumları ve commentThreads istek sayısını döndürür"""
+    api = YouTubeApiClient(base_url=server.base_url, rate_limit=0)
+    comments = asyncio.run(YouTubeService(None, api=api, comment_store=store).get_video_comments(VIDEO_ID, max_results))
+    return comments, api.request_counts.get("commentThreads", 0)
+
+
+def test_first_sync_is_full_fetch(server, store):
+    comments, requests = _fetch(server, store)
+
+    assert len(comments) == COMMENTS
+    assert requests == -(-COMMENTS // 100)
+    stats = store.stats()
+    assert (stats["full_syncs"], stats["incremental_syncs"], stats["comments"]) == (1, 0, COMMENTS)
+    assert store.comments(VIDEO_ID, COMMENTS + 200) == comments
+
+
+def test_second_sync_stops_at_first_unchanged_comment(server, recordings, store):
+    _fetch(server, store)
+    server.recordings = _add_comments(recordings, new_comments=10, edited_comments=0)
+
+    comments, requests = _fetch(server, store)
+    expected, _ = _fetch(server, CommentStore())
+
+    assert requests == 1
+    assert comments == expected
+    assert len(comments) == COMMENTS + 10
+    stats = store.stats()
+    assert (stats["full_syncs"], stats["incremental_syncs"]) == (1, 1)
+    assert stats["comments_reused"] == COMMENTS
+
+
+def test_edited_threads_are_merged(server, recordings, store):
+    _fetch(server, store)
+    server.recordings = _add_comments(recordings, new_comments=5, edited_comments=3)
+
+    comments, requests = _fetch(server, store)
+    expected, _ = _fetch(server, CommentStore())
+
+    assert requests == 1
+    assert comments == expected
+    # Düzenlenen yorumlar yerlerini korur ve yeni metinleriyle saklanır
+    assert [comment["text"].endswith("(düzenlendi)") for comment in comments[:10]] == [False] * 5 + [True] * 3 + [False] * 2
+    assert store.comments(VIDEO_ID, COMMENTS + 200) == comments
+
+
+def test_api_error_returns_delta_and_stored_comments_without_writing(server, recordings, store):
+    stored, _ = _fetch(server, store)
+    stats = store.stats()
+
+    updated = _add_comments(recordings, new_comments=150, edited_comments=0)
+    # İkinci sayfa (yeni yorumların kalanı) geçici hata döndürür
+    updated["commentThreads"].insert(0, {"params": {"videoId": VIDEO_ID, "pageToken": f"{VIDEO_ID}-q100"},
+                                         "status": 503, "response": ERROR_503})
+    server.recordings = updated
+
+    comments, requests = _fetch(server, store)
+
+    assert requests == 2
+    assert [comment["id"] for comment in comments[:100]] == [f"{VIDEO_ID}-n{index}" for index in range(100)]
+    assert comments[100:] == stored
+    assert store.stats() == stats
+    assert store.comments(VIDEO_ID, COMMENTS + 200) == stored
+
+
+def test_store_is_off_without_comment_store_db(server, monkeypatch):
+    monkeypatch.delenv("COMMENT_STORE_DB", raising=False)
+    store = comment_store_from_env(results_persisted=True)
+
+    assert not store.enabled
+    _, first = _fetch(server, store)
+    _, second = _fetch(server, store)
+    assert first == second == -(-COMMENTS // 100)
+    assert store.stats()["enabled"] is False
+
+
+def test_store_requires_persistent_inference_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("COMMENT_STORE_DB", str(tmp_path / "comments.db"))
+
+    assert not comment_store_from_env(results_persisted=False).enabled
+    assert comment_store_from_env(results_persisted=True).enabled
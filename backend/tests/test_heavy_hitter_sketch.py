@@ -0,0 +1,96 @@
+"""Sınırlı bellekli kelime özetinin (HeavyHitterSketch) hata sınırları içinde kaldığını doğrulayan testler"""
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from services.word_cloud import HeavyHitterSketch
+
+CATEGORIES = ('positive', 'negative', 'neutral')
+CAPACITY = 200
+EPSILON = 0.001
+DELTA = 0.01
+TOP_K = 20
+
+
+def zipf_documents(count: int, seed: int, vocabulary: int = 5000):
+    """Zipf dağılımlı, uzun kuyruklu sözlükten (kapasitenin 25 katı) tekrarlanabilir belgeler"""
+    rng = random.Random(seed)
+    words = [f"kelime{index}" for index in range(vocabulary)]
+    weights = [1 / (rank + 1) for rank in range(vocabulary)]
+    return [(rng.choices(words, weights, k=rng.randint(3, 30)), rng.choice(CATEGORIES)) for _ in range(count)]
+
+
+def build(documents):
+    sketch = HeavyHitterSketch(CAPACITY, EPSILON, DELTA, CATEGORIES, buffer_size=1000)
+    for terms, category in documents:
+        sketch.add_document(terms, category)
+    return sketch
+
+
+def exact_counts(documents):
+    occurrences = Counter()
+    document_counts = {category: Counter() for category in CATEGORIES}
+    for terms, category in documents:
+        occurrences.update(terms)
+        document_counts[category].update(set(terms))
+    return occurrences, document_counts
+
+
+def assert_within_bounds(sketch, documents):
+    occurrences, document_counts = exact_counts(documents)
+    total = sum(occurrences.values())
+    tracked = set(sketch.heavy_hitters())
+
+    # Gerçek sayısı total / capacity'yi aşan her terim izlenir (top-k recall garantisi)
+    frequent = [term for term, count in occurrences.most_common() if count > total / CAPACITY]
+    assert len(frequent) >= TOP_K
+    assert set(frequent) <= tracked
+
+    occurrence_bound = min(total / CAPACITY, math.ceil(EPSILON * total))
+    for term in frequent:
+        assert occurrences[term] <= sketch.count(term) <= occurrences[term] + occurrence_bound
+        estimates = sketch.document_counts(term)
+        for category in CATEGORIES:
+            pairs = sum(document_counts[category].values())
+            actual = document_counts[category][term]
+            assert actual <= estimates[category] <= actual + math.ceil(EPSILON * pairs)
+
+    # Tahmini en sık k terimin her biri gerçek k. terimden en fazla sınır kadar seyrek olabilir
+    estimated_top = sorted(tracked, key=sketch.count, reverse=True)[:TOP_K]
+    kth = occurrences.most_common(TOP_K)[-1][1]
+    assert all(occurrences[term] + occurrence_bound >= kth for term in estimated_top)
+
+
+def test_single_sketch_stays_within_error_bounds():
+    documents = zipf_documents(4000, seed=18)
+
+    assert_within_bounds(build(documents), documents)
+
+
+@pytest.mark.parametrize("parts", [2, 5])
+def test_merged_sketches_stay_within_error_bounds(parts):
+    documents = zipf_documents(4000, seed=19)
+    size = math.ceil(len(documents) / parts)
+    chunks = [documents[start:start + size] for start in range(0, len(documents), size)]
+
+    merged = build(chunks[0])
+    for chunk in chunks[1:]:
+        merged.merge(build(chunk))
+
+    assert_within_bounds(merged, documents)
+
+
+def test_small_vocabulary_is_counted_exactly():
+    documents = zipf_documents(500, seed=20, vocabulary=CAPACITY // 2)
+    occurrences, document_counts = exact_counts(documents)
+
+    first, second = build(documents[:200]), build(documents[200:])
+    first.merge(second)
+
+    for sketch in (build(documents), first):
+        assert set(sketch.heavy_hitters()) == set(occurrences)
+        for term, count in occurrences.items():
+            assert sketch.top.counts[term] == count
+            assert sketch.count(term) == count
@@ -0,0 +1,113 @@
+"""Çıkarım arka ucu seçimi, ONNX yükleme hatası ve önbellek anahtarları için testler"""
+import importlib
+import os
+
+import pytest
+
+from benchmarks.synthetic_comments import ENGLISH_SENTENCES
+from services import inference_backend
+from services.sentiment_service import EN_SENTIMENT_MODEL, sentiment_service
+
+MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models")
+
+
+@pytest.fixture
+def configure_backend(monkeypatch):
+    """INFERENCE_BACKEND/ONNX_QUANTIZE ile modülü yeniden yükler; optimum kurulu sayılır"""
+    def configure(backend, quantize, onnx_available=True):
+        monkeypatch.setenv("INFERENCE_BACKEND", backend)
+        monkeypatch.setenv("ONNX_QUANTIZE", quantize)
+        module = importlib.reload(inference_backend)
+        monkeypatch.setattr(module, "_onnx_available", lambda: onnx_available)
+        return module
+
+    yield configure
+    monkeypatch.undo()
+    importlib.reload(inference_backend)
+
+
+def _stub_loaders(monkeypatch):
+    """Gerçek model yükleyicileri yerine çağrıları kaydeden yükleyiciler kurar"""
+    calls = []
+    monkeypatch.setattr(inference_backend, "_load_torch",
+                        lambda name, path, description: calls.append(("torch", False)) or ("tokenizer", "model"))
+    monkeypatch.setattr(inference_backend, "_load_onnx",
+                        lambda name, path, description, quantize: calls.append(("onnx", quantize)) or ("tokenizer", "model"))
+    return calls
+
+
+@pytest.mark.parametrize("backend, quantize, onnx_available, expected, expected_id", [
+    ("torch", "false", True, ("torch", False), "torch"),
+    ("torch", "true", True, ("torch", False), "torch"),
+    ("onnx", "false", True, ("onnx", False), "onnx"),
+    ("onnx", "true", True, ("onnx", True), "onnx-int8"),
+    ("ONNX", "yes", True, ("onnx", True), "onnx-int8"),
+    ("onnx", "true", False, ("torch", False), "torch"),
+])
+def test_backend_is_chosen_by_environment(configure_backend, monkeypatch, backend, quantize, onnx_available,
+                                          expected, expected_id):
+    module = configure_backend(backend, quantize, onnx_available)
+    stub_loaders = _stub_loaders(monkeypatch)
+
+    assert module.resolve_backend() == expected
+    assert module.backend_id(*expected) == expected_id
+    module.load_sequence_classifier("model", "models/model", "Model")
+    assert stub_loaders == [expected]
+
+
+def test_failed_onnx_load_raises_and_marks_model_errored(monkeypatch):
+    stub_loaders = _stub_loaders(monkeypatch)
+
+    def fail(name, path, description, quantize):
+        raise OSError("model.onnx bulunamadı")
+
+    monkeypatch.setattr(inference_backend, "_onnx_available", lambda: True)
+    monkeypatch.setattr(inference_backend, "_load_onnx", fail)
+    monkeypatch.setattr(sentiment_service, "backend", "onnx")
+    monkeypatch.setattr(sentiment_service, "quantize", False)
+    monkeypatch.setattr(sentiment_service, "_pipelines", {})
+    monkeypatch.setattr(sentiment_service, "_model_status", dict(sentiment_service._model_status))
+    monkeypatch.setattr(sentiment_service, "_model_errors", {})
+
+    with pytest.raises(RuntimeError, match="INFERENCE_BACKEND=torch"):
+        sentiment_service._load_pipeline("en_sentiment")
+
+    # PyTorch'a sessizce düşülmez; model hatalı olarak raporlanır
+    assert stub_loaders == []
+    status = sentiment_service.model_status()
+    assert status["models"]["en_sentiment"] == "error"
+    assert "model.onnx bulunamadı" in status["errors"]["en_sentiment"]
+    assert status["ready"] is False
+
+
+def test_backend_id_is_part_of_cache_keys(monkeypatch):
+    text = "Great video, the editing and the visual style are awesome"
+    keys = {}
+    for backend in ("torch", "onnx", "onnx-int8"):
+        monkeypatch.setattr(sentiment_service, "backend_id", backend)
+        keys[backend] = (sentiment_service._sentiment_cache_key(text), sentiment_service._theme_cache_key(text))
+
+    assert len({sentiment for sentiment, _ in keys.values()}) == 3
+    assert len({theme for _, theme in keys.values()}) == 3
+
+
+@pytest.mark.parametrize("quantize", [False, True])
+def test_onnx_matches_torch_labels_and_scores(quantize):
+    pytest.importorskip("optimum.onnxruntime")
+    from transformers import pipeline
+
+    sentences = [f"{a} {b.lower()}" for a in ENGLISH_SENTENCES for b in ENGLISH_SENTENCES]
+    model_path = os.path.join(MODELS_DIR, "en-sentiment")
+    outputs = {}
+    for backend in ("torch", "onnx"):
+        tokenizer, model = inference_backend.load_sequence_classifier(
+            EN_SENTIMENT_MODEL, model_path, "en", backend, quantize
+        )
+        classifier = pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
+        outputs[backend] = classifier(sentences, batch_size=32, truncation=True)
+
+    pairs = list(zip(outputs["torch"], outputs["onnx"]))
+    agreement = sum(a["label"] == b["label"] for a, b in pairs) / len(pairs)
+    within_tolerance = sum(abs(a["score"] - b["score"]) <= 0.05 for a, b in pairs) / len(pairs)
+    assert agreement >= 0.95
+    assert within_tolerance >= 0.95
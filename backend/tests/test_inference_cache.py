@@ -0,0 +1,67 @@
+"""Çıkarım önbelleği anahtarlarının modele verilen metnin kendisine bağlı olduğunu doğrulayan testler"""
+import unicodedata
+
+import pytest
+
+from services.inference_cache import InferenceCache
+from services.sentiment_service import sentiment_service
+
+COMPOSED = unicodedata.normalize("NFC", "Müthiş bir video")
+DECOMPOSED = unicodedata.normalize("NFD", "Müthiş bir video")
+
+
+class RecordingSentimentPipeline:
+    """Duygu pipeline'ı yerine geçer; modele verilen her cümleyi kaydeder"""
+
+    tokenizer = None
+
+    def __init__(self):
+        self.inputs = []
+
+    def __call__(self, inputs, **kwargs):
+        inputs = [inputs] if isinstance(inputs, str) else list(inputs)
+        self.inputs.extend(inputs)
+        return [{"label": "POSITIVE", "score": 0.9} for _ in inputs]
+
+
+class FixedThemeClassifier:
+    def __call__(self, sequences, candidate_labels, **kwargs):
+        sequences = [sequences] if isinstance(sequences, str) else list(sequences)
+        results = [{"labels": list(candidate_labels), "scores": [0.5] * len(candidate_labels)} for _ in sequences]
+        return results[0] if len(results) == 1 else results
+
+
+@pytest.fixture
+def sentiment_pipeline(monkeypatch):
+    pipeline = RecordingSentimentPipeline()
+    monkeypatch.setitem(sentiment_service._pipelines, "tr_sentiment", pipeline)
+    monkeypatch.setitem(sentiment_service._pipelines, "en_sentiment", pipeline)
+    monkeypatch.setitem(sentiment_service._pipelines, "theme_classifier", FixedThemeClassifier())
+    monkeypatch.setattr(sentiment_service, "cache", InferenceCache())
+    return pipeline
+
+
+def test_keys_use_the_exact_text():
+    cache = InferenceCache()
+
+    assert cache.make_key("sentiment", COMPOSED, "m") == cache.make_key("sentiment", COMPOSED, "m")
+    keys = {cache.make_key("sentiment", text, "m") for text in [COMPOSED, DECOMPOSED, f" {COMPOSED}", f"{COMPOSED}\n"]}
+    assert len(keys) == 4
+    assert cache.make_key("sentiment", None, "m") is None
+
+
+def test_texts_differing_only_in_form_each_reach_the_model(sentiment_pipeline):
+    texts = [COMPOSED, DECOMPOSED, f"{COMPOSED}  ", COMPOSED]
+
+    results = sentiment_service.analyze_sentiment_batch(texts)
+
+    assert len(results) == len(texts)
+    # Biçimi farklı üç metin modele kendi halleriyle verilir; tekrar eden metin önbellekten döner
+    assert DECOMPOSED in sentiment_pipeline.inputs
+    assert sentiment_pipeline.inputs.count(COMPOSED) == 2
+    assert len(sentiment_pipeline.inputs) == 3
+
+    sentiment_pipeline.inputs.clear()
+    assert sentiment_service.analyze_sentiment(DECOMPOSED) == results[1]
+    assert sentiment_service.analyze_sentiment_batch(texts) == results
+    assert sentiment_pipeline.inputs == []
@@ -0,0 +1,43 @@
+"""KeywordMatcher sayımlarının str.count ile aynı olduğunu doğrulayan testler"""
+import random
+
+from benchmarks.synthetic_comments import generate_comments
+from services.keyword_matcher import KeywordMatcher
+from services.sentiment_service import sentiment_service
+
+# Birbirinin içinde ve üst üste geçen anahtar kelimeler; tekrarlı kayıtlar ve büyük harf dahil
+OVERLAPPING_KEYWORDS = {
+    "a": ["aa", "aaa", "a", "aa"],
+    "b": ["aba", "bab", "ab", "ba", "abab"],
+    "c": ["AB", "cab", "abc", "c", "aaa"],
+}
+
+
+def expected_hits(keywords_by_group, text):
+    """Önceki uygulama: her anahtar kelime için ayrı str.count"""
+    hits = {}
+    for group, keywords in keywords_by_group.items():
+        entries = [(keyword, text.count(keyword.lower())) for keyword in keywords]
+        entries = [(keyword, count) for keyword, count in entries if count > 0]
+        if entries:
+            hits[group] = entries
+    return hits
+
+
+def test_counts_match_str_count_with_overlapping_keywords():
+    matcher = KeywordMatcher(OVERLAPPING_KEYWORDS)
+    rng = random.Random(13)
+    texts = ["", "aaaa", "ababab", "abcabcab", "bababa aaa"]
+    texts += [''.join(rng.choice("abc ") for _ in range(rng.randint(0, 60))) for _ in range(5000)]
+
+    for text in texts:
+        assert matcher.group_hits(text) == expected_hits(OVERLAPPING_KEYWORDS, text), text
+
+
+def test_counts_match_str_count_on_theme_taxonomy():
+    keywords = sentiment_service.taxonomy.keywords
+    matcher = KeywordMatcher(keywords)
+
+    for comment in generate_comments(2000, seed=13):
+        text = comment['text'].lower()
+        assert matcher.group_hits(text) == expected_hits(keywords, text), text
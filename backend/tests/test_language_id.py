@@ -0,0 +1,63 @@
+"""Karakter n-gram dil tanıyıcının önceki karakter tabanlı tespitle tutarlılığını doğrulayan testler"""
+import pytest
+
+from benchmarks.bench_language_id import HELD_OUT_ENGLISH, HELD_OUT_TURKISH
+from benchmarks.synthetic_comments import ENGLISH_SENTENCES, TURKISH_SENTENCES, generate_comments
+from services.language_id import TURKISH_CHARS, char_ngrams, fold_text, load_language_identifier
+
+
+@pytest.fixture(scope="module")
+def identifier():
+    return load_language_identifier()
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    texts = [comment['text'] for comment in generate_comments(1000, seed=19)]
+    texts += TURKISH_SENTENCES + ENGLISH_SENTENCES + HELD_OUT_TURKISH + HELD_OUT_ENGLISH
+    texts += ["", "   ", "123 456", "!!! ???", "😀😀", "ok", "Çok", None, 42]
+    return texts
+
+
+def charset_language(text):
+    """Önceki tespit: Türkçeye özgü harf varsa 'tr', yoksa 'en'"""
+    return 'tr' if isinstance(text, str) and not TURKISH_CHARS.isdisjoint(text) else 'en'
+
+
+def test_turkish_letters_and_empty_texts_keep_previous_result(identifier, corpus):
+    languages = identifier.identify_batch(corpus)
+
+    for text, language in zip(corpus, languages):
+        if charset_language(text) == 'tr' or not isinstance(text, str) or not fold_text(text):
+            assert language == charset_language(text), repr(text)
+
+
+def test_batch_scores_match_per_text_sums(identifier, corpus):
+    texts = [text for text in corpus if isinstance(text, str)]
+
+    scores = identifier.scores(texts)
+
+    for text, row in zip(texts, scores):
+        expected = [0.0] * len(identifier.languages)
+        for gram in char_ngrams(text):
+            index = identifier.vocabulary.get(gram)
+            if index is not None:
+                expected = [total + value for total, value in zip(expected, identifier.log_probs[index])]
+        assert row.tolist() == pytest.approx(expected, rel=1e-9, abs=1e-6), text
+
+
+def test_batch_matches_single_text_identification(identifier, corpus):
+    assert identifier.identify_batch(corpus) == [identifier.identify(text) for text in corpus]
+
+
+def test_diacritic_free_turkish_is_routed_to_turkish(identifier):
+    folded = [fold_text(text) for text in TURKISH_SENTENCES] + HELD_OUT_TURKISH
+    english = [text.lower() for text in ENGLISH_SENTENCES] + HELD_OUT_ENGLISH
+
+    turkish_hits = sum(language == 'tr' for language in identifier.identify_batch(folded))
+    english_hits = sum(language == 'en' for language in identifier.identify_batch(english))
+
+    assert turkish_hits >= 0.9 * len(folded)
+    assert english_hits >= 0.9 * len(english)
+    # Önceki tespit bu metinlerin hiçbirini Türkçe saymıyordu
+    assert all(charset_language(text) == 'en' for text in folded)
@@ -0,0 +1,91 @@
+"""Hazırlık (readiness) durumunun MODEL_WARMUP ayarına göre ısındırılan modelleri beklediğini doğrulayan testler"""
+import pytest
+
+from services.sentiment_service import MODEL_SPECS, sentiment_service, warmup_models_from_env
+
+
+@pytest.fixture
+def model_state(monkeypatch):
+    """Model durumlarını testte değiştirilebilir kopyalarla değiştirir; model yüklemesini kaydeder"""
+    statuses = {name: "not_loaded" for name in MODEL_SPECS}
+    loaded = []
+
+    def load(name):
+        loaded.append(name)
+        statuses[name] = "ready"
+
+    monkeypatch.setattr(sentiment_service, "_model_status", statuses)
+    monkeypatch.setattr(sentiment_service, "_model_errors", {})
+    monkeypatch.setattr(sentiment_service, "_load_pipeline", load)
+    monkeypatch.setattr(sentiment_service, "_ensure_nltk_data", lambda: None)
+    monkeypatch.setattr(sentiment_service, "_stop_words", set())
+    return statuses, loaded
+
+
+def _configure_warmup(monkeypatch, value):
+    monkeypatch.setenv("MODEL_WARMUP", value)
+    monkeypatch.setattr(sentiment_service, "warmup_models", warmup_models_from_env())
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("true", list(MODEL_SPECS)), ("1", list(MODEL_SPECS)), ("false", []), ("0", []),
+])
+def test_warmup_models_follow_environment(monkeypatch, value, expected):
+    monkeypatch.setenv("MODEL_WARMUP", value)
+
+    assert warmup_models_from_env() == expected
+
+
+def test_warmup_on_waits_for_all_warmed_models(monkeypatch, model_state):
+    statuses, loaded = model_state
+    _configure_warmup(monkeypatch, "true")
+
+    status = sentiment_service.model_status()
+    assert status["ready"] is False
+    assert status["models_hot"] is False
+    assert status["warmup_models"] == list(MODEL_SPECS)
+
+    statuses["tr_sentiment"] = "ready"
+    statuses["en_sentiment"] = "error"
+    assert sentiment_service.model_status()["ready"] is False
+
+    sentiment_service.warm_up()
+    status = sentiment_service.model_status()
+    assert loaded == list(MODEL_SPECS)
+    assert status["ready"] is True
+    assert status["models_hot"] is True
+
+
+def test_warmup_off_is_ready_before_models_load(monkeypatch, model_state):
+    statuses, loaded = model_state
+    _configure_warmup(monkeypatch, "false")
+
+    sentiment_service.warm_up()
+    status = sentiment_service.model_status()
+    assert loaded == []
+    assert status["ready"] is True
+    assert status["models_hot"] is False
+    assert status["warmup_models"] == []
+
+    # İlk istekte yüklenen model hazırlığı değiştirmez; hepsi yüklenince modeller sıcak sayılır
+    statuses["en_sentiment"] = "ready"
+    assert sentiment_service.model_status()["models_hot"] is False
+    for name in MODEL_SPECS:
+        statuses[name] = "ready"
+    assert sentiment_service.model_status() == {
+        "ready": True,
+        "models_hot": True,
+        "warmup_models": [],
+        "backend": sentiment_service.backend_id,
+        "models": {name: "ready" for name in MODEL_SPECS},
+        "errors": {}
+    }
+
+
+def test_explicit_models_are_loaded_regardless_of_warmup(monkeypatch, model_state):
+    _, loaded = model_state
+    _configure_warmup(monkeypatch, "false")
+
+    sentiment_service.warm_up(list(MODEL_SPECS))
+
+    assert loaded == list(MODEL_SPECS)
@@ -0,0 +1,71 @@
+"""SentenceSegmenter hızlı yolunun ve toplu ayırmanın Punkt ile aynı cümleleri verdiğini doğrulayan testler"""
+import random
+
+import pytest
+
+from benchmarks.synthetic_comments import ENGLISH_SENTENCES, TURKISH_SENTENCES, generate_comments
+from services.sentence_segmenter import PUNKT_LANGUAGES, SentenceSegmenter, punkt_tokenizer
+
+punkt = pytest.importorskip("nltk.tokenize.punkt", reason="NLTK Punkt gerekli")
+
+EDGE_CASES = [
+    "", "   ", "\n", " başta boşluk", "sonda boşluk  ", "Tek cümle", "Tek cümle.", "Bitti...", "Bitti.\n",
+    "Harika!", "Harika!!", "Gerçekten mi?!", "Neden?", "...", ".", "!", "?", "a. b", "Dr. Smith geldi",
+    "e.g. this one", "3.5 puan verdim", "Süper video. Devamını bekliyorum", "ok ok. ok! ok? ok",
+]
+
+
+def _punkt_models():
+    try:
+        return {lang: punkt_tokenizer(model) for lang, model in PUNKT_LANGUAGES.items()}
+    except LookupError:
+        pytest.skip("Punkt modelleri bulunamadı")
+
+
+def _reference(tokenizer, text):
+    """Önceki yol: her metin Punkt'tan geçer, cümle yoksa metnin kendisi"""
+    return tokenizer.tokenize(text) or [text]
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    rng = random.Random(20)
+    texts = [comment['text'] for comment in generate_comments(1000, seed=20)]
+    texts += TURKISH_SENTENCES + ENGLISH_SENTENCES + EDGE_CASES
+    # Cümle sonu karakterleri ve boşluklardan yoğun rastgele dizgiler
+    texts += [''.join(rng.choice("ab .!?\n") for _ in range(rng.randint(0, 12))) for _ in range(20000)]
+    return texts
+
+
+def test_fast_path_matches_punkt(corpus):
+    models = _punkt_models()
+    untrained = punkt.PunktSentenceTokenizer()
+    segmenter = SentenceSegmenter()
+
+    fast = [text for text in corpus if segmenter._fast_path(text) is not None]
+    assert len(fast) > len(corpus) // 4
+    for text in fast:
+        sentences = segmenter._fast_path(text)
+        assert sentences == _reference(untrained, text), repr(text)
+        for tokenizer in models.values():
+            assert sentences == _reference(tokenizer, text), repr(text)
+
+
+def test_segment_matches_previous_sent_tokenize(corpus):
+    english = _punkt_models()['en']
+    segmenter = SentenceSegmenter()
+
+    for text in corpus:
+        assert segmenter.segment(text, 'en') == _reference(english, text), repr(text)
+
+
+def test_segment_batch_matches_per_text_segmentation(corpus):
+    models = _punkt_models()
+    rng = random.Random(21)
+    languages = [rng.choice(['tr', 'en']) for _ in corpus]
+    segmenter = SentenceSegmenter()
+
+    batch = segmenter.segment_batch(corpus, languages)
+
+    assert batch == [_reference(models[lang], text) for text, lang in zip(corpus, languages)]
+    assert segmenter.fast_path_count + segmenter.punkt_count == len(corpus)
@@ -0,0 +1,55 @@
+"""Duygu pipeline'ının batch'li ve tekil yollarda aynı ayarlarla çağrıldığını doğrular"""
+import pytest
+
+from services.inference_cache import InferenceCache
+from services.sentiment_service import SENTIMENT_PIPELINE_KWARGS, sentiment_service
+
+TEXT = "Harika bir video olmuş. Montaj çok profesyonel! Devamını bekliyorum."
+
+
+class FakeTokenizer:
+    def __call__(self, texts, **kwargs):
+        return {"input_ids": [[0] * (len(text.split()) + 2) for text in texts]}
+
+
+class RecordingSentimentPipeline:
+    """Duygu pipeline'ı yerine geçer; her çağrının ayarlarını kaydeder"""
+
+    tokenizer = FakeTokenizer()
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, inputs, **kwargs):
+        self.calls.append(kwargs)
+        inputs = [inputs] if isinstance(inputs, str) else inputs
+        return [{"label": "POSITIVE", "score": 0.9} for _ in inputs]
+
+
+class FakeThemeClassifier:
+    def __call__(self, sequences, candidate_labels, **kwargs):
+        sequences = [sequences] if isinstance(sequences, str) else list(sequences)
+        results = [{"labels": list(candidate_labels), "scores": [0.5] * len(candidate_labels)} for _ in sequences]
+        return results[0] if len(results) == 1 else results
+
+
+@pytest.fixture
+def sentiment_pipeline(monkeypatch):
+    pipeline = RecordingSentimentPipeline()
+    monkeypatch.setitem(sentiment_service._pipelines, "tr_sentiment", pipeline)
+    monkeypatch.setitem(sentiment_service._pipelines, "en_sentiment", pipeline)
+    monkeypatch.setitem(sentiment_service._pipelines, "theme_classifier", FakeThemeClassifier())
+    monkeypatch.setattr(sentiment_service, "cache", InferenceCache(max_entries=0))
+    return pipeline
+
+
+def test_single_and_batched_paths_pass_same_kwargs(sentiment_pipeline):
+    sentiment_service.analyze_sentiment(TEXT)
+    single_calls = list(sentiment_pipeline.calls)
+    sentiment_pipeline.calls.clear()
+    sentiment_service.analyze_sentiment_batch([TEXT])
+    batched_calls = list(sentiment_pipeline.calls)
+
+    assert single_calls and batched_calls
+    for kwargs in single_calls + batched_calls:
+        assert {name: kwargs.get(name) for name in SENTIMENT_PIPELINE_KWARGS} == SENTIMENT_PIPELINE_KWARGS
@@ -0,0 +1,152 @@
+"""Sütunlu (AnalysisFrame) istatistiklerin önceki sözlük döngüleriyle aynı olduğunu doğrulayan testler"""
+import pytest
+
+from benchmarks.bench_sentiment_stats import _analyzed_comments
+from services.analysis_frame import AnalysisFrame
+from services.sentiment_service import sentiment_service
+
+
+def reference_sentiment_stats(comments):
+    """Önceki get_sentiment_stats döngüsü"""
+    total_comments = len(comments)
+    sentiment_counts = {"positive": 0, "negative": 0, "neutral": 0}
+    theme_counts = {}
+    language_counts = {"tr": 0, "en": 0}
+    confidence_counts = {"high": 0, "medium": 0, "low": 0}
+    polarity_counts = {"strongly_positive": 0, "moderately_positive": 0, "neutral": 0,
+                       "moderately_negative": 0, "strongly_negative": 0}
+    total_polarity = total_positive_score = total_negative_score = total_neutral_score = 0
+
+    for comment in comments:
+        sentiment = comment.get('sentiment', {})
+        polarity = sentiment.get('polarity', 0)
+        confidence = sentiment.get('confidence', 0)
+        detailed_scores = sentiment.get('detailed_scores', {})
+        sentiment_counts[sentiment.get('category', 'neutral')] += 1
+        total_positive_score += detailed_scores.get('positive_score', 0)
+        total_negative_score += detailed_scores.get('negative_score', 0)
+        total_neutral_score += detailed_scores.get('neutral_score', 0)
+
+        if confidence > 0.8:
+            confidence_counts["high"] += 1
+        elif confidence > 0.5:
+            confidence_counts["medium"] += 1
+        else:
+            confidence_counts["low"] += 1
+
+        if polarity > 0.5:
+            polarity_counts["strongly_positive"] += 1
+        elif polarity > 0.1:
+            polarity_counts["moderately_positive"] += 1
+        elif polarity > -0.1:
+            polarity_counts["neutral"] += 1
+        elif polarity > -0.5:
+            polarity_counts["moderately_negative"] += 1
+        else:
+            polarity_counts["strongly_negative"] += 1
+
+        for theme, score in sentiment.get('theme', {}).items():
+            if score > 0.05:
+                theme_counts[theme] = theme_counts.get(theme, 0) + 1
+
+        language = sentiment.get('language', 'en')
+        language_counts[language] = language_counts.get(language, 0) + 1
+        total_polarity += polarity
+
+    return {
+        "total": total_comments,
+        "categories": sentiment_counts,
+        "average_polarity": round(total_polarity / total_comments, 4),
+        "language_distribution": language_counts,
+        "themes": dict(sorted(theme_counts.items(), key=lambda x: x[1], reverse=True)),
+        "confidence_distribution": confidence_counts,
+        "polarity_distribution": polarity_counts,
+        "detailed_averages": {
+            "positive_score": round(total_positive_score / total_comments, 4),
+            "negative_score": round(total_negative_score / total_comments, 4),
+            "neutral_score": round(total_neutral_score / total_comments, 4)
+        },
+        "sentiment_ratios": {
+            "positive_ratio": round(sentiment_counts["positive"] / total_comments, 4),
+            "negative_ratio": round(sentiment_counts["negative"] / total_comments, 4),
+            "neutral_ratio": round(sentiment_counts["neutral"] / total_comments, 4)
+        }
+    }
+
+
+def _comment_themes(comment):
+    themes = comment.get('theme', {})
+    if not themes and 'sentiment' in comment:
+        themes = comment['sentiment'].get('theme', {})
+    return themes
+
+
+def reference_theme_analysis(comments):
+    """Önceki get_theme_analysis döngüsü (eşik ve düşük skor fallback'i dahil)"""
+    theme_counts = {}
+    theme_scores = {}
+    total_comments = len(comments)
+    for comment in comments:
+        for theme, score in _comment_themes(comment).items():
+            if score > 0.05:
+                theme_counts[theme] = theme_counts.get(theme, 0) + 1
+                theme_scores.setdefault(theme, []).append(score)
+
+    theme_analysis = [{
+        'theme': theme,
+        'count': count,
+        'percentage': round(count / total_comments * 100, 2),
+        'avg_score': round(sum(theme_scores[theme]) / len(theme_scores[theme]), 3)
+    } for theme, count in theme_counts.items()]
+    theme_analysis.sort(key=lambda x: x['count'], reverse=True)
+
+    if not theme_analysis and total_comments > 0:
+        all_themes_scores = {}
+        for comment in comments:
+            for theme, score in _comment_themes(comment).items():
+                all_themes_scores.setdefault(theme, []).append(score)
+        for theme, scores in all_themes_scores.items():
+            avg_score = sum(scores) / len(scores)
+            if avg_score > 0.01:
+                theme_analysis.append({
+                    'theme': theme,
+                    'count': len(scores),
+                    'percentage': round(len(scores) / total_comments * 100, 2),
+                    'avg_score': round(avg_score, 3)
+                })
+        theme_analysis.sort(key=lambda x: x['avg_score'], reverse=True)
+    return theme_analysis[:15]
+
+
+def low_score_comments(size):
+    """Hiçbir tema skoru eşiği aşmayan yorumlar (tema analizi fallback'i); bir kısmının kendi teması yok"""
+    comments = _analyzed_comments(size)
+    for index, comment in enumerate(comments):
+        theme = {name: round(score / 10, 4) for name, score in comment['theme'].items()}
+        comment['sentiment']['theme'] = theme
+        comment['theme'] = {} if index % 3 == 0 else dict(theme)
+    return comments
+
+
+@pytest.mark.parametrize("size", [1, 7, 2000])
+def test_sentiment_stats_match_previous_loop(size):
+    comments = _analyzed_comments(size)
+
+    assert sentiment_service.get_sentiment_stats(comments) == reference_sentiment_stats(comments)
+
+
+@pytest.mark.parametrize("comments", [_analyzed_comments(2000), low_score_comments(500)],
+                         ids=["thresholded", "fallback"])
+def test_theme_analysis_matches_previous_loop(comments):
+    expected = reference_theme_analysis(comments)
+
+    assert expected
+    assert sentiment_service.get_theme_analysis(comments) == expected
+
+
+def test_shared_frame_gives_the_same_results():
+    comments = low_score_comments(300)
+    frame = AnalysisFrame(comments)
+
+    assert sentiment_service.get_sentiment_stats(comments, frame=frame) == reference_sentiment_stats(comments)
+    assert sentiment_service.get_theme_analysis(comments, frame=frame) == reference_theme_analysis(comments)
@@ -0,0 +1,105 @@
+"""Birleştirilebilir istatistik birikiminin (SentimentAccumulator) tek geçişli sonuçlarla aynı olduğunu doğrulayan testler"""
+import pytest
+
+from benchmarks.bench_comment_memory import _dict_form
+from benchmarks.bench_sentiment_stats import _analyzed_comments
+from benchmarks.synthetic_comments import generate_comments
+from services.analysis_frame import AnalysisFrame
+from services.comment_records import CommentRecords
+from services.sentiment_service import sentiment_service
+
+AVERAGES = ("average_polarity", "detailed_averages")
+
+
+def split_averages(stats):
+    """İstatistikleri ortalamalar ve geri kalanı olarak ayırır (birleştirmede ortalamalar son basamakta değişebilir)"""
+    rest = {key: value for key, value in stats.items() if key not in AVERAGES}
+    averages = [stats["average_polarity"], *stats["detailed_averages"].values()]
+    return rest, averages
+
+
+def append_records(records, analyzed):
+    for comment in analyzed:
+        records.append(comment, comment['sentiment'], comment['theme'])
+    return records
+
+
+def by_text(cloud):
+    """Kelime bulutu öğeleri kelimeye göre (birleştirmede yalnızca eşit ağırlıkların sırası değişebilir)"""
+    return sorted(cloud, key=lambda item: item['text'])
+
+
+def assert_same_themes(merged, single):
+    assert [(item['theme'], item['count'], item['percentage']) for item in merged] == \
+           [(item['theme'], item['count'], item['percentage']) for item in single]
+    assert [item['avg_score'] for item in merged] == pytest.approx([item['avg_score'] for item in single], abs=1e-3)
+
+
+def test_single_accumulator_matches_get_stats_and_themes():
+    comments = _analyzed_comments(1500)
+
+    accumulator = sentiment_service.create_accumulator().add_frame(AnalysisFrame(comments))
+
+    assert accumulator.sentiment_stats() == sentiment_service.get_sentiment_stats(comments)
+    assert accumulator.theme_analysis() == sentiment_service.get_theme_analysis(comments)
+
+
+def test_empty_accumulator_matches_empty_stats():
+    assert sentiment_service.create_accumulator().sentiment_stats() == sentiment_service.get_sentiment_stats([])
+
+
+@pytest.mark.parametrize("split", [1, 700, 1499])
+def test_merged_chunks_match_one_accumulator(split):
+    comments = _analyzed_comments(1500)
+    single = sentiment_service.create_accumulator().add_frame(AnalysisFrame(comments))
+
+    first = sentiment_service.create_accumulator().add_frame(AnalysisFrame(comments[:split]))
+    second = sentiment_service.create_accumulator().add_frame(AnalysisFrame(comments[split:]))
+    merged = first.merge(second)
+
+    merged_stats, merged_averages = split_averages(merged.sentiment_stats())
+    single_stats, single_averages = split_averages(single.sentiment_stats())
+    assert merged_stats == single_stats
+    assert merged_averages == pytest.approx(single_averages, abs=1e-4)
+    assert_same_themes(merged.theme_analysis(), single.theme_analysis())
+
+
+def test_live_chunks_match_stats_of_all_comments():
+    """Canlı analizdeki gibi her yeni parça start ile birikime eklenir; sonuç tüm yorumların istatistiklerine eşittir"""
+    analyzed = _dict_form(generate_comments(600, seed=17), 17)
+    records = CommentRecords()
+    live = sentiment_service.create_accumulator()
+    for start in range(0, len(analyzed), 50):
+        append_records(records, analyzed[start:start + 50])
+        sentiment_service.accumulate(records, live, start=start)
+
+    live_stats, live_averages = split_averages(live.sentiment_stats())
+    expected_stats, expected_averages = split_averages(sentiment_service.get_sentiment_stats(records))
+    assert live_stats == expected_stats
+    assert live_averages == pytest.approx(expected_averages, abs=1e-4)
+    assert_same_themes(live.theme_analysis(), sentiment_service.get_theme_analysis(records))
+
+
+def test_summary_rollup_matches_stats_of_its_comments():
+    analyzed = _dict_form(generate_comments(300, seed=17), 17)
+    records = append_records(CommentRecords(), analyzed)
+    rollup = sentiment_service.create_accumulator()
+
+    sentiment_service.summarize_analysis(records, rollup=rollup)
+
+    assert rollup.sentiment_stats() == sentiment_service.get_sentiment_stats(records)
+    assert rollup.theme_analysis() == sentiment_service.get_theme_analysis(records)
+    assert by_text(rollup.word_cloud()) == by_text(sentiment_service.accumulate(records).word_cloud())
+
+
+def test_merged_word_sketches_match_one_sketch():
+    analyzed = _dict_form(generate_comments(400, seed=18), 18)
+
+    single = sentiment_service.accumulate(append_records(CommentRecords(), analyzed))
+    first = sentiment_service.accumulate(append_records(CommentRecords(), analyzed[:150]))
+    second = sentiment_service.accumulate(append_records(CommentRecords(), analyzed[150:]))
+
+    # Sözlük kapasiteden küçük olduğundan sayımlar tamdır
+    single_cloud = single.word_cloud()
+    assert single_cloud
+    assert by_text(first.merge(second).word_cloud()) == by_text(single_cloud)
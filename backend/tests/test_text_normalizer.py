@@ -0,0 +1,68 @@
+"""TextNormalizer'ın önceki clean_text ile aynı sonucu verdiğini doğrulayan testler"""
+import re
+
+import pytest
+
+from benchmarks.synthetic_comments import generate_comments
+from services.text_normalizer import TextNormalizer
+
+STOP_WORDS = {'ve', 'bir', 'bu', 'çok', 'the', 'and', 'a', 'is', 'of', 'to'}
+
+EDGE_CASES = [
+    "",
+    "   ",
+    "Linke bakın https://example.com/a?b=1&c=(2) harika!!!",
+    "http://x.y/z,http://a.b mail: ali@example.com, veli@ornek.com.tr",
+    "Sipariş no 1234567 ve 12345, saat 12:30 — 99999x 123456",
+    "Emoji 😀 ve ☺ ile 100000😀 yazı",
+    "Tam genişlik １２３４５ ve Arapça ٠١٢٣٤٥ rakamlar",
+    "Sıfır​genişlik‌ karakter‍ ve\ttab\nsatır",
+    "İSTANBUL'da ÇOK güzel; a_b __init__ x-y",
+    "@@@ ### $$$ %%% ^^^ &&& *** ((( )))",
+]
+
+
+def reference_clean_text(text: str, stop_words: set) -> str:
+    """Önceki clean_text uygulaması (beş ayrı re.sub geçişi)"""
+    if not text:
+        return ""
+    text = text.lower()
+    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+    text = re.sub(r'\S+@\S+', '', text)
+    text = re.sub(r'[^\w\s\u263a-\U0001f645]', ' ', text)
+    text = re.sub(r'\b\d{5,}\b', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    words = [word for word in text.split() if word not in stop_words]
+    return ' '.join(words).strip()
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return [comment['text'] for comment in generate_comments(500, seed=7)] + EDGE_CASES
+
+
+def test_clean_matches_previous_clean_text(corpus):
+    normalizer = TextNormalizer(STOP_WORDS)
+
+    for text in corpus:
+        assert normalizer.clean(text) == reference_clean_text(text, STOP_WORDS), text
+
+
+def test_per_comment_tokens_match_cleaning_joined_corpus(corpus):
+    """Kelime bulutu birleştirilmiş metni temizlemek yerine yorum bazında tokenları birleştirir"""
+    normalizer = TextNormalizer(STOP_WORDS)
+
+    concatenated = [word for text in corpus for word in normalizer.tokens(text)]
+
+    assert concatenated == reference_clean_text(' '.join(corpus), STOP_WORDS).split()
+
+
+def test_tokens_are_cached_per_text():
+    normalizer = TextNormalizer(STOP_WORDS, cache_size=8)
+
+    first = normalizer.tokens("Harika bir video, çok faydalı")
+    second = normalizer.tokens("Harika bir video, çok faydalı")
+
+    assert first == ('harika', 'video', 'faydalı')
+    assert second is first
+    assert normalizer.cache_info().hits == 1
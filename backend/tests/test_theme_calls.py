@@ -0,0 +1,67 @@
+"""Tema sınıflandırıcısının yorum başına çağrı sayısı için regresyon testi"""
+import pytest
+
+from services.inference_cache import InferenceCache
+from services.sentiment_service import sentiment_service
+
+COMMENTS = [
+    {"id": "c1", "text": "Ses kalitesi biraz kötüydü ama içerik mükemmel", "author": "a"},
+    {"id": "c2", "text": "Great video, the editing and the visual style are awesome", "author": "b"},
+    {"id": "c3", "text": "Harika bir video olmuş. Montaj çok profesyonel! Devamını bekliyorum.", "author": "c"},
+]
+
+
+class FakeTokenizer:
+    def __call__(self, texts, **kwargs):
+        return {"input_ids": [[0] * (len(text.split()) + 2) for text in texts]}
+
+
+class FakeSentimentPipeline:
+    tokenizer = FakeTokenizer()
+
+    def __call__(self, inputs, **kwargs):
+        inputs = [inputs] if isinstance(inputs, str) else inputs
+        return [{"label": "POSITIVE", "score": 0.9} for _ in inputs]
+
+
+class CountingThemeClassifier:
+    """Zero-shot pipeline'ı yerine geçer; sınıflandırılan her metni kaydeder"""
+
+    def __init__(self):
+        self.calls = 0
+        self.sequences = []
+
+    def __call__(self, sequences, candidate_labels, **kwargs):
+        self.calls += 1
+        sequences = [sequences] if isinstance(sequences, str) else list(sequences)
+        self.sequences.extend(sequences)
+        results = [{"labels": list(candidate_labels), "scores": [0.5] * len(candidate_labels)} for _ in sequences]
+        return results[0] if len(results) == 1 else results
+
+
+@pytest.fixture
+def theme_classifier(monkeypatch):
+    classifier = CountingThemeClassifier()
+    monkeypatch.setitem(sentiment_service._pipelines, "tr_sentiment", FakeSentimentPipeline())
+    monkeypatch.setitem(sentiment_service._pipelines, "en_sentiment", FakeSentimentPipeline())
+    monkeypatch.setitem(sentiment_service._pipelines, "theme_classifier", classifier)
+    # Önbellekten dönen sonuçlar çağrı sayısını gizlemesin
+    monkeypatch.setattr(sentiment_service, "cache", InferenceCache(max_entries=0))
+    return classifier
+
+
+def test_theme_classifier_runs_once_per_comment(theme_classifier):
+    analyzed = sentiment_service.analyze_comments(COMMENTS)
+
+    assert len(analyzed) == len(COMMENTS)
+    assert len(theme_classifier.sequences) == len(COMMENTS)
+    assert len(set(theme_classifier.sequences)) == len(COMMENTS)
+    for comment in analyzed:
+        assert comment["theme"] == comment["sentiment"]["theme"]
+
+
+def test_single_text_analysis_classifies_theme_once(theme_classifier):
+    result = sentiment_service.analyze_sentiment(COMMENTS[0]["text"])
+
+    assert len(theme_classifier.sequences) == 1
+    assert "theme" in result
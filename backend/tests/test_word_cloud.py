@@ -0,0 +1,123 @@
+"""Kelime bulutu belge frekanslarının önceki alt dizi taramasıyla aynı olduğunu doğrulayan testler"""
+import random
+import re
+
+import pytest
+
+from benchmarks.synthetic_comments import generate_comments
+from services.sentiment_service import sentiment_service
+from services.word_cloud import document_frequencies
+
+CATEGORIES = ['positive', 'negative', 'neutral']
+
+
+def reference_clean_text(text: str, stop_words: set) -> str:
+    """Önceki clean_text uygulaması"""
+    if not text:
+        return ""
+    text = text.lower()
+    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+    text = re.sub(r'\S+@\S+', '', text)
+    text = re.sub(r'[^\w\s\u263a-\U0001f645]', ' ', text)
+    text = re.sub(r'\b\d{5,}\b', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    return ' '.join(word for word in text.split() if word not in stop_words).strip()
+
+
+def reference_word_cloud(comments, max_words=100):
+    """Önceki get_word_cloud uygulaması (kelime x yorum alt dizi taraması)"""
+    stop_words = sentiment_service.stop_words
+    extended_stop_words = sentiment_service.word_cloud_stop_words
+    sentiment_texts = {'positive': [], 'negative': [], 'neutral': []}
+    for comment in comments:
+        category = comment.get('sentiment', {}).get('category', 'neutral')
+        if category in sentiment_texts:
+            sentiment_texts[category].append(comment.get('text', ''))
+
+    words = reference_clean_text(' '.join(comment.get('text', '') for comment in comments), stop_words).split()
+    word_weights = {}
+    for word in words:
+        if (len(word) < 3 or len(word) > 25 or
+                word.lower() in extended_stop_words or
+                word.isdigit() or
+                not word.replace('ş', 's').replace('ğ', 'g').replace('ü', 'u').replace('ç', 'c').replace('ö', 'o').replace('ı', 'i').isalpha()):
+            continue
+        base_weight = 1
+        for sentiment, texts in sentiment_texts.items():
+            sentiment_count = sum(1 for text in texts if word.lower() in text.lower())
+            base_weight += sentiment_count * (1.5 if sentiment in ['positive', 'negative'] else 0.8)
+        if word[0].isupper() and len(word) > 4:
+            base_weight *= 1.3
+        if 4 <= len(word) <= 8:
+            base_weight *= 1.2
+        elif 9 <= len(word) <= 12:
+            base_weight *= 1.1
+        word_weights[word.lower()] = word_weights.get(word.lower(), 0) + base_weight
+
+    min_frequency = max(1, len(comments) // 100)
+    filtered_words = {word: weight for word, weight in word_weights.items() if weight >= min_frequency}
+
+    bigram_weights = {}
+    for comment in comments:
+        tokens = reference_clean_text(comment.get('text', ''), stop_words).split()
+        for i in range(len(tokens) - 1):
+            word1, word2 = tokens[i].lower(), tokens[i + 1].lower()
+            if (len(word1) >= 3 and len(word2) >= 3 and
+                    word1 not in extended_stop_words and word2 not in extended_stop_words and
+                    not word1.isdigit() and not word2.isdigit()):
+                bigram = f"{word1} {word2}"
+                bigram_weights[bigram] = bigram_weights.get(bigram, 0) + 1.5
+    filtered_words.update({bigram: weight for bigram, weight in bigram_weights.items() if weight >= 2})
+
+    result = []
+    for word, weight in sorted(filtered_words.items(), key=lambda x: x[1], reverse=True)[:max_words]:
+        sentiment_counts = {}
+        for sentiment, texts in sentiment_texts.items():
+            count = sum(1 for text in texts if word.lower() in text.lower())
+            if count > 0:
+                sentiment_counts[sentiment] = count
+        dominant_sentiment = 'neutral'
+        if sentiment_counts:
+            dominant_sentiment = max(sentiment_counts.items(), key=lambda x: x[1])[0]
+        result.append({
+            "text": word.title() if word.islower() else word,
+            "value": int(weight),
+            "sentiment": dominant_sentiment,
+            "sentiment_distribution": sentiment_counts
+        })
+    return result
+
+
+def analyzed_comments(count: int, seed: int):
+    """Sentetik yorumlara tekrarlanabilir duygu kategorileri ekler"""
+    rng = random.Random(seed)
+    comments = generate_comments(count, seed=seed)
+    for comment in comments:
+        comment['sentiment'] = {'category': rng.choice(CATEGORIES)}
+    return comments
+
+
+def test_document_frequencies_match_substring_scan():
+    comments = analyzed_comments(300, seed=3)
+    texts_by_category = {category: [comment['text'].lower() for comment in comments
+                                    if comment['sentiment']['category'] == category]
+                         for category in CATEGORIES}
+    # Kelimeler, kelime içinde geçen parçalar ("ide", "olmu") ve bigram'lar
+    terms = {word.lower() for comment in comments for word in re.findall(r'\w+', comment['text'])}
+    terms |= {'ide', 'olmu', 'ara', 'the', 'great video', 'çok güzel', 'xyz'}
+
+    frequencies = document_frequencies(texts_by_category, terms)
+
+    for category, texts in texts_by_category.items():
+        for term in terms:
+            expected = sum(1 for text in texts if term in text)
+            assert frequencies[category][term] == expected, (category, term)
+
+
+@pytest.mark.parametrize("count", [300, 1000])
+def test_exact_word_cloud_matches_previous_output(count):
+    comments = analyzed_comments(count, seed=count)
+    expected = reference_word_cloud(comments)
+
+    assert expected
+    assert sentiment_service.get_word_cloud(comments, mode="exact") == expected
@@ -0,0 +1,80 @@
+"""YouTube API istemcisinin süresi dolan token'ı olay döngüsü dışında bir kez yenileyip bildirdiğini doğrulayan testler"""
+import asyncio
+import threading
+
+import httpx
+
+from services.youtube_client import YouTubeApiClient
+from services.youtube_service import YouTubeService
+
+
+class ExpiredCredentials:
+    """Süresi dolmuş google-auth kimlik bilgisi yerine geçer; yenilemeleri ve çalıştıkları iş parçacığını kaydeder"""
+
+    def __init__(self):
+        self.token = "expired-token"
+        self.valid = False
+        self.refresh_threads = []
+
+    def refresh(self, request):
+        self.refresh_threads.append(threading.get_ident())
+        self.token = f"fresh-token-{len(self.refresh_threads)}"
+        self.valid = True
+
+
+def _client(credentials, authorizations, **kwargs):
+    def respond(request):
+        authorizations.append(request.headers.get("Authorization"))
+        return httpx.Response(200, json={"items": []})
+
+    return YouTubeApiClient(credentials, base_url="https://youtube.test", rate_limit=0,
+                            transport=httpx.MockTransport(respond), **kwargs)
+
+
+def test_expired_token_is_refreshed_once_off_the_loop_and_saved():
+    credentials = ExpiredCredentials()
+    saved = []
+    authorizations = []
+    client = _client(credentials, authorizations,
+                     on_token_refresh=lambda refreshed: saved.append((refreshed.token, threading.get_ident())))
+
+    async def run():
+        loop_thread = threading.get_ident()
+        await asyncio.gather(*(client.get("channels", mine=True) for _ in range(5)))
+        await client.aclose()
+        return loop_thread
+
+    loop_thread = asyncio.run(run())
+
+    assert len(credentials.refresh_threads) == 1
+    assert credentials.refresh_threads[0] != loop_thread
+    assert saved == [("fresh-token-1", credentials.refresh_threads[0])]
+    assert authorizations == ["Bearer fresh-token-1"] * 5
+
+
+def test_failed_save_does_not_fail_the_request():
+    credentials = ExpiredCredentials()
+    authorizations = []
+
+    def fail(refreshed):
+        raise OSError("disk dolu")
+
+    client = _client(credentials, authorizations, on_token_refresh=fail)
+
+    async def run():
+        try:
+            return await client.get("channels", mine=True)
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == {"items": []}
+    assert authorizations == ["Bearer fresh-token-1"]
+
+
+def test_service_passes_refresh_callback_to_its_client():
+    def callback(refreshed):
+        pass
+
+    service = YouTubeService(ExpiredCredentials(), on_token_refresh=callback)
+
+    assert service.api.on_token_refresh is callback